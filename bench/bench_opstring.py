@@ -0,0 +1,110 @@
+################################################################################
+#
+#   bench_opstring.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This script benchmarks the operator string parser of the Marking
+#       Menus Blender Add-on. It does not need Blender to run:
+#
+#           python bench/bench_opstring.py
+#
+#       The parsed values are checked by tests/test_opstring.py.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  inspect
+import  sys
+
+from    benchutils import bench, load_source_module
+
+opstring = load_source_module("opstring")
+
+
+###############################################################################
+#
+#   Benchmark corpus
+#
+###############################################################################
+CORPUS = [
+    "object.delete",
+    "object.select_all(action='TOGGLE')",
+    "object.select_all(action=INVERT)",
+    "object.subdivision_set(level=2, relative=False)",
+    "object.rename(name='A,B')",
+    "transform.translate(value=(0, 0, -1.5))",
+    "mesh.select_mode(type={'VERT', 'EDGE'})",
+    "bpy.ops.wm.call_menu(name='VIEW3D_MT_object_apply')",
+    "object.origin_set(type='ORIGIN_GEOMETRY')",
+    "object.convert(target='MESH')",
+    "object.modifier_add(type='SUBSURF')",
+    "wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')",
+    "mesh.separate(type='SELECTED')",
+    "transform.resize(value=(1.0, 1.0, 0.0), orient_type='GLOBAL')",
+    "mesh.primitive_cube_add(size=2, location=(0, 0, 0), rotation=(0, 0, 0))",
+    "object.shade_smooth_by_angle(angle=0.523599, keep_sharp_edges=True)",
+]
+
+
+def legacy_parse_operator_string(op_string):
+    '''
+    DESCRIPTION
+        The string splitting parser this module replaced, kept here as the
+        benchmark reference
+
+    ARGUMENTS
+        op_string   (in)    The variable to parse
+
+    RETURN
+        op_name, op_args
+    '''
+    op_parts = op_string.split("(", 1)
+    op_name = op_parts[0]
+    op_args = {}
+
+    if len(op_parts) > 1:
+        args_string = op_parts[1].rstrip(")")
+        if args_string:
+            for arg in args_string.split(","):
+                key, value = arg.split("=")
+                op_args[key.strip()] = value.strip("'")
+
+    return op_name, op_args
+
+
+###############################################################################
+#
+#   Benchmarks
+#
+###############################################################################
+def main():
+    #   The legacy parser can not handle every corpus string
+    safe = [s for s in CORPUS if "," not in s and "{" not in s]
+
+    uncached = inspect.unwrap(opstring.parse_operator_string)
+    bench("legacy split", legacy_parse_operator_string, safe, 2000)
+    bench("ast parse (uncached)", uncached, CORPUS, 200)
+    opstring.parse_operator_string.cache_clear()
+    bench("ast parse (memoized)", opstring.parse_operator_string, CORPUS, 2000)
+    print(f"{'cache':>28}: {opstring.parse_operator_string.cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+################################################################################
+#
+#   bench_plans.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This script benchmarks the slot compilation of the Marking Menus
+#       Blender Add-on. It runs the draw plan compiler and the operator
+#       validation against the bpy stub, so it does not need Blender to run:
+#
+#           python bench/bench_plans.py
+#
+#       The compiled entries are checked by tests/test_plans.py.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  sys
+import  time
+
+import  bpy_stub
+
+from    benchutils import bench, load_source_module
+
+start = time.perf_counter()
+bpy_stub.install()
+
+opstring = load_source_module("opstring")
+plans    = load_source_module("plans")
+schema   = load_source_module("schema")
+utils    = load_source_module("utils")
+
+#   The preferences and warm-up only need to import against the stub
+load_source_module("prefs")
+load_source_module("warmup")
+import_time = time.perf_counter() - start
+
+bpy_stub.define_operators(identifier for catalog in schema.CATALOGS.values()
+                          for identifier in catalog if "." in identifier)
+
+
+###############################################################################
+#
+#   Benchmarks
+#
+###############################################################################
+def compile_ring(ring):
+    '''
+    DESCRIPTION
+        This function compiles the default slots of a ring
+
+    ARGUMENTS
+        ring        (in)    The name of the ring in schema.RINGS
+
+    RETURN
+        A list of PlanEntry / None items in slot order
+    '''
+    catalog  = schema.CATALOGS[schema.RINGS[ring].catalog]
+    defaults = schema.DEFAULTS.get(ring, ())
+    return [plans.compile_slot(item, "", catalog, utils.validate_operator_string, utils.validate_macro_string)
+            for item in defaults]
+
+
+def clear_caches():
+    utils.clear_validated_operators()
+    opstring.parse_operator_string.cache_clear()
+    opstring.split_macro_string.cache_clear()
+
+
+def main():
+    print(f"{'import with bpy stub':>28}: {import_time * 1000:10.3f} ms")
+    rings = list(schema.DEFAULTS)
+
+    def compile_cold(ring):
+        clear_caches()
+        compile_ring(ring)
+
+    bench("compile ring (cold)", compile_cold, rings, 50)
+    bench("compile ring (validated)", compile_ring, rings, 500)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+################################################################################
+#
+#   bench_search.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This script benchmarks the operator search index of the Marking
+#       Menus Blender Add-on against the linear substring filter Blender
+#       applies to the flat search list. It does not need Blender to run:
+#
+#           python bench/bench_search.py
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  random
+import  sys
+import  time
+
+from    benchutils import bench, load_source_module
+
+search = load_source_module("search")
+
+
+###############################################################################
+#
+#   Synthetic operator catalog
+#
+###############################################################################
+MODULES = ["object", "mesh", "curve", "armature", "pose", "sculpt", "paint", "uv",
+           "node", "anim", "graph", "action", "gpencil", "view3d", "wm", "screen",
+           "transform", "image", "clip", "sequencer", "text", "file", "outliner"]
+VERBS   = ["select", "add", "delete", "duplicate", "move", "set", "clear", "toggle",
+           "apply", "convert", "join", "separate", "bake", "copy", "paste", "hide",
+           "reveal", "snap", "align", "merge", "split", "extrude", "subdivide", "mirror"]
+NOUNS   = ["all", "random", "origin", "modifier", "constraint", "keyframe", "vertex",
+           "edge", "face", "group", "material", "shading", "smooth", "flat", "pivot",
+           "cursor", "layer", "weight", "mask", "bone", "handle", "seam", "sharp"]
+
+QUERIES = ["sel", "select all", "shade smooth", "origin geom", "add modifier",
+           "keyfr", "join", "subdiv", "mirror bone", "smoth", "x"]
+
+
+def synthetic_items(count, seed = 1):
+    '''
+    DESCRIPTION
+        This function generates a catalog shaped like the one built from
+        bpy.ops
+
+    ARGUMENTS
+        count       (in)    The number of operators
+        seed        (in)    The random seed
+
+    RETURN
+        A sorted list of (identifier, label, description) tuples
+    '''
+    rng   = random.Random(seed)
+    items = {}
+    while len(items) < count:
+        module = rng.choice(MODULES)
+        words  = [rng.choice(VERBS), rng.choice(NOUNS)]
+        if rng.random() < 0.4:
+            words.append(rng.choice(NOUNS))
+        op_name    = "_".join(words)
+        identifier = f"{module}.{op_name}"
+        label      = op_name.replace("_", " ").title()
+        items[identifier] = (identifier, f"{label} ({module})", f"{label} of the {module} data")
+    return sorted(items.values(), key = lambda x: x[1].lower())
+
+
+def linear_search(items, query, limit = 20):
+    '''
+    DESCRIPTION
+        This function filters the flat list the way the enum search popup
+        does, keeping every item whose label contains every query word
+
+    ARGUMENTS
+        items       (in)    The sorted catalog
+        query       (in)    The query text
+        limit       (in)    The number of results shown
+
+    RETURN
+        A list of items
+    '''
+    words = query.lower().split()
+    return [item for item in items if all(word in item[1].lower() for word in words)][:limit]
+
+
+###############################################################################
+#
+#   Benchmarks
+#
+###############################################################################
+def main():
+    items = synthetic_items(6000)
+    usage = {items[10][0]: 3, items[200][0]: 1}
+
+    start = time.perf_counter()
+    index = search.SearchIndex(items)
+    print(f"{'index build':>28}: {(time.perf_counter() - start) * 1e3:10.3f} ms for {len(items)} items")
+
+    for query in QUERIES:
+        top = index.search(query, limit = 3, usage = usage)
+        print(f"{query!r:>28}: {[item[0] for item in top]}")
+
+    bench("linear substring filter", lambda q: linear_search(items, q), QUERIES, 20)
+    bench("search index (top 20)", lambda q: index.search(q, 20, usage), QUERIES, 200)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
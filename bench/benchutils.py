@@ -0,0 +1,154 @@
+################################################################################
+#
+#   benchutils.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains helpers shared by the benchmark scripts of the
+#       Marking Menus Blender Add-on
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  importlib
+import  importlib.util
+import  os
+import  sys
+import  timeit
+
+###############################################################################
+#
+#   Benchmark Helper Functions
+#
+###############################################################################
+SOURCE_LOCATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source")
+
+#   The package name the source modules are loaded under, so the relative
+#   imports between the bpy free modules resolve
+SOURCE_PACKAGE = "markingmenu_source"
+
+def load_source_module(name):
+    '''
+    DESCRIPTION
+        This function loads a bpy free module from the source folder without
+        running the add-on's __init__.py, which needs bpy
+
+    ARGUMENTS
+        name        (in)    The module name (without .py)
+
+    RETURN
+        The loaded module
+    '''
+    if SOURCE_PACKAGE not in sys.modules:
+        spec    = importlib.util.spec_from_loader(SOURCE_PACKAGE, loader = None, is_package = True)
+        package = importlib.util.module_from_spec(spec)
+        package.__path__ = [SOURCE_LOCATION]
+        sys.modules[SOURCE_PACKAGE] = package
+
+    return importlib.import_module(f"{SOURCE_PACKAGE}.{name}")
+
+def bench(label, func, corpus, number):
+    '''
+    DESCRIPTION
+        This function times passes over a corpus and prints the time per call
+
+    ARGUMENTS
+        label       (in)    The label to print
+        func        (in)    The function to call for every corpus entry
+        corpus      (in)    The arguments to pass to func
+        number      (in)    The number of passes over the corpus
+
+    RETURN
+        The time per call in micro seconds
+    '''
+    def run():
+        for entry in corpus:
+            func(entry)
+
+    elapsed  = min(timeit.repeat(run, number = number, repeat = 5))
+    per_call = elapsed / (number * len(corpus)) * 1e6
+    print(f"{label:>28}: {per_call:10.3f} us/call")
+    return per_call
+
+
+###############################################################################
+#
+#   Recording Layout
+#
+###############################################################################
+class RecordingItem:
+    '''
+    DESCRIPTION
+        This class stands in for the operator properties returned by
+        UILayout.operator, and records the arguments set on it
+    '''
+    def __init__(self, op_name, text):
+        self.__dict__["op_name"] = op_name
+        self.__dict__["text"]    = text
+        self.__dict__["args"]    = {}
+
+    def __setattr__(self, name, value):
+        self.args[name] = value
+
+
+class RecordingLayout:
+    '''
+    DESCRIPTION
+        This class stands in for bpy.types.UILayout while a pie menu is
+        drawn without a window. Every item is recorded in draw order as an
+        (kind, op_name, text, enabled) tuple.
+    '''
+    def __init__(self, items = None):
+        self.items   = [] if items is None else items
+        self.enabled = True
+
+    def menu_pie(self):
+        return self
+
+    def column(self, **kwargs):
+        return RecordingLayout(self.items)
+
+    def separator(self, **kwargs):
+        self.items.append(("separator", None, None, self.enabled))
+
+    def operator(self, op_name, text = "", **kwargs):
+        item = RecordingItem(op_name, text)
+        self.items.append(("operator", item, text, self.enabled))
+        return item
+
+
+def draw_pie(menu_class, context):
+    '''
+    DESCRIPTION
+        This function draws a pie menu class into a RecordingLayout
+
+    ARGUMENTS
+        menu_class  (in)    The pie menu class
+        context     (in)    A Blender context
+
+    RETURN
+        The RecordingLayout
+    '''
+    layout = RecordingLayout()
+    menu   = type("RecordingMenu", (), {"layout":        layout,
+                                       "mode":          menu_class.mode,
+                                       "get_draw_plan": menu_class.get_draw_plan,
+                                       "draw_full":     menu_class.draw_full,
+                                       "draw_minimal":  menu_class.draw_minimal})()
+    menu_class.draw(menu, context)
+    return layout
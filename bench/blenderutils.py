@@ -0,0 +1,118 @@
+################################################################################
+#
+#   blenderutils.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains helpers for the scripts that run inside a headless
+#       Blender (blender -b --python ...). They copy the add-on source into a
+#       temporary package and enable it. The recording layout the pie menus
+#       are drawn into without a window is in benchutils.py.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  addon_utils
+import  bpy
+import  importlib
+import  os
+import  shutil
+import  sys
+import  tempfile
+
+from    benchutils import RecordingItem, RecordingLayout, draw_pie
+
+###############################################################################
+#
+#   Add-on Helper Functions
+#
+###############################################################################
+SOURCE_LOCATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source")
+
+#   The package name the add-on is enabled under
+PACKAGE_NAME = "markingmenu_bench"
+
+def get_script_args():
+    '''
+    DESCRIPTION
+        This function returns the command line arguments after "--", which
+        Blender leaves to the script
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A list of strings
+    '''
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+def enable_addon():
+    '''
+    DESCRIPTION
+        This function copies the add-on source into a temporary package and
+        enables it like Blender does, so its preferences exist
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The add-on module
+    '''
+    directory = tempfile.mkdtemp(prefix = "markingmenu_")
+    shutil.copytree(SOURCE_LOCATION, os.path.join(directory, PACKAGE_NAME),
+                    ignore = shutil.ignore_patterns("__pycache__"))
+    sys.path.insert(0, directory)
+
+    addon_utils.enable(PACKAGE_NAME, default_set = True, handle_error = _raise)
+    module = importlib.import_module(PACKAGE_NAME)
+
+    #   The warm-up timer does not run in background mode, fill the slots
+    #   the way it would
+    module.prefs.ensure_slots(get_preferences())
+    return module
+
+def disable_addon():
+    '''
+    DESCRIPTION
+        This function disables the add-on enabled by enable_addon
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    addon_utils.disable(PACKAGE_NAME, default_set = True, handle_error = _raise)
+
+def get_preferences():
+    '''
+    DESCRIPTION
+        This function returns the preferences of the enabled add-on
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The MarkingMenu AddonPreferences
+    '''
+    return bpy.context.preferences.addons[PACKAGE_NAME].preferences
+
+def _raise(err):
+    raise err
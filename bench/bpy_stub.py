@@ -0,0 +1,450 @@
+################################################################################
+#
+#   bpy_stub.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains a minimal pure-Python stand-in for the bpy module,
+#       so the add-on can be imported and its parsing, catalog and draw plan
+#       logic exercised under plain Python in a fraction of a second instead
+#       of inside Blender:
+#
+#           import bpy_stub
+#           bpy = bpy_stub.install()
+#           bpy_stub.define_operators(["object.select_all(action='TOGGLE')"])
+#
+#       It mimics the parts of bpy.ops, bpy.props, bpy.types, bpy.app and
+#       bpy.utils the add-on uses. Operators only exist once they are
+#       defined, and calling one records the call instead of running it.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  ast
+import  os
+import  sys
+import  tempfile
+import  types
+
+###############################################################################
+#
+#   bpy.ops
+#
+###############################################################################
+class EnumItem:
+    '''
+    DESCRIPTION
+        This class stands in for bpy.types.EnumPropertyItem
+    '''
+    def __init__(self, identifier):
+        self.identifier  = identifier
+        self.name        = identifier.replace("_", " ").title()
+        self.description = ""
+
+
+class OperatorProperty:
+    '''
+    DESCRIPTION
+        This class stands in for the bpy.types.Property of an operator
+        argument. type is one of BOOLEAN, INT, FLOAT, STRING or ENUM.
+    '''
+    def __init__(self, identifier, type, enum_items = (), is_enum_flag = False, array_length = 0):
+        self.identifier   = identifier
+        self.type         = type
+        self.enum_items   = [EnumItem(item) for item in enum_items]
+        self.is_enum_flag = is_enum_flag
+        self.array_length = array_length
+
+
+class OperatorRNA:
+    '''
+    DESCRIPTION
+        This class stands in for the bpy.types.Struct returned by
+        get_rna_type() of an operator
+    '''
+    def __init__(self, idname, name = "", description = ""):
+        self.identifier  = idname
+        self.name        = name
+        self.description = description
+        self.properties  = {"rna_type": OperatorProperty("rna_type", 'POINTER')}
+
+
+class OperatorFunction:
+    '''
+    DESCRIPTION
+        This class stands in for a bpy.ops operator. Calls are recorded in
+        the calls list of the module as (idname, execution context, kwargs)
+        tuples, and poll() returns can_run.
+    '''
+    def __init__(self, idname, name = "", description = ""):
+        self.idname  = idname
+        self.rna     = OperatorRNA(idname, name, description)
+        self.can_run = True
+
+    def __call__(self, *args, **kwargs):
+        calls.append((self.idname, args[0] if args else 'EXEC_DEFAULT', kwargs))
+        return {'FINISHED'} if self.can_run else {'CANCELLED'}
+
+    def poll(self, *args):
+        return self.can_run
+
+    def get_rna_type(self):
+        return self.rna
+
+    def idname_py(self):
+        return self.idname
+
+
+class OperatorModule:
+    '''
+    DESCRIPTION
+        This class stands in for a bpy.ops module, e.g. bpy.ops.object
+    '''
+    def __init__(self, name):
+        self.__dict__["_name"]      = name
+        self.__dict__["_operators"] = {}
+
+    def __getattr__(self, name):
+        try:
+            return self._operators[name]
+        except KeyError:
+            raise AttributeError(f"bpy.ops.{self._name}.{name} is not defined") from None
+
+    def __dir__(self):
+        return sorted(self._operators)
+
+
+class OperatorNamespace(types.ModuleType):
+    '''
+    DESCRIPTION
+        This class stands in for bpy.ops
+    '''
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.__dict__.setdefault(name, OperatorModule(name))
+
+    def __dir__(self):
+        return sorted(name for name, value in self.__dict__.items()
+                      if isinstance(value, OperatorModule) and dir(value))
+
+
+#   The recorded operator calls
+calls = []
+
+
+def define_operator(idname, name = "", description = "", **properties):
+    '''
+    DESCRIPTION
+        This function defines a stub operator
+
+    ARGUMENTS
+        idname      (in)    The operator name, e.g. "object.select_all"
+        name        (in)    The label of the operator
+        description (in)    The description of the operator
+        properties  (in)    The arguments of the operator, as
+                            OperatorProperty or a type name
+
+    RETURN
+        The OperatorFunction
+    '''
+    op_module, _, op_func = idname.partition(".")
+    operator = OperatorFunction(idname, name, description)
+    for identifier, prop in properties.items():
+        if isinstance(prop, str):
+            prop = OperatorProperty(identifier, prop)
+        operator.rna.properties[identifier] = prop
+
+    getattr(bpy.ops, op_module)._operators[op_func] = operator
+    return operator
+
+
+def define_operators(op_strings):
+    '''
+    DESCRIPTION
+        This function defines the stub operators called by operator strings,
+        with argument types guessed from the values. String values become
+        enum items, so every value used in the strings is valid.
+
+    ARGUMENTS
+        op_strings  (in)    An iterable of operator strings, e.g.
+                            "object.select_all(action='TOGGLE')"
+
+    RETURN
+        None
+    '''
+    for op_string in op_strings:
+        op_string = op_string.strip()
+        if op_string.startswith("bpy.ops."):
+            op_string = op_string[len("bpy.ops."):]
+
+        idname, _, arg_string = op_string.partition("(")
+        op_module, _, op_func = idname.partition(".")
+        operator = getattr(bpy.ops, op_module)._operators.get(op_func) or define_operator(idname)
+        if not arg_string:
+            continue
+
+        call = ast.parse(f"f({arg_string}", mode = "eval").body
+        for keyword in call.keywords:
+            value = ast.literal_eval(keyword.value)
+            prop  = operator.rna.properties.get(keyword.arg)
+            if prop is None:
+                prop = operator.rna.properties[keyword.arg] = _guess_property(keyword.arg, value)
+            if prop.type == 'ENUM' and value not in {item.identifier for item in prop.enum_items}:
+                prop.enum_items.append(EnumItem(value))
+
+
+def _guess_property(identifier, value):
+    if isinstance(value, bool):
+        return OperatorProperty(identifier, 'BOOLEAN')
+    if isinstance(value, int):
+        return OperatorProperty(identifier, 'INT')
+    if isinstance(value, float):
+        return OperatorProperty(identifier, 'FLOAT')
+    if isinstance(value, (tuple, list)):
+        return OperatorProperty(identifier, 'FLOAT', array_length = len(value))
+    return OperatorProperty(identifier, 'ENUM')
+
+
+###############################################################################
+#
+#   bpy.props and bpy.types
+#
+###############################################################################
+class _PropertyDeferred:
+    '''
+    DESCRIPTION
+        This class stands in for the deferred property bpy.props returns,
+        which Blender turns into an RNA property when the class is registered
+    '''
+    def __init__(self, function, keywords):
+        self.function = function
+        self.keywords = keywords
+
+    def __repr__(self):
+        return f"<{self.function.__name__}({self.keywords})>"
+
+
+def _make_property_function(name):
+    def function(**keywords):
+        return _PropertyDeferred(function, keywords)
+    function.__name__ = name
+    return function
+
+
+PROPERTY_FUNCTIONS = ("BoolProperty", "BoolVectorProperty", "CollectionProperty", "EnumProperty",
+                      "FloatProperty", "FloatVectorProperty", "IntProperty", "IntVectorProperty",
+                      "PointerProperty", "StringProperty")
+
+
+class bpy_struct:
+    '''
+    DESCRIPTION
+        This class is the base of the stub bpy.types classes
+    '''
+    bl_rna = None
+
+    def as_pointer(self):
+        return id(self)
+
+
+class Menu(bpy_struct):
+    bl_idname = ""
+    bl_label  = ""
+
+
+class Operator(bpy_struct):
+    bl_idname  = ""
+    bl_label   = ""
+    bl_options = set()
+
+    def report(self, level, message):
+        print(f"{', '.join(sorted(level))}: {message}")
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class AddonPreferences(bpy_struct):
+    bl_idname = ""
+
+
+class Struct(bpy_struct):
+    pass
+
+
+###############################################################################
+#
+#   bpy.app, bpy.utils and bpy.context
+#
+###############################################################################
+class Timers:
+    '''
+    DESCRIPTION
+        This class stands in for bpy.app.timers. Timers never fire on their
+        own, run() calls every registered timer once.
+    '''
+    def __init__(self):
+        self.functions = {}
+
+    def register(self, function, first_interval = 0.0, persistent = False):
+        self.functions[function] = first_interval
+
+    def unregister(self, function):
+        if function not in self.functions:
+            raise ValueError("Error: function is not registered")
+        del self.functions[function]
+
+    def is_registered(self, function):
+        return function in self.functions
+
+    def run(self):
+        for function in list(self.functions):
+            interval = function()
+            if interval is None:
+                self.functions.pop(function, None)
+            else:
+                self.functions[function] = interval
+
+
+def persistent(function):
+    function._bpy_persistent = True
+    return function
+
+
+#   The classes registered with bpy.utils.register_class
+registered_classes = []
+
+
+def register_class(cls):
+    if cls in registered_classes:
+        raise ValueError(f"register_class(...): already registered as a subclass '{cls.__name__}'")
+    registered_classes.append(cls)
+
+
+def unregister_class(cls):
+    if cls not in registered_classes:
+        raise RuntimeError(f"unregister_class(...): missing bl_rna attribute from '{cls.__name__}'")
+    registered_classes.remove(cls)
+
+
+def user_resource(resource_type, path = "", create = False):
+    directory = os.path.join(_user_directory, resource_type.lower(), path)
+    if create:
+        os.makedirs(directory, exist_ok = True)
+    return directory
+
+
+def extension_path_user(package, path = "", create = False):
+    #   Only packages installed as an extension have an extension directory
+    if not package.startswith("bl_ext."):
+        raise ValueError(f"The \"package\" does not name an extension: {package}")
+    return user_resource('EXTENSIONS', os.path.join(package, path), create)
+
+
+_user_directory = os.path.join(tempfile.gettempdir(), "bpy_stub")
+
+
+###############################################################################
+#
+#   Installation
+#
+###############################################################################
+
+#   The stub bpy module, once installed
+bpy = None
+
+
+def install(version = (4, 2, 0)):
+    '''
+    DESCRIPTION
+        This function puts the stub bpy module into sys.modules, so the
+        add-on modules import it instead of Blender's. Installing again
+        throws away the defined operators and recorded calls.
+
+    ARGUMENTS
+        version     (in)    The Blender version the stub reports
+
+    RETURN
+        The stub bpy module
+    '''
+    global bpy
+
+    calls.clear()
+    registered_classes.clear()
+
+    bpy = types.ModuleType("bpy")
+    bpy.ops = OperatorNamespace("bpy.ops")
+
+    bpy.props = types.ModuleType("bpy.props")
+    for name in PROPERTY_FUNCTIONS:
+        setattr(bpy.props, name, _make_property_function(name))
+
+    bpy.types = types.ModuleType("bpy.types")
+    for cls in (bpy_struct, Menu, Operator, Panel, PropertyGroup, AddonPreferences, Struct):
+        setattr(bpy.types, cls.__name__, cls)
+
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.version        = tuple(version)
+    bpy.app.version_string = ".".join(str(part) for part in version)
+    bpy.app.background     = True
+    bpy.app.timers         = Timers()
+    bpy.app.handlers       = types.ModuleType("bpy.app.handlers")
+    bpy.app.handlers.persistent             = persistent
+    bpy.app.handlers.depsgraph_update_post  = []
+    bpy.app.handlers.load_post              = []
+
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class      = register_class
+    bpy.utils.unregister_class    = unregister_class
+    bpy.utils.user_resource       = user_resource
+    bpy.utils.extension_path_user = extension_path_user
+
+    bpy.path    = types.ModuleType("bpy.path")
+    bpy.path.abspath = os.path.abspath
+    bpy.data    = types.SimpleNamespace(texts = {})
+    bpy.context = types.SimpleNamespace(mode = 'OBJECT', active_object = None, selected_objects = [],
+                                        preferences = types.SimpleNamespace(addons = {}),
+                                        window_manager = None)
+
+    for module in (bpy, bpy.ops, bpy.props, bpy.types, bpy.app, bpy.app.handlers, bpy.utils, bpy.path):
+        sys.modules[module.__name__] = module
+    return bpy
+
+
+def uninstall():
+    '''
+    DESCRIPTION
+        This function takes the stub bpy module out of sys.modules
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global bpy
+
+    for name in [name for name in sys.modules if name == "bpy" or name.startswith("bpy.")]:
+        del sys.modules[name]
+    bpy = None
@@ -0,0 +1,466 @@
+################################################################################
+#
+#   replay.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This script replays scripted marking menu invocations inside a
+#       headless Blender and measures every step end to end. It is run by
+#       "make replay", or "make replay REPLAY_OBJECTS=5000" for a big scene:
+#
+#           blender -b --factory-startup --python bench/replay.py --
+#               [--objects N] [--grid N] [--script FILE] [--repeat N]
+#               [--output FILE]
+#
+#       A scene of --objects meshes of --grid x --grid faces, a curve and an
+#       armature is generated, and every step of the script is replayed on
+#       it: switch to the step's mode, press the hotkey (look up the keymap
+#       item and poll its operator), open the pie (register the menu class
+#       and draw it into a recording layout, there is no window to call
+#       wm.call_menu_pie in), follow the chosen slots through sub-menus and
+#       run the operator of the last one. The step fails when the slot does
+#       not hold the expected operator or the operator does not finish.
+#
+#       A script is a JSON list of steps:
+#
+#           { "mode":    "EDIT_MESH",           context.mode to replay in
+#             "variant": 1,                     hotkey variant, default 1
+#             "slots":   [0],                   slot path, sub-menus first
+#             "expect":  "mesh.select_all",     operator that must run
+#             "assign":  [[ring, slot, item, custom_op], ...] }
+#
+#       assign is optional and changes slots before the step runs. The
+#       script exits with status 1 when a step fails.
+#
+#       EXPERIMENTAL: this script has not been run inside Blender yet. Its
+#       results should not be relied on until it has been run once under
+#       blender -b --factory-startup and checked against a session.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  argparse
+import  bpy
+import  json
+import  os
+import  statistics
+import  sys
+import  time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import  blenderutils
+
+###############################################################################
+#
+#   Replay Definitions
+#
+###############################################################################
+
+#   The replayed script when --script is not given. It only uses the
+#   default slots, apart from the sub-menu step which assigns its own.
+DEFAULT_SCRIPT = [
+    {"mode": "OBJECT",        "slots": [0], "expect": "object.select_all"},
+    {"mode": "OBJECT",        "slots": [3], "expect": "object.shade_smooth"},
+    {"mode": "OBJECT",        "slots": [6], "expect": "object.origin_set"},
+    {"mode": "OBJECT",        "slots": [0], "expect": "object.select_all", "variant": 2},
+    {"mode": "OBJECT",        "slots": [7, 0], "expect": "object.shade_flat",
+     "assign": [["object", 7, "Submenu", "object_extra"], ["object_extra", 0, "Custom", "object.shade_flat"]]},
+    {"mode": "EDIT_MESH",     "slots": [0], "expect": "mesh.select_all"},
+    {"mode": "EDIT_MESH",     "slots": [6], "expect": "mesh.faces_shade_smooth"},
+    {"mode": "EDIT_MESH",     "slots": [4], "expect": "mesh.subdivide"},
+    {"mode": "EDIT_CURVE",    "slots": [0], "expect": "curve.select_all"},
+    {"mode": "EDIT_CURVE",    "slots": [6], "expect": "curve.switch_direction"},
+    {"mode": "EDIT_ARMATURE", "slots": [0], "expect": "armature.select_all"},
+    {"mode": "EDIT_ARMATURE", "slots": [6], "expect": "armature.calculate_roll"},
+    {"mode": "POSE",          "slots": [0], "expect": "pose.select_all"},
+    {"mode": "POSE",          "slots": [1], "expect": "pose.transforms_clear"},
+    {"mode": "SCULPT",        "slots": [0], "expect": "paint.mask_flood_fill"},
+    {"mode": "PAINT_WEIGHT",  "slots": [1], "expect": "object.vertex_group_normalize_all"},
+    {"mode": "OBJECT",        "slots": [0], "expect": "object.select_all"},
+]
+
+#   The object type and object.mode_set mode of every context.mode
+MODES = {
+    "OBJECT":        ('MESH',     'OBJECT'),
+    "EDIT_MESH":     ('MESH',     'EDIT'),
+    "EDIT_CURVE":    ('CURVE',    'EDIT'),
+    "EDIT_ARMATURE": ('ARMATURE', 'EDIT'),
+    "POSE":          ('ARMATURE', 'POSE'),
+    "SCULPT":        ('MESH',     'SCULPT'),
+    "PAINT_WEIGHT":  ('MESH',     'WEIGHT_PAINT'),
+}
+
+#   The measured stages of a step
+STAGES = ("keypress", "open", "draw", "operator")
+
+
+class ReplayError(Exception):
+    '''
+    DESCRIPTION
+        This exception is raised when a step does not do what the script
+        expects
+    '''
+    pass
+
+
+###############################################################################
+#
+#   Scene Generation
+#
+###############################################################################
+def generate_scene(objects, grid):
+    '''
+    DESCRIPTION
+        This function replaces the scene with generated objects: meshes of
+        grid x grid faces with a vertex group, a bezier curve and an
+        armature
+
+    ARGUMENTS
+        objects     (in)    The number of mesh objects
+        grid        (in)    The number of faces along each side of a mesh
+
+    RETURN
+        A {object type: object} dictionary of the objects the modes use
+    '''
+    scene = bpy.context.scene
+    for obj in list(scene.objects):
+        bpy.data.objects.remove(obj)
+
+    verts = [(x / grid - 0.5, y / grid - 0.5, 0.0) for y in range(grid + 1) for x in range(grid + 1)]
+    faces = [(y * (grid + 1) + x, y * (grid + 1) + x + 1, (y + 1) * (grid + 1) + x + 1, (y + 1) * (grid + 1) + x)
+             for y in range(grid) for x in range(grid)]
+    template = bpy.data.meshes.new("ReplayMesh")
+    template.from_pydata(verts, [], faces)
+
+    columns = max(1, int(objects ** 0.5))
+    meshes  = []
+    for index in range(objects):
+        obj = bpy.data.objects.new(f"ReplayMesh.{index:05d}", template.copy())
+        obj.location = (index % columns * 1.5, index // columns * 1.5, 0.0)
+        obj.vertex_groups.new(name = "Group").add(list(range(len(verts))), 0.5, 'REPLACE')
+        scene.collection.objects.link(obj)
+        meshes.append(obj)
+    bpy.data.meshes.remove(template)
+
+    curve = bpy.data.curves.new("ReplayCurve", 'CURVE')
+    spline = curve.splines.new('BEZIER')
+    spline.bezier_points.add(3)
+    for index, point in enumerate(spline.bezier_points):
+        point.co = (index, 0.0, 0.0)
+    curve_object = bpy.data.objects.new("ReplayCurve", curve)
+    scene.collection.objects.link(curve_object)
+
+    armature = bpy.data.objects.new("ReplayArmature", bpy.data.armatures.new("ReplayArmature"))
+    scene.collection.objects.link(armature)
+    activate(armature)
+    bpy.ops.object.mode_set(mode = 'EDIT')
+    parent = None
+    for index in range(4):
+        bone        = armature.data.edit_bones.new(f"Bone.{index}")
+        bone.head   = (0.0, 0.0, index)
+        bone.tail   = (0.0, 0.0, index + 1)
+        bone.parent = parent
+        parent      = bone
+    bpy.ops.object.mode_set(mode = 'OBJECT')
+
+    return {'MESH': meshes[0], 'CURVE': curve_object, 'ARMATURE': armature}
+
+
+def activate(obj):
+    '''
+    DESCRIPTION
+        This function makes an object the only selected and the active object
+
+    ARGUMENTS
+        obj         (in)    The object
+
+    RETURN
+        None
+    '''
+    view_layer = bpy.context.view_layer
+    for other in view_layer.objects.selected:
+        other.select_set(False)
+    obj.select_set(True)
+    view_layer.objects.active = obj
+
+
+def enter_mode(mode, scene_objects):
+    '''
+    DESCRIPTION
+        This function switches Blender to a context.mode, activating an
+        object of the type the mode needs
+
+    ARGUMENTS
+        mode            (in)    The context.mode, a key of MODES
+        scene_objects   (in)    The objects returned by generate_scene
+
+    RETURN
+        None
+    '''
+    if bpy.context.mode == mode:
+        return
+
+    object_type, object_mode = MODES[mode]
+    if bpy.context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode = 'OBJECT')
+    activate(scene_objects[object_type])
+    bpy.ops.object.mode_set(mode = object_mode)
+
+    if bpy.context.mode != mode:
+        raise ReplayError(f"Could not switch to {mode}, Blender is in {bpy.context.mode}")
+
+
+###############################################################################
+#
+#   Step Replay
+#
+###############################################################################
+def get_keymap_item(addon, mode, variant):
+    '''
+    DESCRIPTION
+        This function finds the add-on keymap item the hotkey of a mode
+        presses
+
+    ARGUMENTS
+        addon       (in)    The add-on module
+        mode        (in)    The context.mode
+        variant     (in)    The hotkey variant
+
+    RETURN
+        The bpy.types.KeyMapItem
+    '''
+    hotkey = addon.schema.HOTKEYS[variant]
+    entry  = addon.keymaps.get_registered().get((mode, variant))
+    if entry is not None and entry[1].idname == hotkey.idname and entry[1].active:
+        return entry[1]
+    raise ReplayError(f"No active '{hotkey.idname}' keymap item for {mode}")
+
+
+def get_last_operator():
+    '''
+    DESCRIPTION
+        This function returns the last operator in the window manager's
+        history, which is how a step sees the operator it ran
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The bpy.types.Operator, or None
+    '''
+    operators = bpy.context.window_manager.operators
+    return operators[-1] if len(operators) else None
+
+
+def replay_step(addon, step, scene_objects):
+    '''
+    DESCRIPTION
+        This function replays a single step of a script
+
+    ARGUMENTS
+        addon           (in)    The add-on module
+        step            (in)    The step dictionary
+        scene_objects   (in)    The objects returned by generate_scene
+
+    RETURN
+        A {stage: seconds} dictionary
+
+    RAISES
+        ReplayError when the step does not do what the script expects
+    '''
+    context     = bpy.context
+    preferences = blenderutils.get_preferences()
+    variant     = step.get("variant", 1)
+
+    for ring, slot, item, custom_op in step.get("assign", ()):
+        ring_slot = addon.prefs.get_ring_slots(preferences, ring)[slot]
+        ring_slot.custom_op = custom_op
+        ring_slot.item      = item
+
+    enter_mode(step["mode"], scene_objects)
+    timings = dict.fromkeys(STAGES, 0.0)
+
+    #   The hotkey press, up to the point call_marking_menu opens the pie
+    start = time.perf_counter()
+    kmi   = get_keymap_item(addon, step["mode"], variant)
+    if not getattr(bpy.ops.pie, kmi.idname.partition(".")[2]).poll():
+        raise ReplayError(f"{kmi.idname} can not run in {step['mode']}")
+    ring  = addon.schema.RING_BY_MODE[step["mode"], variant]
+    addon.prefs.ensure_slots(preferences)
+    timings["keypress"] += time.perf_counter() - start
+
+    entry = None
+    for depth, slot in enumerate(step["slots"]):
+        #   What open_pie_menu does before it calls wm.call_menu_pie
+        start      = time.perf_counter()
+        menu_class = addon.get_menu_class(ring)
+        if menu_class not in addon.registered_menu_classes:
+            bpy.utils.register_class(menu_class)
+            addon.registered_menu_classes.append(menu_class)
+        timings["open"] += time.perf_counter() - start
+
+        start  = time.perf_counter()
+        layout = blenderutils.draw_pie(menu_class, context)
+        timings["draw"] += time.perf_counter() - start
+
+        kind, entry, text, enabled = layout.items[menu_class.PIE_SLOTS[slot]]
+        if kind != "operator" or not enabled:
+            raise ReplayError(f"Slot {slot + 1} of {ring} is not available")
+
+        if depth < len(step["slots"]) - 1:
+            if entry.op_name != "pie.call_ring":
+                raise ReplayError(f"Slot {slot + 1} of {ring} is {entry.op_name}, not a sub-menu")
+            ring = entry.args["ring"]
+
+    if entry.op_name != step["expect"]:
+        raise ReplayError(f"Slot holds {entry.op_name}, expected {step['expect']}")
+
+    #   Run the operator like the pie button would. There is no window to
+    #   invoke modal operators in, so they are executed.
+    last  = get_last_operator()
+    start = time.perf_counter()
+    try:
+        result = addon.utils.call_operator(entry.op_name, tuple(entry.args.items()), 'EXEC_DEFAULT')
+    except RuntimeError as err:
+        raise ReplayError(f"{entry.op_name} failed: {str(err).strip()}") from None
+    timings["operator"] += time.perf_counter() - start
+
+    if 'FINISHED' not in result:
+        raise ReplayError(f"{entry.op_name} returned {set(result)}")
+
+    #   Operators that register themselves must show up in the history
+    ran = get_last_operator()
+    if ran is not None and ran != last:
+        module, _, function = step["expect"].partition(".")
+        if ran.bl_idname != f"{module.upper()}_OT_{function}":
+            raise ReplayError(f"{ran.bl_idname} ran instead of {step['expect']}")
+
+    return timings
+
+
+def replay(addon, script, scene_objects, repeat):
+    '''
+    DESCRIPTION
+        This function replays a script several times and summarizes every
+        step
+
+    ARGUMENTS
+        addon           (in)    The add-on module
+        script          (in)    The list of steps
+        scene_objects   (in)    The objects returned by generate_scene
+        repeat          (in)    The number of times the script is replayed
+
+    RETURN
+        A list of step summaries, and the number of failed steps
+    '''
+    samples  = [[] for _ in script]
+    failures = [None] * len(script)
+    for _ in range(repeat):
+        for index, step in enumerate(script):
+            if failures[index] is not None:
+                continue
+            try:
+                samples[index].append(replay_step(addon, step, scene_objects))
+            except ReplayError as err:
+                failures[index] = str(err)
+
+    summaries = []
+    for index, step in enumerate(script):
+        totals  = [sum(timings.values()) * 1000 for timings in samples[index]]
+        summary = { "step":   index + 1,
+                    "mode":   step["mode"],
+                    "slots":  step["slots"],
+                    "expect": step["expect"],
+                    "runs":   len(totals),
+                    "error":  failures[index] }
+        if totals:
+            summary.update({ "min_ms":    round(min(totals), 4),
+                             "median_ms": round(statistics.median(totals), 4),
+                             "max_ms":    round(max(totals), 4) })
+            for stage in STAGES:
+                summary[f"{stage}_ms"] = round(statistics.median(timings[stage] * 1000
+                                                                 for timings in samples[index]), 4)
+        summaries.append(summary)
+
+    return summaries, sum(1 for failure in failures if failure is not None)
+
+
+def print_summaries(summaries):
+    '''
+    DESCRIPTION
+        This function prints the step summaries as a table
+
+    ARGUMENTS
+        summaries   (in)    The list of step summaries
+
+    RETURN
+        None
+    '''
+    header = "".join(f"{stage:>10}" for stage in STAGES)
+    print(f"{'step':<48}{'median ms':>10}{header}")
+    for summary in summaries:
+        name = f"{summary['step']:>2} {summary['mode']} {summary['slots']} {summary['expect']}"
+        if summary["error"] is not None:
+            print(f"{name:<48}  FAILED: {summary['error']}")
+            continue
+        stages = "".join(f"{summary[f'{stage}_ms']:>10.3f}" for stage in STAGES)
+        print(f"{name:<48}{summary['median_ms']:>10.3f}{stages}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog = "replay.py")
+    parser.add_argument("--objects", type = int, default = 200)
+    parser.add_argument("--grid", type = int, default = 8)
+    parser.add_argument("--script", default = None)
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--output", default = "replay.json")
+    args = parser.parse_args(blenderutils.get_script_args())
+
+    script = DEFAULT_SCRIPT
+    if args.script is not None:
+        with open(args.script, "r", encoding = "utf-8") as file:
+            script = json.load(file)
+
+    scene_objects = generate_scene(max(1, args.objects), max(1, args.grid))
+    addon = blenderutils.enable_addon()
+    try:
+        summaries, failed = replay(addon, script, scene_objects, args.repeat)
+    finally:
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode = 'OBJECT')
+        blenderutils.disable_addon()
+
+    print_summaries(summaries)
+    report = { "blender": bpy.app.version_string,
+               "objects": args.objects,
+               "grid":    args.grid,
+               "repeat":  args.repeat,
+               "steps":   summaries }
+    with open(args.output, "w", encoding = "utf-8") as file:
+        json.dump(report, file, indent = 2)
+    print(f"Results written to {args.output}")
+
+    if failed:
+        print(f"{failed} step(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+################################################################################
+#
+#   run_bench.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This script benchmarks the Marking Menus Blender Add-on inside a
+#       headless Blender. It is run by "make bench":
+#
+#           blender -b --factory-startup --python bench/run_bench.py --
+#               [--output FILE] [--baseline FILE] [--update-baseline]
+#               [--allow-missing-baseline] [--threshold RATIO]
+#
+#       The results are written as JSON and compared to the baseline. The
+#       script exits with status 1 when a result is slower than the
+#       baseline by more than the threshold, or when a result has no
+#       baseline to compare to and --allow-missing-baseline is not given.
+#       Record the baseline with "make bench-baseline" on the machine that
+#       runs the benchmarks.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  argparse
+import  bpy
+import  inspect
+import  json
+import  os
+import  statistics
+import  sys
+import  time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import  blenderutils
+
+###############################################################################
+#
+#   Benchmark Definitions
+#
+###############################################################################
+
+#   A result is a regression when it is this much slower than the baseline
+THRESHOLD = 1.25
+
+#   Realistic operator strings, on top of every string in the catalogs
+EXTRA_STRINGS = [
+    "bpy.ops.object.select_all(action='TOGGLE')",
+    "mesh.select_mode(type='FACE', use_extend=False)",
+    "transform.resize(value=(1.0, 1.0, -1.0), orient_type='GLOBAL')",
+    "mesh.select_non_manifold(extend=False, use_wire=True)",
+    "object.modifier_add(type='BEVEL')",
+    "view3d.view_axis(type='TOP', align_active=True)",
+    "mesh.bevel(offset=0.02, segments=3, affect='EDGES')",
+    "wm.context_toggle(data_path='space_data.overlay.show_wireframes')",
+]
+
+#   Text typed into the custom operator search
+SEARCH_QUERIES = ["s", "sel", "select all", "shade smooth", "origin geom",
+                  "add modifier", "obj.del", "bevel", "view axis", "xyzzy"]
+
+
+def measure(func, runs, setup = None):
+    '''
+    DESCRIPTION
+        This function times a function and summarizes the runs
+
+    ARGUMENTS
+        func        (in)    The function to time
+        runs        (in)    The number of runs
+        setup       (in)    An optional function called before every run,
+                            outside the timing
+
+    RETURN
+        A {runs, min_ms, median_ms, max_ms} dictionary
+    '''
+    times = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return { "runs":      runs,
+             "min_ms":    round(min(times), 4),
+             "median_ms": round(statistics.median(times), 4),
+             "max_ms":    round(max(times), 4) }
+
+
+###############################################################################
+#
+#   Benchmarks
+#
+###############################################################################
+def bench_draw(addon, results):
+    '''
+    DESCRIPTION
+        This function times draw() of every ring's pie menu into a recording
+        layout, with a compiled plan (warm) and right after the preferences
+        changed (cold)
+    '''
+    context = bpy.context
+    for ring in addon.schema.RINGS:
+        menu_class = addon.get_menu_class(ring)
+        draw       = lambda: blenderutils.draw_pie(menu_class, context)
+
+        results[f"draw.{ring}.cold"] = measure(draw, 50, setup = addon.plans.invalidate)
+        results[f"draw.{ring}.warm"] = measure(draw, 500)
+
+
+def bench_parse(addon, results):
+    '''
+    DESCRIPTION
+        This function times parse_operator_string over the catalog strings
+        and some realistic custom operators, without and with the memo cache
+    '''
+    opstring = addon.opstring
+    corpus   = [identifier for catalog in addon.schema.CATALOGS.values()
+                for identifier in catalog if "." in identifier] + EXTRA_STRINGS
+    uncached = inspect.unwrap(opstring.parse_operator_string)
+
+    def parse_all(parse):
+        for op_string in corpus:
+            parse(op_string)
+
+    results["parse.uncached"] = measure(lambda: parse_all(uncached), 200)
+    results["parse.memoized"] = measure(lambda: parse_all(opstring.parse_operator_string), 200)
+    results["parse.validate"] = measure(lambda: parse_all(addon.utils.validate_operator_string), 200,
+                                        setup = addon.utils.clear_validated_operators)
+
+
+def bench_operators(addon, results):
+    '''
+    DESCRIPTION
+        This function times building the operator search index with nothing
+        cached, with the catalog file on disk and with the index in memory,
+        and the search callback over some typed queries
+    '''
+    utils   = addon.utils
+    context = bpy.context
+    path    = utils.store.get_user_path(utils.OPERATOR_CATALOG_FILE)
+
+    def cold():
+        utils.clear_operator_items()
+        if os.path.exists(path):
+            os.remove(path)
+
+    def search_all():
+        for query in SEARCH_QUERIES:
+            utils.search_operators(None, context, query)
+
+    get_index = lambda: utils.get_search_index(context)
+
+    results["operators.cold"]   = measure(get_index, 5, setup = cold)
+    results["operators.disk"]   = measure(get_index, 20, setup = utils.clear_operator_items)
+    results["operators.warm"]   = measure(get_index, 200)
+    results["operators.search"] = measure(search_all, 100)
+
+
+def bench_register(addon, results):
+    '''
+    DESCRIPTION
+        This function times unregister() / register() cycles of the add-on
+    '''
+    def cycle():
+        addon.unregister()
+        addon.register()
+
+    results["register.cycle"] = measure(cycle, 20)
+
+
+###############################################################################
+#
+#   Baseline Comparison
+#
+###############################################################################
+def compare(results, baseline, threshold):
+    '''
+    DESCRIPTION
+        This function compares the median of every result to the baseline
+
+    ARGUMENTS
+        results     (in)    The {name: summary} results
+        baseline    (in)    The {name: summary} baseline
+        threshold   (in)    The ratio above which a result is a regression
+
+    RETURN
+        A {name: ratio} dictionary of the regressions
+    '''
+    regressions = {}
+    print(f"{'benchmark':<32}{'median ms':>12}{'baseline':>12}{'ratio':>8}")
+    for name, summary in results.items():
+        median = summary["median_ms"]
+        base   = baseline.get(name, {}).get("median_ms")
+        if not base:
+            print(f"{name:<32}{median:>12.4f}{'-':>12}{'-':>8}")
+            continue
+
+        ratio = median / base
+        flag  = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<32}{median:>12.4f}{base:>12.4f}{ratio:>8.2f}{flag}")
+        if flag:
+            regressions[name] = round(ratio, 3)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog = "run_bench.py")
+    parser.add_argument("--output", default = "bench.json")
+    parser.add_argument("--baseline", default = os.path.join(os.path.dirname(__file__), "baseline.json"))
+    parser.add_argument("--update-baseline", action = "store_true")
+    parser.add_argument("--allow-missing-baseline", action = "store_true")
+    parser.add_argument("--threshold", type = float, default = THRESHOLD)
+    args = parser.parse_args(blenderutils.get_script_args())
+
+    addon   = blenderutils.enable_addon()
+    results = {}
+    for benchmark in (bench_draw, bench_parse, bench_operators, bench_register):
+        benchmark(addon, results)
+    blenderutils.disable_addon()
+
+    report = { "blender": bpy.app.version_string,
+               "results": results }
+    with open(args.output, "w", encoding = "utf-8") as file:
+        json.dump(report, file, indent = 2)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding = "utf-8") as file:
+            json.dump(report, file, indent = 2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    #   Without a baseline nothing is compared, which must not pass as a
+    #   clean run unless it was asked for
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run 'make bench-baseline' to create one")
+        return 0 if args.allow_missing_baseline else 1
+
+    with open(args.baseline, "r", encoding = "utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("blender") != report["blender"]:
+        print(f"WARNING: baseline was recorded with Blender {baseline.get('blender')}")
+
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {args.threshold:.2f}x the baseline")
+        return 1
+
+    #   A benchmark the baseline does not have was not compared either
+    missing = [name for name in results if not baseline.get("results", {}).get(name, {}).get("median_ms")]
+    if missing:
+        print(f"{len(missing)} benchmark(s) not in the baseline, run 'make bench-baseline' to add them")
+        return 0 if args.allow_missing_baseline else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,10 +27,30 @@
 #
 ################################################################################
 import  bpy
-import  copy
-
+import  importlib
+import  json
+import  time
+
+from    . import diagnostics
+from    . import gestures
+from    . import hotreload
+from    . import keymaps
+from    . import opstring
+from    . import plans
+from    . import predicates
+from    . import profiler
 from    . import prefs
+from    . import profiles
+from    . import recent
+from    . import schema
+from    . import store
+from    . import telemetry
 from    . import utils
+from    . import watchdog
+from    . import warmup
+
+#   The most profile problems reported at once
+MAX_REPORTED_PROBLEMS = 5
 
 
 ###############################################################################
@@ -56,13 +76,23 @@ class PIE_MT_CustomizableSelectionsBase(bpy.types.Menu):
             SouthEast         3
 
     '''
-    PIE_POSITIONS = [6, 2, 4, 0, 7, 1, 5, 3]
+    PIE_POSITIONS = schema.PIE_POSITIONS
+
+    #   The position of each slot (compass sector) in the draw plan
+    PIE_SLOTS = {slot: position for position, slot in enumerate(PIE_POSITIONS)}
 
+    @profiler.timed("pie_draw")
     def draw(self, context):
         '''
         DESCRIPTION
             This method is called by Blender when it needs to draw our
-            Pie Menu Items
+            Pie Menu Items. It walks the compiled draw plan for this mode,
+            which is only rebuilt when the preferences change. Slots whose
+            condition fails are left empty and slots whose operator can
+            not run are greyed out.
+
+            While the draws run over the draw budget, only the labels of
+            the plan are drawn and every slot runs through pie.run_slot.
 
         ARGUMENTS
             context     (in)   A context object we can use to get info
@@ -70,213 +100,1019 @@ class PIE_MT_CustomizableSelectionsBase(bpy.types.Menu):
         RETURN
             None
         '''
+        start = time.perf_counter()
 
-        #   Get the preference data for this package
-        preferences = context.preferences.addons[__package__].preferences
+        #   Get the compiled draw plan for this mode
+        plan = self.get_draw_plan(context)
 
         #   Define a UI layout for the PieMenu
         pie_layt = self.layout.menu_pie()
 
-        for i in self.PIE_POSITIONS:
-            op_name   = getattr(preferences, f"{self.mode}_pie_item_{i}")
-            custom_op = getattr(preferences, f"{self.mode}_custom_op_{i}")
+        if watchdog.degraded:
+            self.draw_minimal(pie_layt, plan)
+        else:
+            self.draw_full(context, pie_layt, plan)
 
-            if op_name == "Custom":
-                if custom_op:
-                    self.draw_custom_operator(pie_layt, custom_op)
-                else:
-                    pie_layt.separator()
+        watchdog.record(time.perf_counter() - start)
+        profiler.draw_done()
+
+    def draw_full(self, context, pie_layt, plan):
+        '''
+        DESCRIPTION
+            This method draws the slots of the plan that are available for
+            the current selection, with their operator arguments
+
+        ARGUMENTS
+            context     (in)   A context object we can use to get info
+            pie_layt    (in)   The pie layout
+            plan        (in)   The tuple of PlanEntry / None items
 
-            elif op_name:
-                self.draw_operator(pie_layt, op_name)
+        RETURN
+            None
+        '''
 
-            else:
+        #   Get the state of the slots for the current selection
+        selection, key = utils.get_selection_state(context)
+        states = predicates.get_slot_states(self.mode, plan, key, selection, utils.poll_operator)
+
+        #   The slots run through pie.run_slot only when a Recent slot
+        #   shows the operators of this ring. Otherwise the buttons call
+        #   their operators and the choice is found afterwards.
+        record = False
+        if recent.enabled:
+            preferences = context.preferences.addons[__package__].preferences
+            record = self.mode in prefs.get_recent_sources(preferences)
+        if not record and telemetry.enabled:
+            remember_shown_pie(context, self.mode, plan)
+
+        for position, (entry, state) in enumerate(zip(plan, states)):
+            if state == predicates.SLOT_HIDDEN:
                 pie_layt.separator()
+                continue
+
+            #   Grey out the slots whose operator can not run
+            layout = pie_layt
+            if state == predicates.SLOT_DISABLED:
+                layout = pie_layt.column()
+                layout.enabled = False
+
+            #   For the Recent slots the slot runs through pie.run_slot,
+            #   which counts the choice, ranks the operator and closes the
+            #   keypress to operator timing
+            if record:
+                pie_menu_item = layout.operator("pie.run_slot", text = entry.label)
+                pie_menu_item.ring = self.mode
+                pie_menu_item.slot = schema.PIE_POSITIONS[position]
+                continue
+
+            #   Add the op_name and op_text to the pie menu
+            pie_menu_item = layout.operator(entry.op_name, text = entry.label)
 
-    def draw_operator(self, pie, op_string):
+            #   Add the op_args to the pie_menu_item. These were validated
+            #   against the operator's RNA when the plan was compiled.
+            for arg, value in entry.op_args:
+                setattr(pie_menu_item, arg, value)
+
+    def draw_minimal(self, pie_layt, plan):
         '''
         DESCRIPTION
-            This method is called by the draw method to set attribute values
-            for the standard operators
+            This method draws the cached labels of the plan and nothing
+            else. The conditions and polls are not checked, and the slots
+            run through pie.run_slot, which looks the operator arguments up
+            when a slot is chosen.
 
         ARGUMENTS
-            pie         (in)    A Pie Menu Object to populate
-            op_string   (in)    The operator string to add to the pie menu
+            pie_layt    (in)   The pie layout
+            plan        (in)   The tuple of PlanEntry / None items
 
         RETURN
             None
         '''
+        for position, entry in enumerate(plan):
+            if entry is None:
+                pie_layt.separator()
+                continue
 
-        #   Seperate the operator name from its arguments in op_string
-        op_name, op_args = self.parse_operator_string(op_string)
+            pie_menu_item = pie_layt.operator("pie.run_slot", text = entry.label)
+            pie_menu_item.ring = self.mode
+            pie_menu_item.slot = schema.PIE_POSITIONS[position]
 
-        #   Detirmine the text label of the operator from its function
-        op_text = next((item[1] for item in self.common_operators if item[0] == op_string), op_string)
+    @classmethod
+    def get_draw_plan(cls, context):
+        '''
+        DESCRIPTION
+            This method returns the compiled draw plan for this mode,
+            compiling it if the preferences changed since the last call.
+            Recent slots hold the operators of their ranking.
 
-        #   Check to see if the operator name exists in the python library
-        if hasattr(bpy.ops, op_name):
-            #   Add the op_name and op_text to the pie menu
-            pie_menu_item = pie.operator(op_name, text = op_text)
-
-            #   Add the op_args to the pie_menu_item
-            for arg, value in op_args.items():
-                try:
-                    setattr(pie_menu_item, arg, value)
-                except:
-                    self.report({'WARNING'}, f"Could not set property {arg} for operator {op_name}")
-        else:
-            pie.separator()
-            self.report({'WARNING'}, f"Operator {op_name} not found")
+        ARGUMENTS
+            context     (in)   A context object we can use to get info
 
-    def draw_custom_operator(self, pie, op_string):
+        RETURN
+            A tuple of PlanEntry / None items in pie order
+        '''
+        plan = plans.get_plan(cls.mode)
+        if plan is None:
+            preferences = context.preferences.addons[__package__].preferences
+            plan = cls.compile_draw_plan(preferences)
+
+        #   Fill the Recent slots, the result is cached until they change.
+        #   Over the draw budget the Recent slots keep what they show.
+        return recent.resolve(cls.mode, plan, refresh = not watchdog.degraded)
+
+    @classmethod
+    def get_slot_entries(cls, context):
         '''
         DESCRIPTION
-            This method is called by the draw method to set attribute values
-            for the custom operators
+            This method returns the draw plan entries in slot order. The
+            slot index is also the compass sector (0 = North, clockwise).
 
         ARGUMENTS
-            pie         (in)    A Pie Menu Object to populate
-            op_string   (in)    The operator string to add to the pie menu
+            context     (in)   A context object we can use to get info
 
         RETURN
-            None
+            A tuple of 8 PlanEntry / None items
         '''
+        plan = cls.get_draw_plan(context)
+        return tuple(plan[cls.PIE_SLOTS[slot]] for slot in range(len(plan)))
 
-        #   Seperate the operator name from its arguments in op_string
-        op_name, op_args = self.parse_operator_string(op_string)
-
-        #   Detirmine the text label of the operator from its function
-        op_text = op_name.split(".")[-1].replace("_", " ").title()
+    @classmethod
+    def compile_draw_plan(cls, preferences):
+        '''
+        DESCRIPTION
+            This method resolves the preference data for this mode into a
+            draw plan of ready-to-emit pie items, and stores it in the plan
+            cache
 
-        if hasattr(bpy.ops, op_name.split('.')[0]):
-            #   Add the op_name and op_text to the pie menu
-            pie_menu_item = pie.operator(op_name, text = op_text)
-
-            #   Add the op_args to the pie_menu_item
-            for arg, value in op_args.items():
-                try:
-                    setattr(pie_menu_item, arg, value)
-                except:
-                    self.report({'WARNING'}, f"Could not set property {arg} for operator {op_name}")
-        else:
-            pie.separator()
-            self.report({'WARNING'}, f"Custom operator {op_name} not found")
+        ARGUMENTS
+            preferences (in)    The preferences for this package
 
-    def parse_operator_string(self, op_string):
+        RETURN
+            A tuple of PlanEntry / None items in pie order
+        '''
+        slots = prefs.get_ring_slots(preferences, cls.mode)
+
+        plan = []
+        for i in cls.PIE_POSITIONS:
+            if i >= len(slots):
+                #   The slots are filled in by the warm-up
+                plan.append(None)
+                continue
+
+            #   Slots that can not be compiled are left empty. The problem
+            #   goes to the diagnostics log instead of being reported on
+            #   every redraw.
+            slot = slots[i]
+            try:
+                entry = cls.compile_slot(slot.item, slot.custom_op)
+            except opstring.OperatorStringError as err:
+                diagnostics.report(cls.mode, i, str(err))
+                entry = None
+
+            #   Attach the slot's condition to the entry
+            if entry is not None and slot.condition != "ALWAYS":
+                entry = entry._replace(condition = slot.condition)
+            plan.append(entry)
+
+        return plans.store_plan(cls.mode, plan)
+
+    @classmethod
+    def compile_slot(cls, op_name, custom_op):
         '''
         DESCRIPTION
-            This method is used by the draw and draw_custom methods to parse
-            the op_string data into its parts (op_name, and op_args)
+            This method resolves a single slot into a plan entry, validating
+            its operators against Blender
 
         ARGUMENTS
-            op_string   (in)    The variable to parse
+            op_name     (in)    The item of the slot, an operator string
+                                from the catalog or Custom, Submenu, Macro
+                                or Empty
+            custom_op   (in)    The custom operator, ring or macro text of
+                                the slot
 
         RETURN
-            op_name (str)       The name of the operatot
-            op_args (dict)      A dictionary containing all the args and
-                                their values
+            A PlanEntry, or None for an empty slot
+
+        RAISES
+            opstring.OperatorStringError when the slot is not valid
         '''
+        return plans.compile_slot(op_name, custom_op, cls.catalog,
+                                  utils.validate_operator_string, utils.validate_macro_string)
+
+
+###############################################################################
+#
+#   Pie menu classes are generated for each ring on first use
+#
+###############################################################################
 
-        op_parts = op_string.split("(", 1)
-        op_name = op_parts[0]
-        op_args = {}
+#   The generated pie menu classes by ring name
+menu_classes = {}
 
-        if len(op_parts) > 1:
-            args_string = op_parts[1].rstrip(")")
-            if args_string:
-                for arg in args_string.split(","):
-                    key, value = arg.split("=")
-                    op_args[key.strip()] = value.strip("'")
+#   The generated pie menu classes that are registered with Blender
+registered_menu_classes = []
 
-        return op_name, op_args
+def get_menu_class(ring):
+    '''
+    DESCRIPTION
+        This function returns the pie menu class of a ring, generating it
+        the first time it is asked for. The class is not registered, so
+        it can be used to compile draw plans without touching Blender.
 
+    ARGUMENTS
+        ring        (in)   The name of the ring in schema.RINGS
 
-class PIE_MT_CustomizableSelectionsObject(PIE_MT_CustomizableSelectionsBase):
+    RETURN
+        A subclass of PIE_MT_CustomizableSelectionsBase
+    '''
+    cls = menu_classes.get(ring)
+    if cls is None:
+        spec = schema.RINGS[ring]
+        cls = type(f"PIE_MT_CustomizableSelections_{ring}",
+                   (PIE_MT_CustomizableSelectionsBase,),
+                   { "__doc__":   f"Define the pie menu for {spec.label}",
+                     "bl_idname": spec.bl_idname,
+                     "bl_label":  f"Linkage Marking Menu ({spec.label})",
+                     "mode":      ring,
+                     "catalog":   schema.CATALOGS[spec.catalog] })
+        menu_classes[ring] = cls
+    return cls
+
+def open_pie_menu(ring):
     '''
     DESCRIPTION
-        Define the pie menu for Object Mode (left click)
+        This function opens the visual pie menu of a ring, registering its
+        class with Blender the first time
+
+    ARGUMENTS
+        ring        (in)   The name of the ring
+
+    RETURN
+        None
     '''
-    bl_idname = "PIE_MT_customizable_selections_object"
-    bl_label  = "Linkage Marking Menu (Object Mode)"
+    cls = get_menu_class(ring)
+    if cls not in registered_menu_classes:
+        bpy.utils.register_class(cls)
+        registered_menu_classes.append(cls)
+
+    bpy.ops.wm.call_menu_pie(name = cls.bl_idname)
 
-    mode = "object"
-    common_operators = prefs.OBJECT_OPERATORS
+#   The pie menu drawn last with direct buttons while usage is recorded, as
+#   (ring, plan, pointer of the last registered operator), or None
+_shown_pie = None
+
+def remember_shown_pie(context, ring, plan):
+    '''
+    DESCRIPTION
+        This function remembers a pie menu drawn with direct operator
+        buttons, so the button chosen from it can be recorded afterwards
+
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+        ring        (in)   The name of the ring
+        plan        (in)   The tuple of PlanEntry / None items
+
+    RETURN
+        None
+    '''
+    global _shown_pie
 
+    operators  = context.window_manager.operators
+    _shown_pie = (ring, plan, operators[-1].as_pointer() if len(operators) else None)
 
-class PIE_MT_CustomizableSelectionsObject2(PIE_MT_CustomizableSelectionsBase):
+def record_pie_choice(context, op_name = None, get_arg = None):
     '''
     DESCRIPTION
-        Define the pie menu for Object Mode 2 (right click)
+        This function records the button chosen from the pie menu drawn
+        last with direct operator buttons. The choice is the operator
+        registered since the pie was drawn, or the operator given by the
+        caller. Operators without the REGISTER option can not be told
+        apart from a cancelled pie and are not counted.
+
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+        op_name     (in)   The operator that ran, or None to look at the
+                           last registered operator
+        get_arg     (in)   A function returning the value an argument of
+                           op_name ran with
+
+    RETURN
+        None
+    '''
+    global _shown_pie
+
+    if _shown_pie is None:
+        return
+
+    ring, plan, last = _shown_pie
+    _shown_pie = None
+
+    if op_name is None:
+        operators = context.window_manager.operators
+        if not len(operators) or operators[-1].as_pointer() == last:
+            return
+
+        #   MODULE_OT_func is the bl_idname of module.func
+        operator        = operators[-1]
+        module, _, func = operator.bl_idname.partition("_OT_")
+        op_name         = f"{module.lower()}.{func}"
+        get_arg         = lambda arg: getattr(operator.properties, arg, None)
+
+    position = plans.find_entry(plan, op_name, get_arg)
+    if position is not None:
+        telemetry.select(ring, schema.PIE_POSITIONS[position], timed = False)
+
+def get_slot_trie(context, ring):
     '''
-    bl_idname = "PIE_MT_customizable_selections_object_2"
-    bl_label  = "Linkage Marking Menu (Object Mode 2)"
+    DESCRIPTION
+        This function returns the trie of slot paths a marking gesture
+        started in a ring can follow, including its sub-menus
 
-    mode = "object2"
-    common_operators = copy.deepcopy(prefs.OBJECT_OPERATORS)
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+        ring        (in)   The name of the ring at the root
 
+    RETURN
+        A {sector: gestures.TrieNode} dictionary
+    '''
+    trie = plans.get_trie(ring)
+    if trie is None:
+        trie = gestures.build_trie(ring, lambda name: get_menu_class(name).get_slot_entries(context))
+        plans.store_trie(ring, trie)
+    return trie
 
-class PIE_MT_CustomizableSelectionsEdit(PIE_MT_CustomizableSelectionsBase):
+
+class PIE_OT_CallRing(bpy.types.Operator):
     '''
     DESCRIPTION
-        Define the pie menu for Edit Mode
+        Define the operator behind Sub-Menu slots. It opens the pie menu of
+        another ring.
     '''
-    bl_idname = "PIE_MT_customizable_selections_edit"
-    bl_label  = "Linkage Marking Menu (Edit Mode)"
+    bl_idname = "pie.call_ring"
+    bl_label  = "Open Marking Sub-Menu"
+
+    ring: bpy.props.StringProperty() # type: ignore
 
-    mode = "edit"
-    common_operators = prefs.EDIT_OPERATORS
+    def execute(self, context):
+        if self.ring not in schema.RINGS:
+            return {'CANCELLED'}
+
+        record_pie_choice(context, self.bl_idname, {"ring": self.ring}.get)
+        open_pie_menu(self.ring)
+        return {'FINISHED'}
+
+
+class PIE_OT_RunMacro(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator behind Macro slots. The steps run nested inside
+        this operator, so together they make a single undo step instead of
+        one undo snapshot per step. When a step fails the operator is
+        cancelled, so no undo step is made for the macro, and the steps
+        that already ran are pushed as their own undo step, which a single
+        undo rolls back.
+    '''
+    bl_idname  = "pie.run_macro"
+    bl_label   = "Run Marking Menu Macro"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    steps: bpy.props.StringProperty(options = {'HIDDEN'}) # type: ignore
+
+    @profiler.timed("run_macro")
+    def execute(self, context):
+        try:
+            steps = utils.validate_macro_string(self.steps)
+        except opstring.OperatorStringError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        for index, (op_name, op_args) in enumerate(steps, 1):
+            #   Steps run without their invoke, so modal operators such
+            #   as duplicate_move finish before the next step starts
+            try:
+                result = utils.call_operator(op_name, op_args, 'EXEC_DEFAULT')
+                error  = None if 'FINISHED' in result else "cancelled"
+            except RuntimeError as err:
+                error  = str(err).strip()
+
+            if error is None:
+                continue
+
+            self.report({'ERROR'}, f"Macro step {index} ({op_name}) failed: {error}")
+
+            #   Push the steps that ran right away, in this window, instead
+            #   of undoing them later from a timer
+            if index > 1:
+                bpy.ops.ed.undo_push(message = f"Failed Macro (step {index})")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+
+class PIE_OT_RunSlot(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator the pie slots run through while a Recent slot
+        shows the operators of their ring, or the pie menus are drawn over
+        the draw budget. It counts the choice of the slot and then runs the slot's
+        operator the way its pie button would.
+    '''
+    bl_idname  = "pie.run_slot"
+    bl_label   = "Run Marking Menu Slot"
+    bl_options = {'INTERNAL'}
+
+    ring: bpy.props.StringProperty(options = {'HIDDEN'}) # type: ignore
+    slot: bpy.props.IntProperty(options = {'HIDDEN'}) # type: ignore
+
+    @classmethod
+    def description(cls, context, properties):
+        #   Show the tooltip of the slot's own operator
+        entry = get_run_slot_entry(context, properties.ring, properties.slot)
+        rna   = utils.get_operator_rna(entry.op_name) if entry is not None else None
+        return rna.description if rna is not None else ""
+
+    def execute(self, context):
+        entry = get_run_slot_entry(context, self.ring, self.slot)
+        if entry is None:
+            return {'CANCELLED'}
+
+        telemetry.select(self.ring, self.slot)
+        recent.record(self.ring, entry)
+        try:
+            utils.call_operator(entry.op_name, entry.op_args)
+        except RuntimeError as err:
+            self.report({'WARNING'}, f"{entry.label}: {err}")
+            return {'CANCELLED'}
+
+        profiler.operator_done()
+        return {'FINISHED'}
+
+
+def get_run_slot_entry(context, ring, slot):
+    '''
+    DESCRIPTION
+        This function returns the plan entry pie.run_slot runs
+
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+        ring        (in)   The name of the ring
+        slot        (in)   The slot index (compass sector)
+
+    RETURN
+        The PlanEntry, or None if the slot is empty
+    '''
+    if ring not in schema.RINGS or not 0 <= slot < schema.SLOT_COUNT:
+        return None
+    return get_menu_class(ring).get_slot_entries(context)[slot]
+
+
+class PIE_OT_MarkingMenu(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the modal operator for marking gestures. The user presses the
+        hotkey, draws a stroke and releases, and the slot at the end of the
+        stroke runs without any pie being drawn. A stroke can have several
+        segments (e.g. East-then-North) to reach slots inside sub-menus. If
+        the user hesitates inside the dead zone, the visual pie menu is
+        opened instead.
+    '''
+    bl_idname = "pie.marking_menu"
+    bl_label  = "Marking Menu Gesture"
+
+    ring: bpy.props.StringProperty() # type: ignore
+
+    #   Seconds from the last release to the slot's operator returning
+    last_dispatch_latency = 0.0
+
+    def invoke(self, context, event):
+        if self.ring not in schema.RINGS:
+            return {'CANCELLED'}
+
+        preferences = context.preferences.addons[__package__].preferences
+        self.dead_zone = preferences.marking_dead_zone
+        self.trigger   = event.type
+        self.points    = [(event.mouse_x, event.mouse_y)]
+
+        #   Make sure the slot trie is built before the stroke ends
+        get_slot_trie(context, self.ring)
+
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(preferences.marking_delay, window = context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            self.points.append((event.mouse_x, event.mouse_y))
+
+        elif event.type == 'TIMER':
+            #   The user hesitated in the dead zone, show the pie instead
+            start_x, start_y = self.points[0]
+            last_x,  last_y  = self.points[-1]
+            if gestures.classify(last_x - start_x, last_y - start_y, self.dead_zone) is None:
+                self.finish(context)
+                open_pie_menu(self.ring)
+                return {'FINISHED'}
+
+        elif event.type == self.trigger and event.value == 'RELEASE':
+            self.finish(context)
+            return self.dispatch(context)
+
+        elif event.type in {'ESC', 'RIGHTMOUSE'} and event.type != self.trigger:
+            self.finish(context)
+            telemetry.cancel(self.ring)
+            return {'CANCELLED'}
+
+        return {'RUNNING_MODAL'}
+
+    @profiler.timed("marking_dispatch")
+    def dispatch(self, context):
+        '''
+        DESCRIPTION
+            This method runs the slot the stroke ends on, straight from the
+            compiled slot trie
+
+        ARGUMENTS
+            context     (in)   A context object we can use to get info
+
+        RETURN
+            The result set of this operator
+        '''
+        start = time.perf_counter()
+
+        sectors = gestures.segment_stroke(self.points, self.dead_zone)
+        if not sectors:
+            #   A click without a flick opens the pie menu
+            open_pie_menu(self.ring)
+            return {'FINISHED'}
+
+        trie = get_slot_trie(context, self.ring)
+        node = gestures.walk_trie(trie, sectors)
+        if node is None:
+            telemetry.cancel(self.ring)
+            return {'CANCELLED'}
+
+        #   Slots hidden by their condition can not be flicked either
+        entry = node.entry
+        ring, slot = gestures.locate_slot(self.ring, trie, sectors)
+        selection, _ = utils.get_selection_state(context)
+        if not predicates.test(entry.condition, selection):
+            telemetry.cancel(ring, slot)
+            self.report({'INFO'}, f"{entry.label} is not available")
+            return {'CANCELLED'}
+
+        telemetry.select(ring, slot)
+        recent.record(ring, entry)
+
+        #   The stroke stopped on a sub-menu, show it where the stroke ended
+        if entry.submenu is not None:
+            open_pie_menu(entry.submenu)
+            return {'FINISHED'}
+
+        try:
+            utils.call_operator(entry.op_name, entry.op_args)
+        except RuntimeError as err:
+            self.report({'WARNING'}, f"{entry.label}: {err}")
+            return {'CANCELLED'}
+        finally:
+            PIE_OT_MarkingMenu.last_dispatch_latency = time.perf_counter() - start
+
+        profiler.operator_done()
+        return {'FINISHED'}
+
+    def finish(self, context):
+        '''
+        DESCRIPTION
+            This method removes the hesitation timer
+
+        ARGUMENTS
+            context     (in)   A context object we can use to get info
+
+        RETURN
+            None
+        '''
+        context.window_manager.event_timer_remove(self.timer)
+
+
+def call_marking_menu(context, ring):
+    '''
+    DESCRIPTION
+        This function opens a marking menu, either as a gesture or as a
+        visual pie menu depending on the preferences
+
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+        ring        (in)   The name of the ring to open
+
+    RETURN
+        None
+    '''
+    preferences = context.preferences.addons[__package__].preferences
+    prefs.ensure_slots(preferences)
+
+    #   Count the button chosen from the pie menu shown before
+    record_pie_choice(context)
+
+    #   Validate the slots again if add-ons were enabled or disabled
+    utils.check_operator_catalog(context)
+
+    if preferences.use_marking_gestures:
+        bpy.ops.pie.marking_menu('INVOKE_DEFAULT', ring = ring)
+    else:
+        open_pie_menu(ring)
 
 
 class PIE_OT_CallCustomizablePieMenu(bpy.types.Operator):
     '''
     DESCRIPTION
-        Define the operator to call the object1 pie menu or edit pie menu, depending on context
+        Define the operator to call the first pie menu of the current mode.
+        The ring is looked up in schema.RING_BY_MODE.
     '''
     bl_idname = "pie.call_customizable_pie_menu"
     bl_label  = "Call Customizable Pie Menu"
 
+    #   The hotkey variant of this operator in schema.HOTKEYS
+    variant = 1
+
+    @classmethod
+    def poll(cls, context):
+        #   Let the hotkey pass through in modes without a ring
+        return (context.mode, cls.variant) in schema.RING_BY_MODE
+
+    @profiler.timed("call_execute")
     def execute(self, context):
-        if context.mode == 'OBJECT':
-            bpy.ops.wm.call_menu_pie(name="PIE_MT_customizable_selections_object")
-        elif context.mode == 'EDIT_MESH':
-            bpy.ops.wm.call_menu_pie(name="PIE_MT_customizable_selections_edit")
+        profiler.mark_keypress()
+        telemetry.start()
+        call_marking_menu(context, schema.RING_BY_MODE[context.mode, self.variant])
         return {'FINISHED'}
 
 
-class PIE_OT_CallCustomizablePieMenu2(bpy.types.Operator):
+class PIE_OT_CallCustomizablePieMenu2(PIE_OT_CallCustomizablePieMenu):
     '''
     DESCRIPTION
-        Define the operator to call the object1 pie menu
+        Define the operator to call the second pie menu of the current mode
     '''
     bl_idname = "pie.call_customizable_pie_menu_2"
     bl_label  = "Call Customizable Pie Menu 2"
 
+    variant = 2
+
+
+class PIE_OT_ReloadSchema(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that reads the rings, catalogs and bindings
+        from schema.py again, registering only what changed
+    '''
+    bl_idname  = "pie.reload_schema"
+    bl_label   = "Reload Schema"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        try:
+            schema_diff, timings = reload_schema(context)
+        except hotreload.ReloadError as err:
+            for problem in err.problems[:MAX_REPORTED_PROBLEMS]:
+                self.report({'ERROR'}, problem)
+            return {'CANCELLED'}
+
+        steps = ", ".join(f"{step} {seconds * 1000:.1f} ms" for step, seconds in timings.items())
+        if hotreload.is_empty(schema_diff):
+            self.report({'INFO'}, f"The schema did not change ({steps})")
+        else:
+            self.report({'INFO'}, f"Reloaded {len(schema_diff.rings)} menus, {len(schema_diff.catalogs)} catalogs "
+                                  f"and {len(schema_diff.bindings)} hotkeys ({steps})")
+        return {'FINISHED'}
+
+
+class PIE_OT_ClearDiagnostics(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that empties the diagnostics log shown in the
+        preferences
+    '''
+    bl_idname = "pie.clear_diagnostics"
+    bl_label  = "Clear Diagnostics"
+
+    def execute(self, context):
+        diagnostics.clear()
+        return {'FINISHED'}
+
+
+class PIE_OT_DumpProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that writes the profiler timings to a text
+        datablock or to a JSON file, for attaching to tickets
+    '''
+    bl_idname = "pie.dump_profile"
+    bl_label  = "Dump Marking Menu Profile"
+
+    #   The name of the text datablock the timings are written to
+    TEXT_NAME = "MarkingMenu Profile"
+
+    target: bpy.props.EnumProperty(items = (('TEXT', "Text", "Write the timings to a text datablock"),
+                                            ('JSON', "JSON", "Write the timings to a JSON file")), default = 'TEXT') # type: ignore
+    filepath: bpy.props.StringProperty(subtype = 'FILE_PATH', default = "markingmenu_profile.json") # type: ignore
+
+    def execute(self, context):
+        if self.target == 'TEXT':
+            text = bpy.data.texts.get(self.TEXT_NAME) or bpy.data.texts.new(self.TEXT_NAME)
+            text.from_string(f"{profiler.format_report()}\n\n{watchdog.format_status()}")
+            self.report({'INFO'}, f"Profile written to text '{text.name}'")
+            return {'FINISHED'}
+
+        report = { "blender": bpy.app.version_string,
+                   "timings_ms": profiler.get_report(),
+                   "draw_budget": watchdog.get_report() }
+        try:
+            with open(bpy.path.abspath(self.filepath), "w", encoding = "utf-8") as file:
+                json.dump(report, file, indent = 2)
+        except OSError as err:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {err}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Profile written to {self.filepath}")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if self.target == 'JSON':
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        return self.execute(context)
+
+
+class PIE_OT_ResetProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that throws away the profiler timings
+    '''
+    bl_idname = "pie.reset_profile"
+    bl_label  = "Reset Marking Menu Profile"
+
+    def execute(self, context):
+        profiler.reset()
+        watchdog.reset()
+        return {'FINISHED'}
+
+
+class PIE_OT_ApplyUsageSuggestion(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that moves the slots of a ring to the order
+        suggested by the recorded usage
+    '''
+    bl_idname  = "pie.apply_usage_suggestion"
+    bl_label   = "Apply Suggested Order"
+    bl_options = {'INTERNAL'}
+
+    ring: bpy.props.StringProperty(options = {'HIDDEN'}) # type: ignore
+
+    def execute(self, context):
+        if self.ring not in schema.RINGS:
+            return {'CANCELLED'}
+
+        order = telemetry.suggest(self.ring, schema.PIE_POSITIONS)
+        if order is None:
+            return {'CANCELLED'}
+
+        preferences = context.preferences.addons[__package__].preferences
+        prefs.reorder_slots(preferences, self.ring, order)
+
+        #   The counters follow the slots to their new positions
+        telemetry.move(self.ring, order)
+        return {'FINISHED'}
+
+
+class PIE_OT_ResetUsage(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that throws away the recorded usage
+    '''
+    bl_idname  = "pie.reset_usage"
+    bl_label   = "Reset Usage"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        telemetry.reset()
+        return {'FINISHED'}
+
+
+class PIE_OT_ClearRecent(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that forgets the operators shown by the Recent
+        slots
+    '''
+    bl_idname  = "pie.clear_recent"
+    bl_label   = "Clear Recent Operators"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        recent.clear()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+
+class PIE_OT_SaveProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that saves the slots of every ring as a named
+        profile in the extension user directory
+    '''
+    bl_idname  = "pie.save_profile"
+    bl_label   = "Save Profile"
+    bl_options = {'INTERNAL'}
+
+    name: bpy.props.StringProperty(name = "Name") # type: ignore
+
     def execute(self, context):
-        if context.mode == 'OBJECT':
-            bpy.ops.wm.call_menu_pie(name="PIE_MT_customizable_selections_object_2")
+        name = self.name.strip()
+        if not name:
+            self.report({'ERROR'}, "Enter a name for the profile")
+            return {'CANCELLED'}
+
+        preferences = context.preferences.addons[__package__].preferences
+        path = profiles.get_profile_path(prefs.get_profile_directory(), name)
+        try:
+            profiles.save_profile(path, name, prefs.get_profile_slots(preferences))
+        except profiles.ProfileError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        preferences.active_profile = name
+        self.report({'INFO'}, f"Profile '{name}' saved")
         return {'FINISHED'}
 
 
+class PIE_OT_ApplyProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that switches the slots to a named profile.
+        The profile is validated as a whole and written as one batch.
+    '''
+    bl_idname  = "pie.apply_profile"
+    bl_label   = "Apply Profile"
+    bl_options = {'INTERNAL'}
+
+    name: bpy.props.StringProperty(name = "Name") # type: ignore
+
+    def execute(self, context):
+        path = profiles.get_profile_path(prefs.get_profile_directory(), self.name)
+        return apply_profile(self, context, path, self.name)
+
+
+class PIE_OT_DeleteProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that deletes a named profile
+    '''
+    bl_idname  = "pie.delete_profile"
+    bl_label   = "Delete Profile"
+    bl_options = {'INTERNAL'}
+
+    name: bpy.props.StringProperty(name = "Name") # type: ignore
+
+    def execute(self, context):
+        if not profiles.delete_profile(profiles.get_profile_path(prefs.get_profile_directory(), self.name)):
+            self.report({'ERROR'}, f"Could not delete profile '{self.name}'")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+
+class PIE_OT_ImportProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that applies a profile file and keeps a copy of
+        it with the named profiles
+    '''
+    bl_idname  = "pie.import_profile"
+    bl_label   = "Import Profile"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype = 'FILE_PATH') # type: ignore
+    filter_glob: bpy.props.StringProperty(default = "*.json", options = {'HIDDEN'}) # type: ignore
+
+    def execute(self, context):
+        result = apply_profile(self, context, bpy.path.abspath(self.filepath))
+        if 'FINISHED' in result:
+            preferences = context.preferences.addons[__package__].preferences
+            path = profiles.get_profile_path(prefs.get_profile_directory(), preferences.active_profile)
+            try:
+                profiles.save_profile(path, preferences.active_profile, prefs.get_profile_slots(preferences))
+            except profiles.ProfileError as err:
+                self.report({'WARNING'}, str(err))
+        return result
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class PIE_OT_ExportProfile(bpy.types.Operator):
+    '''
+    DESCRIPTION
+        Define the operator that writes the slots of every ring to a
+        profile file, for other seats to import
+    '''
+    bl_idname  = "pie.export_profile"
+    bl_label   = "Export Profile"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype = 'FILE_PATH', default = "markingmenu_profile.json") # type: ignore
+    filter_glob: bpy.props.StringProperty(default = "*.json", options = {'HIDDEN'}) # type: ignore
+
+    def execute(self, context):
+        preferences = context.preferences.addons[__package__].preferences
+        try:
+            profiles.save_profile(bpy.path.abspath(self.filepath), preferences.active_profile,
+                                  prefs.get_profile_slots(preferences))
+        except profiles.ProfileError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Profile written to {self.filepath}")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+def apply_profile(operator, context, path, name = None):
+    '''
+    DESCRIPTION
+        This function validates a profile file and applies it to the
+        preferences in a single batch, reporting every problem when it
+        can not be applied
+
+    ARGUMENTS
+        operator    (in)   The operator to report to
+        context     (in)   A context object we can use to get info
+        path        (in)   The path of the profile file
+        name        (in)   The name to apply the profile as, or None for
+                           the name in the file
+
+    RETURN
+        The result set of the operator
+    '''
+    start = time.perf_counter()
+
+    #   Validate against the operators of the add-ons enabled now
+    utils.check_operator_catalog(context)
+    try:
+        profile_name, rings = profiles.load_profile(path, prefs.validate_profile_slot,
+                                                    utils.get_catalog_key(context))
+    except profiles.ProfileError as err:
+        for problem in err.problems[:MAX_REPORTED_PROBLEMS]:
+            operator.report({'ERROR'}, problem)
+        if len(err.problems) > MAX_REPORTED_PROBLEMS:
+            operator.report({'ERROR'}, f"... and {len(err.problems) - MAX_REPORTED_PROBLEMS} more problems")
+        return {'CANCELLED'}
+
+    preferences = context.preferences.addons[__package__].preferences
+    changed = prefs.apply_profile_slots(preferences, rings)
+    preferences.active_profile = name or profile_name
+
+    operator.report({'INFO'}, f"Profile '{preferences.active_profile}' applied, {changed} slots changed "
+                              f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return {'FINISHED'}
+
+
 class PIE_OT_SearchOperator(bpy.types.Operator):
     '''
     DESCRIPTION
-        Define the operator for the search popup in the preferences menu
+        Define the operator for the search popup in the preferences menu.
+        The search field is ranked by the add-on's own search index.
     '''
     bl_idname   = "pie.search_operator"
     bl_label    = "Search Operator"
-    bl_property = "operator"
 
-    operator: bpy.props.EnumProperty(items = utils.get_all_operators) # type: ignore
-    target_property: bpy.props.StringProperty() # type: ignore
+    operator: bpy.props.StringProperty(name = "Operator", search = utils.search_operators, search_options = {'SUGGESTION'}) # type: ignore
+    target_ring: bpy.props.StringProperty() # type: ignore
+    target_slot: bpy.props.IntProperty() # type: ignore
+
+    def draw(self, context):
+        layout = self.layout
+        layout.activate_init = True
+        layout.prop(self, "operator", text = "", icon = 'VIEWZOOM')
 
     def execute(self, context):
+        if not self.operator:
+            return {'CANCELLED'}
+
         preferences = context.preferences.addons[__package__].preferences
-        setattr(preferences, self.target_property, self.operator)
+        prefs.get_ring_slots(preferences, self.target_ring)[self.target_slot].custom_op = self.operator
         return {'FINISHED'}
 
     def invoke(self, context, event):
-        context.window_manager.invoke_search_popup(self)
-        return {'RUNNING_MODAL'}
+        utils.check_operator_catalog(context)
+        return context.window_manager.invoke_props_dialog(self)
 
 
 ###############################################################################
@@ -284,16 +1120,67 @@ class PIE_OT_SearchOperator(bpy.types.Operator):
 #   Define a list of classes to register with Blender Add-On system
 #
 ###############################################################################
-addon_keymaps = []
-classes = ( PIE_MT_CustomizableSelectionsObject,
-            PIE_MT_CustomizableSelectionsObject2,
-            PIE_MT_CustomizableSelectionsEdit,
+classes = ( *prefs.classes,
+            PIE_OT_CallRing,
+            PIE_OT_RunMacro,
+            PIE_OT_RunSlot,
+            PIE_OT_MarkingMenu,
             PIE_OT_CallCustomizablePieMenu,
             PIE_OT_CallCustomizablePieMenu2,
+            PIE_OT_ReloadSchema,
+            PIE_OT_ClearDiagnostics,
+            PIE_OT_DumpProfile,
+            PIE_OT_ResetProfile,
+            PIE_OT_ApplyUsageSuggestion,
+            PIE_OT_ResetUsage,
+            PIE_OT_ClearRecent,
+            PIE_OT_SaveProfile,
+            PIE_OT_ApplyProfile,
+            PIE_OT_DeleteProfile,
+            PIE_OT_ImportProfile,
+            PIE_OT_ExportProfile,
             PIE_OT_SearchOperator,
             prefs.MarkingMenu )
 
 
+@bpy.app.handlers.persistent
+def on_depsgraph_update(scene, depsgraph):
+    '''
+    DESCRIPTION
+        This is the depsgraph_update_post handler. The selection or the
+        data the operator polls look at may have changed, so the selection
+        is counted again and the cached slot states are thrown away.
+
+    ARGUMENTS
+        scene       (in)   The scene that was updated
+        depsgraph   (in)   The evaluated depsgraph
+
+    RETURN
+        None
+    '''
+    utils.bump_selection_generation()
+    predicates.invalidate()
+
+
+def flush_usage():
+    '''
+    DESCRIPTION
+        This is the bpy.app.timers callback that appends the recorded usage
+        to its file and saves the Recent slot rankings, away from the
+        interaction path
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The seconds until the next flush
+    '''
+    telemetry.flush(store.get_user_path(telemetry.TELEMETRY_FILE))
+    if recent.is_dirty() and store.save_json(recent.RECENT_FILE, recent.to_json()):
+        recent.mark_saved()
+    return telemetry.FLUSH_INTERVAL
+
+
 ###############################################################################
 #
 #   Registartion / Unregistartion functions.
@@ -311,26 +1198,124 @@ def register():
     RETURN
         None
     '''
+    start = time.perf_counter()
+
     #   Register modules
     for cls in classes:
         bpy.utils.register_class(cls)
 
-    #   Register shortcuts for object mode pie menus
-    wm  = bpy.context.window_manager
-    kc  = wm.keyconfigs.addon
+    #   Register the shortcut of every mode, as set in the preferences
+    addon = bpy.context.preferences.addons.get(__package__)
+    kc    = bpy.context.window_manager.keyconfigs.addon
     if kc:
-        #   Register keymap shortcuts for object mode pie menus
-        km  = wm.keyconfigs.addon.keymaps.new(name = 'Object Mode')
-        kmi = km.keymap_items.new('pie.call_customizable_pie_menu', 'LEFTMOUSE', 'PRESS', shift=True, ctrl=True)
-        addon_keymaps.append((km, kmi))
+        keymaps.register(kc, prefs.get_bindings(addon.preferences if addon else None))
 
-        kmi = km.keymap_items.new('pie.call_customizable_pie_menu_2', 'RIGHTMOUSE', 'PRESS', shift=True, ctrl=True)
-        addon_keymaps.append((km, kmi))
+    #   Use the saved settings right away, even if the warm-up never runs
+    if addon is not None:
+        prefs.apply_settings(addon.preferences)
 
-        #   Register keyboard shortcuts for edit mode pie menus
-        km  = wm.keyconfigs.addon.keymaps.new(name='Mesh')
-        kmi = km.keymap_items.new('pie.call_customizable_pie_menu', 'LEFTMOUSE', 'PRESS', shift=True, ctrl=True)
-        addon_keymaps.append((km, kmi))
+    #   Forget the slot states whenever the scene changes
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+
+    #   Write the recorded usage in batches
+    bpy.app.timers.register(flush_usage, first_interval = telemetry.FLUSH_INTERVAL, persistent = True)
+
+    #   Warm up the caches in the background so register() stays fast
+    warmup.start(get_menu_class(ring) for ring in schema.RINGS)
+
+    #   Remember how long registration took as the schema grows
+    prefs.register_time = time.perf_counter() - start
+
+def reload_schema(context):
+    '''
+    DESCRIPTION
+        This function reads schema.py again and registers only what changed
+        since it was loaded: the pie menus of the changed rings, the slot
+        groups of the changed catalogs and the keymap items of the changed
+        bindings. The slots keep their values.
+
+    ARGUMENTS
+        context     (in)   A context object we can use to get info
+
+    RETURN
+        The hotreload.SchemaDiff and a {step: seconds} dictionary of the
+        time each step took
+
+    RAISES
+        hotreload.ReloadError when the schema on disk can not be used
+    '''
+    global classes
+
+    start   = time.perf_counter()
+    timings = {}
+
+    def lap(step):
+        nonlocal start
+        now = time.perf_counter()
+        timings[step] = now - start
+        start = now
+
+    #   Compare the schema on disk before anything is touched
+    old_snapshot = hotreload.take_snapshot(schema)
+    new_schema   = hotreload.load_schema(schema.__file__, __package__)
+    schema_diff  = hotreload.diff(old_snapshot, hotreload.take_snapshot(new_schema))
+    lap("diff")
+
+    if hotreload.is_empty(schema_diff):
+        prefs.reload_time = sum(timings.values())
+        return schema_diff, timings
+
+    #   The slot values are restored by name, the catalog enums may have
+    #   moved their items
+    preferences = context.preferences.addons[__package__].preferences
+    values      = prefs.get_profile_slots(preferences)
+
+    importlib.reload(schema)
+    lap("schema")
+
+    #   Generate the pie menus of the changed rings again when opened
+    for ring in schema_diff.rings:
+        cls = menu_classes.pop(ring, None)
+        if cls in registered_menu_classes:
+            bpy.utils.unregister_class(cls)
+            registered_menu_classes.remove(cls)
+        plans.invalidate(ring)
+    predicates.invalidate()
+    lap("menus")
+
+    #   Register the preferences again with the new slot groups, and put
+    #   back the slots whose items are still in their catalog
+    retyped = any(old_snapshot.rings[ring].catalog != schema.RINGS[ring].catalog
+                  for ring in schema_diff.rings if ring in old_snapshot.rings and ring in schema.RINGS)
+    if schema_diff.catalogs or schema_diff.added_rings or schema_diff.removed_rings or retyped:
+        old_classes = set(prefs.classes)
+        prefs.rebuild_property_groups(schema_diff.catalogs)
+        classes = (*prefs.classes, *(cls for cls in classes if cls not in old_classes))
+
+        preferences = context.preferences.addons[__package__].preferences
+        rings = {}
+        for ring, slots in values.items():
+            if ring in schema.RINGS:
+                catalog = schema.CATALOGS[schema.RINGS[ring].catalog]
+                rings[ring] = tuple(slot if slot.item in catalog else profiles.EMPTY_SLOT for slot in slots)
+        prefs.apply_profile_slots(preferences, rings)
+    else:
+        prefs.set_ring_properties()
+    lap("preferences")
+
+    #   Replace the keymap items of the changed bindings
+    kc = context.window_manager.keyconfigs.addon
+    prefs.ensure_bindings(preferences)
+    bindings = {(binding.mode, binding.variant): binding for binding in prefs.get_bindings(preferences) if binding}
+    for mode, variant in schema_diff.bindings:
+        keymaps.remove(mode, variant)
+        if kc and (mode, variant) in bindings:
+            keymaps.add(kc, bindings[mode, variant])
+    keymaps.invalidate_index()
+    lap("keymaps")
+
+    prefs.reload_time = sum(timings.values())
+    return schema_diff, timings
 
 def unregister():
     '''
@@ -344,17 +1329,35 @@ def unregister():
     RETURN
         None
     '''
-    #   Unregister modules in reverse order to avoid dependency issues
+    #   Stop the background warm-up if it is still running
+    warmup.cancel()
+
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+
+    #   Write the usage and rankings recorded since the last flush
+    record_pie_choice(bpy.context)
+    if bpy.app.timers.is_registered(flush_usage):
+        bpy.app.timers.unregister(flush_usage)
+    flush_usage()
+
+    #   Unregister the pie menus that were opened and then the modules
+    #   in reverse order to avoid dependency issues
+    for cls in reversed(registered_menu_classes):
+        bpy.utils.unregister_class(cls)
+    registered_menu_classes.clear()
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
-    #   Remove keyboard shortcuts
-    wm = bpy.context.window_manager
-    kc = wm.keyconfigs.addon
-    if kc:
-        for km, kmi in addon_keymaps:
-            km.keymap_items.remove(kmi)
-    addon_keymaps.clear()
+    #   Remove exactly the keyboard shortcuts that were added
+    keymaps.unregister()
+
+    #   Throw away the compiled draw plans and cached operator data
+    plans.invalidate()
+    predicates.invalidate()
+    utils.clear_validated_operators()
+    utils.clear_operator_items()
 
 ###############################################################################
 #
@@ -0,0 +1,153 @@
+################################################################################
+#
+#   catalog.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the operator catalog class for the Marking Menus
+#       Blender Add-on. A catalog is the list of operators a marking menu
+#       mode offers in its preferences, indexed so labels, descriptions and
+#       icons can be looked up without scanning the list. This module does
+#       not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+
+###############################################################################
+#
+#   Operator Catalog Class
+#
+###############################################################################
+class OperatorCatalog:
+    '''
+    DESCRIPTION
+        This class holds the operators offered by a marking menu mode. It is
+        built from (identifier, label, description[, icon]) tuples and keeps
+        dictionary indexes for every lookup the add-on needs.
+    '''
+
+    def __init__(self, name, operators):
+        '''
+        DESCRIPTION
+            This method builds the catalog and its indexes
+
+        ARGUMENTS
+            name        (in)    The name of the catalog
+            operators   (in)    A sequence of (identifier, label,
+                                description[, icon]) tuples
+
+        RETURN
+            None
+        '''
+        self.name = name
+
+        enum_items   = []
+        labels       = {}
+        descriptions = {}
+        icons        = {}
+        identifiers  = {}
+
+        for index, operator in enumerate(operators):
+            identifier, label, description = operator[:3]
+            icon = operator[3] if len(operator) > 3 else 'NONE'
+
+            if identifier in labels:
+                raise ValueError(f"Operator '{identifier}' is in the {name} catalog more than once")
+
+            enum_items.append((identifier, label, description, icon, index))
+            labels[identifier]       = label
+            descriptions[identifier] = description
+            icons[identifier]        = icon
+            identifiers.setdefault(label, identifier)
+
+        #   The items for a bpy.props.EnumProperty. Blender copies static
+        #   enum items at registration, but we keep them for the life of
+        #   the catalog anyway.
+        self.enum_items = tuple(enum_items)
+
+        self._labels       = labels
+        self._descriptions = descriptions
+        self._icons        = icons
+        self._identifiers  = identifiers
+
+    def __contains__(self, identifier):
+        return identifier in self._labels
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def label(self, identifier, default = None):
+        '''
+        DESCRIPTION
+            This method returns the label of an operator
+
+        ARGUMENTS
+            identifier  (in)    The operator string in the catalog
+            default     (in)    The value to return if it is not found
+
+        RETURN
+            The label of the operator
+        '''
+        return self._labels.get(identifier, default)
+
+    def description(self, identifier, default = None):
+        '''
+        DESCRIPTION
+            This method returns the description of an operator
+
+        ARGUMENTS
+            identifier  (in)    The operator string in the catalog
+            default     (in)    The value to return if it is not found
+
+        RETURN
+            The description of the operator
+        '''
+        return self._descriptions.get(identifier, default)
+
+    def icon(self, identifier, default = 'NONE'):
+        '''
+        DESCRIPTION
+            This method returns the icon of an operator
+
+        ARGUMENTS
+            identifier  (in)    The operator string in the catalog
+            default     (in)    The value to return if it is not found
+
+        RETURN
+            The icon name of the operator
+        '''
+        return self._icons.get(identifier, default)
+
+    def identifier(self, label, default = None):
+        '''
+        DESCRIPTION
+            This method is the reverse lookup of label, it returns the
+            operator string of the first operator with the given label
+
+        ARGUMENTS
+            label       (in)    The label to look up
+            default     (in)    The value to return if it is not found
+
+        RETURN
+            The operator string
+        '''
+        return self._identifiers.get(label, default)
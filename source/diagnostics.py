@@ -0,0 +1,148 @@
+################################################################################
+#
+#   diagnostics.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the diagnostics log of the Marking Menus Blender
+#       Add-on. Problems found while compiling the pie slots are kept in a
+#       bounded buffer keyed by (mode, slot, error). Each distinct problem is
+#       printed to the console once while it is in the buffer, and repeats
+#       only bump its count and timestamp. The buffer is shown in the
+#       preferences.
+#
+#       This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  time
+
+from    collections import OrderedDict
+
+###############################################################################
+#
+#   Diagnostics Definitions
+#
+###############################################################################
+
+#   The most distinct problems kept, the oldest is dropped first
+MAX_ENTRIES = 64
+
+
+class Diagnostic:
+    '''
+    DESCRIPTION
+        This class is a single problem in the diagnostics log
+    '''
+    __slots__ = ("mode", "slot", "error", "count", "first", "last")
+
+    def __init__(self, mode, slot, error, now):
+        self.mode  = mode
+        self.slot  = slot
+        self.error = error
+        self.count = 0
+        self.first = now
+        self.last  = now
+
+
+#   The logged problems keyed by (mode, slot, error), oldest first. A
+#   problem is printed to the console when it enters the log, so a problem
+#   that was dropped as the oldest is printed again when it comes back.
+_entries = OrderedDict()
+
+
+###############################################################################
+#
+#   Diagnostics Functions
+#
+###############################################################################
+def report(mode, slot, error):
+    '''
+    DESCRIPTION
+        This function logs a problem. A new problem is printed to the
+        console, a known one only has its count and timestamp updated.
+
+    ARGUMENTS
+        mode        (in)    The ring the problem was found in
+        slot        (in)    The slot index (compass sector), or None
+        error       (in)    The error message
+
+    RETURN
+        The Diagnostic of the problem
+    '''
+    key = (mode, slot, error)
+    now = time.time()
+
+    entry = _entries.get(key)
+    if entry is None:
+        if len(_entries) >= MAX_ENTRIES:
+            _entries.popitem(last = False)
+        entry = _entries[key] = Diagnostic(mode, slot, error, now)
+        print(f"WARNING: Marking menu {describe(entry)}")
+    else:
+        _entries.move_to_end(key)
+
+    entry.count += 1
+    entry.last   = now
+    return entry
+
+
+def describe(entry):
+    '''
+    DESCRIPTION
+        This function formats where a problem was found and what it is
+
+    ARGUMENTS
+        entry       (in)    The Diagnostic
+
+    RETURN
+        A one line string
+    '''
+    if entry.slot is None:
+        return f"{entry.mode}: {entry.error}"
+    return f"{entry.mode} slot {entry.slot + 1}: {entry.error}"
+
+
+def get_entries():
+    '''
+    DESCRIPTION
+        This function returns the logged problems
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A list of Diagnostic, the most recent first
+    '''
+    return list(reversed(_entries.values()))
+
+
+def clear():
+    '''
+    DESCRIPTION
+        This function empties the log. Problems found again afterwards are
+        printed to the console again.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    _entries.clear()
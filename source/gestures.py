@@ -0,0 +1,230 @@
+################################################################################
+#
+#   gestures.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the gesture classification of the Marking Menus
+#       Blender Add-on. A mouse stroke is classified into one of the eight
+#       compass sectors of a pie. Sectors are numbered clockwise from North,
+#       which is the same numbering as the pie slots in the preferences:
+#
+#           Sector  Compass         Sector  Compass
+#           ------  ---------       ------  ---------
+#             0     North             4     South
+#             1     NorthEast         5     SouthWest
+#             2     East              6     West
+#             3     SouthEast         7     NorthWest
+#
+#       This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  math
+
+from    collections import namedtuple
+
+###############################################################################
+#
+#   Gesture Definitions
+#
+###############################################################################
+
+#   The number of compass sectors in a pie
+SECTOR_COUNT = 8
+
+#   The names of the sectors, clockwise from North
+SECTOR_NAMES = ("North", "NorthEast", "East", "SouthEast",
+                "South", "SouthWest", "West", "NorthWest")
+
+#   Strokes shorter than this many pixels are not classified
+DEAD_ZONE = 20
+
+#   The deepest chain of sub-menus a single stroke can follow
+MAX_DEPTH = 3
+
+#   A node of the slot trie. children maps a sector to the next TrieNode
+#   and is empty unless the entry opens a sub-menu.
+TrieNode = namedtuple("TrieNode", ("entry", "children"))
+
+
+###############################################################################
+#
+#   Gesture Functions
+#
+###############################################################################
+def classify(dx, dy, dead_zone = DEAD_ZONE):
+    '''
+    DESCRIPTION
+        This function classifies a stroke into a compass sector
+
+    ARGUMENTS
+        dx          (in)    The accumulated horizontal movement in pixels,
+                            positive to the right
+        dy          (in)    The accumulated vertical movement in pixels,
+                            positive upwards (Blender window coordinates)
+        dead_zone   (in)    The shortest stroke that is classified
+
+    RETURN
+        The sector index (0 - 7), or None when the stroke is in the
+        dead zone
+    '''
+    if dx * dx + dy * dy < dead_zone * dead_zone:
+        return None
+
+    #   atan2(dx, dy) is 0 for North and grows clockwise
+    angle = math.atan2(dx, dy)
+    return round(angle * SECTOR_COUNT / math.tau) % SECTOR_COUNT
+
+
+def segment_stroke(points, dead_zone = DEAD_ZONE):
+    '''
+    DESCRIPTION
+        This function splits a stroke into the compass sectors of its
+        straight segments, e.g. [2, 0] for East-then-North. The stroke is
+        walked in steps of half the dead zone. Runs of steps shorter than
+        the dead zone are treated as noise.
+
+    ARGUMENTS
+        points      (in)    The sequence of (x, y) mouse positions, starting
+                            with the press position
+        dead_zone   (in)    The shortest segment that is classified
+
+    RETURN
+        A list of sector indexes, empty when the stroke is in the dead zone
+    '''
+    if len(points) < 2:
+        return []
+
+    step = dead_zone / 2
+    runs = []
+
+    anchor_x, anchor_y = points[0]
+    for x, y in points[1:]:
+        dx = x - anchor_x
+        dy = y - anchor_y
+        length = math.hypot(dx, dy)
+        if length < step:
+            continue
+
+        sector = classify(dx, dy, 0)
+        if runs and runs[-1][0] == sector:
+            runs[-1][1] += length
+        else:
+            runs.append([sector, length])
+        anchor_x, anchor_y = x, y
+
+    sectors = []
+    for sector, length in runs:
+        if length >= dead_zone and (not sectors or sectors[-1] != sector):
+            sectors.append(sector)
+
+    #   A wobbly single stroke may not have a long enough run
+    if not sectors:
+        sector = classify(points[-1][0] - points[0][0], points[-1][1] - points[0][1], dead_zone)
+        if sector is not None:
+            sectors.append(sector)
+
+    return sectors
+
+
+def build_trie(ring, get_slot_entries, max_depth = MAX_DEPTH):
+    '''
+    DESCRIPTION
+        This function builds the trie of slot paths that can be reached
+        from a ring with a single stroke
+
+    ARGUMENTS
+        ring                (in)    The name of the ring at the root
+        get_slot_entries    (in)    A function returning the 8 plan entries
+                                    of a ring, indexed by sector. Entries
+                                    that open a sub-menu have the name of
+                                    its ring in their submenu field.
+        max_depth           (in)    The deepest chain of sub-menus to follow
+
+    RETURN
+        A {sector: TrieNode} dictionary
+    '''
+    children = {}
+    for sector, entry in enumerate(get_slot_entries(ring)):
+        if entry is None:
+            continue
+
+        submenu = {}
+        if entry.submenu is not None and max_depth > 1:
+            submenu = build_trie(entry.submenu, get_slot_entries, max_depth - 1)
+        children[sector] = TrieNode(entry, submenu)
+    return children
+
+
+def walk_trie(trie, sectors):
+    '''
+    DESCRIPTION
+        This function follows the sectors of a stroke through a slot trie.
+        Segments after a slot that does not open a sub-menu are ignored.
+
+    ARGUMENTS
+        trie        (in)    The {sector: TrieNode} dictionary of the root
+        sectors     (in)    The sectors of the stroke segments
+
+    RETURN
+        The TrieNode reached, or None when the stroke does not match
+    '''
+    node     = None
+    children = trie
+    for sector in sectors:
+        if node is not None and not node.children:
+            break
+
+        node = children.get(sector)
+        if node is None:
+            return None
+        children = node.children
+    return node
+
+
+def locate_slot(ring, trie, sectors):
+    '''
+    DESCRIPTION
+        This function follows the sectors of a stroke through a slot trie
+        like walk_trie, and returns where the slot it reaches lives
+
+    ARGUMENTS
+        ring        (in)    The name of the ring at the root of the trie
+        trie        (in)    The {sector: TrieNode} dictionary of the root
+        sectors     (in)    The sectors of the stroke segments
+
+    RETURN
+        A (ring, sector) tuple, or None when the stroke does not match
+    '''
+    node     = None
+    location = None
+    children = trie
+    for sector in sectors:
+        if node is not None:
+            if not node.children:
+                break
+            ring = node.entry.submenu
+
+        node = children.get(sector)
+        if node is None:
+            return None
+        location = (ring, sector)
+        children = node.children
+    return location
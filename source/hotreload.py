@@ -0,0 +1,194 @@
+################################################################################
+#
+#   hotreload.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the schema reload of the Marking Menus Blender
+#       Add-on. The rings, catalogs and bindings in schema.py are read
+#       again from disk and compared with the ones in use, so the add-on
+#       only has to register again the pie menus, slot property groups and
+#       keymap items that changed, instead of running unregister() and
+#       register().
+#
+#       The new schema is executed in a module of its own first, so a
+#       mistake in the file leaves the schema in use untouched.
+#
+#       This module does not depend on bpy, the add-on applies the
+#       differences.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  importlib.util
+
+from    collections import namedtuple
+
+###############################################################################
+#
+#   Reload Definitions
+#
+###############################################################################
+
+#   The parts of a schema the add-on registers something for
+Snapshot = namedtuple("Snapshot", ("rings", "catalogs", "bindings"))
+
+#   The differences between two snapshots. rings are the rings whose pie
+#   menu class must be generated again, catalogs the catalogs whose slot
+#   property groups must be, and bindings the (mode, variant) pairs whose
+#   keymap item must be. added_rings and removed_rings change the
+#   properties of the preferences.
+SchemaDiff = namedtuple("SchemaDiff", ("rings", "catalogs", "bindings", "added_rings", "removed_rings"))
+
+
+class ReloadError(Exception):
+    '''
+    DESCRIPTION
+        This exception is raised when the schema on disk can not be used.
+        It holds every problem found.
+    '''
+    def __init__(self, problems):
+        self.problems = list(problems)
+        super().__init__("; ".join(self.problems))
+
+
+###############################################################################
+#
+#   Reload Functions
+#
+###############################################################################
+def take_snapshot(schema):
+    '''
+    DESCRIPTION
+        This function records the parts of a schema module that are
+        registered with Blender
+
+    ARGUMENTS
+        schema      (in)    The schema module
+
+    RETURN
+        A Snapshot
+    '''
+    rings    = dict(schema.RINGS)
+    catalogs = {name: operators.enum_items for name, operators in schema.CATALOGS.items()}
+    bindings = {(binding.mode, binding.variant): (binding, schema.HOTKEYS.get(binding.variant))
+                for binding in schema.BINDINGS}
+    return Snapshot(rings, catalogs, bindings)
+
+
+def load_schema(path, package):
+    '''
+    DESCRIPTION
+        This function executes a schema file in a new module, leaving the
+        schema module in use as it is
+
+    ARGUMENTS
+        path        (in)    The path of schema.py
+        package     (in)    The package of the add-on, for the relative
+                            imports of the schema
+
+    RETURN
+        The new module
+
+    RAISES
+        ReloadError when the file fails to execute or is not consistent
+    '''
+    try:
+        spec   = importlib.util.spec_from_file_location(f"{package}.schema", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as err:
+        raise ReloadError([f"{type(err).__name__}: {err}"]) from None
+
+    problems = check_schema(module)
+    if problems:
+        raise ReloadError(problems)
+    return module
+
+
+def check_schema(schema):
+    '''
+    DESCRIPTION
+        This function checks that the rings, bindings and catalogs of a
+        schema refer to each other correctly
+
+    ARGUMENTS
+        schema      (in)    The schema module
+
+    RETURN
+        A list of problems, empty if the schema can be used
+    '''
+    problems = []
+    for ring in schema.RINGS.values():
+        if ring.catalog not in schema.CATALOGS:
+            problems.append(f"Ring '{ring.name}' uses the unknown catalog '{ring.catalog}'")
+
+    for binding in schema.BINDINGS:
+        if binding.ring not in schema.RINGS:
+            problems.append(f"Binding {binding.mode} opens the unknown ring '{binding.ring}'")
+        if binding.variant not in schema.HOTKEYS:
+            problems.append(f"Binding {binding.mode} uses the unknown hotkey {binding.variant}")
+
+    for ring in schema.DEFAULTS:
+        if ring not in schema.RINGS:
+            problems.append(f"Defaults of the unknown ring '{ring}'")
+    return problems
+
+
+def diff(old, new):
+    '''
+    DESCRIPTION
+        This function compares two snapshots
+
+    ARGUMENTS
+        old         (in)    The Snapshot of the schema in use
+        new         (in)    The Snapshot of the schema on disk
+
+    RETURN
+        A SchemaDiff
+    '''
+    catalogs = {name for name in old.catalogs.keys() | new.catalogs.keys()
+                if old.catalogs.get(name) != new.catalogs.get(name)}
+
+    #   A pie menu holds its catalog, so it changes with it
+    rings = set()
+    for name in old.rings.keys() | new.rings.keys():
+        ring = old.rings.get(name)
+        if ring != new.rings.get(name) or ring.catalog in catalogs:
+            rings.add(name)
+
+    bindings = {key for key in old.bindings.keys() | new.bindings.keys()
+                if old.bindings.get(key) != new.bindings.get(key)}
+
+    return SchemaDiff(rings, catalogs, bindings,
+                      new.rings.keys() - old.rings.keys(),
+                      old.rings.keys() - new.rings.keys())
+
+
+def is_empty(schema_diff):
+    '''
+    DESCRIPTION
+        This function tells whether a reload has anything to register
+
+    ARGUMENTS
+        schema_diff (in)    The SchemaDiff
+
+    RETURN
+        True if nothing changed
+    '''
+    return not (schema_diff.rings or schema_diff.catalogs or schema_diff.bindings)
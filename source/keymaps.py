@@ -0,0 +1,400 @@
+################################################################################
+#
+#   keymaps.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the keymap bindings of the Marking Menus Blender
+#       Add-on. Every binding of a mode adds exactly one keymap item to the
+#       add-on keyconfig, and the registry remembers that item so it can be
+#       rebound or removed again without touching anything else.
+#
+#       It also keeps an index of every keymap item of the active
+#       keyconfigs, keyed by (keymap, event type, modifiers), so the
+#       preferences can look up the other operators that use a binding's
+#       key in constant time. The index is updated one keymap at a time:
+#       a keymap is only indexed again when its signature changed.
+#
+#       This module does not depend on bpy, the keyconfigs are passed in.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  time
+
+from    collections import namedtuple
+
+from    . import schema
+
+###############################################################################
+#
+#   Keymap Definitions
+#
+###############################################################################
+
+#   The modifier keys of a keymap item, in the order they are shown
+MODIFIERS = ("shift", "ctrl", "alt", "oskey")
+
+#   The keymaps that are active in the 3D viewport in every mode. An item
+#   in one of them with the same key as a binding conflicts with it too.
+SHARED_KEYMAPS = ("Window", "Screen", "3D View Generic", "3D View", "Object Non-modal")
+
+#   Seconds before the index is checked for changed keymaps again
+REFRESH_INTERVAL = 2.0
+
+#   The key of a binding. modifiers is a tuple of names from MODIFIERS.
+KeyBinding = namedtuple("KeyBinding", ("mode", "variant", "keymap", "idname", "event", "modifiers"))
+
+#   The registered keymap items, keyed by (mode, variant), (km, kmi)
+_registered = {}
+
+#   The index, {(keymap, event type, modifiers): {idname: count}}.
+#   modifiers is None for items that accept any modifier.
+_index = {}
+
+#   The indexed keymaps, {(keyconfig, keymap): (signature, index keys)}
+_indexed = {}
+
+#   The time.monotonic() of the last refresh, None to refresh on the next
+#   lookup
+_refreshed = None
+
+#   The idnames of the add-on's own items when the index was built
+_own_idnames = frozenset()
+
+
+###############################################################################
+#
+#   Binding Functions
+#
+###############################################################################
+def get_default_bindings():
+    '''
+    DESCRIPTION
+        This function returns the bindings of every mode in the schema,
+        with the keys of their hotkey variant
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A list of KeyBinding in binding order
+    '''
+    bindings = []
+    for binding in schema.BINDINGS:
+        hotkey = schema.HOTKEYS[binding.variant]
+        bindings.append(KeyBinding(binding.mode, binding.variant, binding.keymap,
+                                   hotkey.idname, hotkey.event, tuple(hotkey.modifiers)))
+    return bindings
+
+
+def add(keyconfig, binding):
+    '''
+    DESCRIPTION
+        This function adds the keymap item of a binding, replacing the item
+        the binding added before
+
+    ARGUMENTS
+        keyconfig   (in)    The add-on keyconfig
+        binding     (in)    The KeyBinding
+
+    RETURN
+        The bpy.types.KeyMapItem
+    '''
+    remove(binding.mode, binding.variant)
+
+    km  = keyconfig.keymaps.new(name = binding.keymap)
+    kmi = km.keymap_items.new(binding.idname, binding.event, 'PRESS',
+                              **{modifier: True for modifier in binding.modifiers})
+    _registered[binding.mode, binding.variant] = (km, kmi)
+    return kmi
+
+
+def remove(mode, variant):
+    '''
+    DESCRIPTION
+        This function removes the keymap item a binding added, and nothing
+        else
+
+    ARGUMENTS
+        mode        (in)    The context.mode of the binding
+        variant     (in)    The hotkey variant of the binding
+
+    RETURN
+        True if an item was removed
+    '''
+    entry = _registered.pop((mode, variant), None)
+    if entry is None:
+        return False
+
+    km, kmi = entry
+    try:
+        km.keymap_items.remove(kmi)
+    except (ReferenceError, RuntimeError):
+        #   The keyconfig was freed or the item removed by Blender already
+        return False
+    return True
+
+
+def register(keyconfig, bindings):
+    '''
+    DESCRIPTION
+        This function adds the keymap items of the bindings
+
+    ARGUMENTS
+        keyconfig   (in)    The add-on keyconfig
+        bindings    (in)    An iterable of KeyBinding, None to skip one
+
+    RETURN
+        None
+    '''
+    for binding in bindings:
+        if binding is not None:
+            add(keyconfig, binding)
+
+
+def unregister():
+    '''
+    DESCRIPTION
+        This function removes every keymap item the bindings added, in the
+        reverse order, and forgets the index
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _refreshed
+
+    for mode, variant in reversed(list(_registered)):
+        remove(mode, variant)
+
+    _index.clear()
+    _indexed.clear()
+    _refreshed = None
+
+
+def get_own_idnames():
+    '''
+    DESCRIPTION
+        This function returns the operators of the add-on's own keymap
+        items, which are never a conflict. They are read from the schema in
+        use, which changes when it is reloaded.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A frozenset of operator idnames
+    '''
+    return frozenset(hotkey.idname for hotkey in schema.HOTKEYS.values())
+
+
+def get_registered():
+    '''
+    DESCRIPTION
+        This function returns the registered keymap items
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A {(mode, variant): (km, kmi)} dictionary
+    '''
+    return dict(_registered)
+
+
+###############################################################################
+#
+#   Conflict Index Functions
+#
+###############################################################################
+def get_item_key(kmi):
+    '''
+    DESCRIPTION
+        This function returns the event type and modifiers of a keymap item
+
+    ARGUMENTS
+        kmi         (in)    The bpy.types.KeyMapItem
+
+    RETURN
+        The (event type, modifiers) tuple, modifiers is None if the item
+        accepts any modifier
+    '''
+    if kmi.any:
+        return kmi.type, None
+
+    modifiers = []
+    for modifier in MODIFIERS:
+        value = getattr(kmi, modifier)
+        if value == -1:
+            return kmi.type, None
+        if value:
+            modifiers.append(modifier)
+    return kmi.type, tuple(modifiers)
+
+
+def get_signature(km, full):
+    '''
+    DESCRIPTION
+        This function returns the signature of a keymap, which changes when
+        its items change
+
+    ARGUMENTS
+        km          (in)    The bpy.types.KeyMap
+        full        (in)    True to compare every item, False to only count
+                            the items. Counting is enough for the keymaps
+                            no binding uses, which change when an add-on
+                            adds or removes items.
+
+    RETURN
+        A hashable signature
+    '''
+    if not full:
+        return len(km.keymap_items)
+    return tuple((kmi.idname, kmi.active, get_item_key(kmi)) for kmi in km.keymap_items)
+
+
+def refresh_index(keyconfigs, force = False):
+    '''
+    DESCRIPTION
+        This function brings the index up to date with the keyconfigs. Only
+        the keymaps whose signature changed are indexed again, and the
+        keyconfigs are checked at most every REFRESH_INTERVAL seconds.
+
+    ARGUMENTS
+        keyconfigs  (in)    The keyconfigs to index, e.g. the user and the
+                            add-on keyconfig
+        force       (in)    True to check the keyconfigs now
+
+    RETURN
+        The number of keymaps indexed again
+    '''
+    global _refreshed, _own_idnames
+
+    now = time.monotonic()
+    if not force and _refreshed is not None and now - _refreshed < REFRESH_INTERVAL:
+        return 0
+    _refreshed = now
+
+    #   The keymaps indexed before the hotkeys changed left out the old
+    #   operators, index everything again
+    own_idnames = get_own_idnames()
+    if own_idnames != _own_idnames:
+        _index.clear()
+        _indexed.clear()
+        _own_idnames = own_idnames
+
+    watched = set(SHARED_KEYMAPS)
+    watched.update(binding.keymap for binding in schema.BINDINGS)
+
+    changed = 0
+    seen    = set()
+    for kc in keyconfigs:
+        if kc is None:
+            continue
+        for km in kc.keymaps:
+            if km.is_modal:
+                continue
+
+            name = (kc.name, km.name)
+            seen.add(name)
+            signature = get_signature(km, km.name in watched)
+            indexed   = _indexed.get(name)
+            if indexed is not None and indexed[0] == signature:
+                continue
+
+            _unindex(name)
+            keys = []
+            for kmi in km.keymap_items:
+                if kmi.active and kmi.idname not in own_idnames:
+                    key = (km.name, *get_item_key(kmi))
+                    idnames = _index.setdefault(key, {})
+                    idnames[kmi.idname] = idnames.get(kmi.idname, 0) + 1
+                    keys.append((key, kmi.idname))
+            _indexed[name] = (signature, keys)
+            changed += 1
+
+    #   Forget the keymaps of keyconfigs that are gone
+    for name in [name for name in _indexed if name not in seen]:
+        _unindex(name)
+        changed += 1
+    return changed
+
+
+def _unindex(name):
+    '''
+    DESCRIPTION
+        This function takes the items of a keymap out of the index
+
+    ARGUMENTS
+        name        (in)    The (keyconfig, keymap) name of the keymap
+
+    RETURN
+        None
+    '''
+    indexed = _indexed.pop(name, None)
+    if indexed is None:
+        return
+
+    for key, idname in indexed[1]:
+        idnames = _index[key]
+        idnames[idname] -= 1
+        if not idnames[idname]:
+            del idnames[idname]
+        if not idnames:
+            del _index[key]
+
+
+def invalidate_index():
+    '''
+    DESCRIPTION
+        This function makes the next refresh_index() check the keyconfigs
+        again, e.g. after a binding changed
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _refreshed
+
+    _refreshed = None
+
+
+def find_conflicts(binding):
+    '''
+    DESCRIPTION
+        This function looks up the other operators that use the key of a
+        binding, in its keymap and in the keymaps shared by every mode
+
+    ARGUMENTS
+        binding     (in)    The KeyBinding
+
+    RETURN
+        A sorted list of (keymap, idname) tuples
+    '''
+    conflicts = set()
+    modifiers = tuple(modifier for modifier in MODIFIERS if modifier in binding.modifiers)
+    for km_name in (binding.keymap, *SHARED_KEYMAPS):
+        for key in ((km_name, binding.event, modifiers), (km_name, binding.event, None)):
+            for idname in _index.get(key, ()):
+                conflicts.add((km_name, idname))
+    return sorted(conflicts)
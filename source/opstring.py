@@ -0,0 +1,296 @@
+################################################################################
+#
+#   opstring.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the operator string parser for the Marking Menus
+#       Blender Add-on. Operator strings are written the same way they are
+#       called from python, for example:
+#
+#           object.select_all(action='TOGGLE')
+#           object.subdivision_set(level=2, relative=False)
+#           transform.rotate(value=1.5708, orient_axis=Z)
+#
+#       Values are returned as typed python values. Bare names are treated
+#       as enum identifiers. This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  ast
+
+from    functools import lru_cache
+
+from    . import profiler
+
+###############################################################################
+#
+#   Parser Definitions
+#
+###############################################################################
+
+#   The maximum number of distinct operator strings kept in the memo cache
+PARSE_CACHE_SIZE = 1024
+
+#   Prefix that may be copied from the python tooltips of Blender
+BPY_OPS_PREFIX = "bpy.ops."
+
+
+class OperatorStringError(ValueError):
+    '''
+    DESCRIPTION
+        This exception is raised when an operator string can not be parsed
+    '''
+    pass
+
+
+###############################################################################
+#
+#   Parser Functions
+#
+###############################################################################
+#   The profiler sits inside the memo cache, so it only times the strings
+#   that were actually parsed
+@lru_cache(maxsize = PARSE_CACHE_SIZE)
+@profiler.timed("parse_operator_string_miss")
+def parse_operator_string(op_string):
+    '''
+    DESCRIPTION
+        This function parses an operator string into its parts (op_name,
+        and op_args). Results are memoized by the raw string, so parsing
+        the same slot again costs a single cache lookup.
+
+    ARGUMENTS
+        op_string   (in)    The operator string to parse
+
+    RETURN
+        op_name (str)       The name of the operator
+        op_args (tuple)     A tuple of (name, value) pairs in the order
+                            they were written
+
+    RAISES
+        OperatorStringError when the string is not a valid operator call
+    '''
+    text = op_string.strip()
+    if text.startswith(BPY_OPS_PREFIX):
+        text = text[len(BPY_OPS_PREFIX):]
+
+    if not text:
+        raise OperatorStringError("Operator string is empty")
+
+    try:
+        node = ast.parse(text, mode = "eval").body
+    except SyntaxError as err:
+        raise OperatorStringError(f"Invalid operator string '{op_string}': {err.msg} (column {err.offset})") from None
+
+    #   Seperate the operator name from its arguments
+    if isinstance(node, ast.Call):
+        func = node.func
+        if node.args:
+            raise OperatorStringError(f"Operator '{ast.unparse(func)}' only accepts keyword arguments")
+        keywords = node.keywords
+    else:
+        func = node
+        keywords = []
+
+    op_name = _operator_name(func, op_string)
+
+    op_args = []
+    seen    = set()
+    for keyword in keywords:
+        if keyword.arg is None:
+            raise OperatorStringError(f"Operator '{op_name}' does not accept '**' arguments")
+        if keyword.arg in seen:
+            raise OperatorStringError(f"Operator '{op_name}' has argument '{keyword.arg}' more than once")
+        seen.add(keyword.arg)
+        op_args.append((keyword.arg, _literal_value(keyword.value, op_name, keyword.arg)))
+
+    return op_name, tuple(op_args)
+
+
+@lru_cache(maxsize = PARSE_CACHE_SIZE)
+def split_macro_string(macro_string):
+    '''
+    DESCRIPTION
+        This function splits a macro into the operator strings of its steps.
+        Steps are separated by ';' or new lines, and each step uses the same
+        syntax as parse_operator_string.
+
+    ARGUMENTS
+        macro_string    (in)    The macro to split, e.g.
+                                "object.transform_apply(scale=True); object.shade_smooth"
+
+    RETURN
+        A tuple of operator strings in the order they run
+
+    RAISES
+        OperatorStringError when the macro is empty or a step is not a
+        single expression
+    '''
+    text = macro_string.strip()
+    if not text:
+        raise OperatorStringError("Macro is empty")
+
+    try:
+        statements = ast.parse(text, mode = "exec").body
+    except SyntaxError as err:
+        raise OperatorStringError(f"Invalid macro '{macro_string}': {err.msg} (line {err.lineno}, column {err.offset})") from None
+
+    steps = []
+    for statement in statements:
+        if not isinstance(statement, ast.Expr):
+            raise OperatorStringError(f"Invalid macro step '{ast.unparse(statement)}': expected an operator call")
+        steps.append(ast.get_source_segment(text, statement))
+
+    return tuple(steps)
+
+
+def _operator_name(node, op_string):
+    '''
+    DESCRIPTION
+        This function validates the "module.function" part of an operator
+        string
+
+    ARGUMENTS
+        node        (in)    The ast node for the operator name
+        op_string   (in)    The operator string, used for error messages
+
+    RETURN
+        The operator name as a string
+    '''
+    if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)):
+        return f"{node.value.id}.{node.attr}"
+
+    raise OperatorStringError(f"Invalid operator string '{op_string}': expected 'module.operator'")
+
+
+def _literal_value(node, op_name, arg):
+    '''
+    DESCRIPTION
+        This function converts the ast node of an argument value into a
+        typed python value
+
+    ARGUMENTS
+        node        (in)    The ast node for the value
+        op_name     (in)    The operator name, used for error messages
+        arg         (in)    The argument name, used for error messages
+
+    RETURN
+        A bool, int, float, str, tuple or frozenset
+    '''
+
+    #   Bare names are enum identifiers, e.g. action=TOGGLE
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (bool, int, float, str)):
+            return node.value
+
+    #   Negative and explicitly positive numbers
+    elif (isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd))
+          and isinstance(node.operand, ast.Constant)
+          and isinstance(node.operand.value, (int, float))
+          and not isinstance(node.operand.value, bool)):
+        value = node.operand.value
+        return -value if isinstance(node.op, ast.USub) else value
+
+    #   Vectors, colors and other array properties
+    elif isinstance(node, (ast.Tuple, ast.List)):
+        return tuple(_literal_value(item, op_name, arg) for item in node.elts)
+
+    #   Enum flag properties, e.g. type={'VERT', 'EDGE'}
+    elif isinstance(node, ast.Set):
+        return frozenset(_literal_value(item, op_name, arg) for item in node.elts)
+
+    raise OperatorStringError(f"Unsupported value '{ast.unparse(node)}' for argument '{arg}' of operator '{op_name}'")
+
+
+###############################################################################
+#
+#   Value Coercion Functions
+#
+###############################################################################
+def coerce_value(op_name, arg, value, prop_type, array_length = 0, enum_items = (), is_enum_flag = False):
+    '''
+    DESCRIPTION
+        This function coerces a parsed argument value to the type declared
+        by an operator property. The property is described with plain
+        values so this function does not need bpy.
+
+    ARGUMENTS
+        op_name         (in)    The operator name, used for error messages
+        arg             (in)    The argument name, used for error messages
+        value           (in)    The parsed value
+        prop_type       (in)    The RNA type (BOOLEAN, INT, FLOAT, STRING,
+                                ENUM)
+        array_length    (in)    The array length, 0 for single values
+        enum_items      (in)    The valid enum identifiers, empty when the
+                                enum items are dynamic
+        is_enum_flag    (in)    True when the enum accepts a set of items
+
+    RETURN
+        The coerced value
+
+    RAISES
+        OperatorStringError when the value does not fit the property
+    '''
+    if array_length:
+        if not isinstance(value, tuple) or len(value) != array_length:
+            raise OperatorStringError(f"Argument '{arg}' of '{op_name}' expects {array_length} values")
+        return tuple(coerce_value(op_name, arg, item, prop_type) for item in value)
+
+    if prop_type == 'BOOLEAN':
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, int) and value in (0, 1):
+            return bool(value)
+
+    elif prop_type == 'INT':
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+    elif prop_type == 'FLOAT':
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+
+    elif prop_type == 'STRING':
+        if isinstance(value, str):
+            return value
+
+    elif prop_type == 'ENUM':
+        if is_enum_flag:
+            values = frozenset((value,)) if isinstance(value, str) else value
+        else:
+            values = (value,)
+
+        if isinstance(values, (frozenset, tuple)) and all(isinstance(item, str) for item in values):
+            unknown = [item for item in values if enum_items and item not in enum_items]
+            if unknown:
+                raise OperatorStringError(f"'{unknown[0]}' is not a valid value for argument '{arg}' of '{op_name}'")
+            #   Blender only takes a set for a flag enum, also when it
+            #   was written as a tuple
+            return frozenset(values) if is_enum_flag else value
+
+    else:
+        raise OperatorStringError(f"Argument '{arg}' of '{op_name}' is a {prop_type.lower()} property and can not be set from a string")
+
+    raise OperatorStringError(f"Argument '{arg}' of '{op_name}' expects a {prop_type.lower()} value, got {value!r}")
@@ -0,0 +1,399 @@
+################################################################################
+#
+#   plans.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the compiled draw plan cache for the Marking Menus
+#       Blender Add-on. A draw plan is the list of ready-to-emit pie items for
+#       a single marking menu mode. Plans are built once and are only thrown
+#       away when one of the MarkingMenu preference properties changes.
+#
+#       The slots are compiled into plan entries here too. This module does
+#       not depend on bpy, the functions that validate operator strings
+#       against Blender are passed in.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+from collections import namedtuple
+
+from . import opstring
+from . import schema
+
+###############################################################################
+#
+#   Draw Plan Definitions
+#
+###############################################################################
+
+#   A single ready-to-emit pie item. A separator is stored as None. Items
+#   that open a sub-menu have the name of its ring in submenu. condition is
+#   the name of the slot condition in predicates.CONDITIONS.
+PlanEntry = namedtuple("PlanEntry", ("op_name", "label", "op_args", "submenu", "condition"), defaults = (None, "ALWAYS"))
+
+#   The entry of a Recent slot. It has no operator, the draw plan is
+#   resolved against the recent.py rankings before it is drawn. op_args
+#   may hold the ring whose operators it shows.
+RECENT_ENTRY = PlanEntry(None, "Recent", ())
+
+#   Compiled draw plans keyed by marking menu mode
+DRAW_PLANS = {}
+
+#   Incremented whenever draw plans are thrown away, so values read from
+#   the slots can be cached against it
+generation = 0
+
+#   Slot tries for marking gestures keyed by the mode at their root. A trie
+#   follows sub-menus into other modes, so any change throws all of them away.
+SLOT_TRIES = {}
+
+
+###############################################################################
+#
+#   Draw Plan Functions
+#
+###############################################################################
+def get_plan(mode):
+    '''
+    DESCRIPTION
+        This function returns the compiled draw plan for a marking menu mode
+
+    ARGUMENTS
+        mode        (in)    The marking menu mode (object, object2, edit)
+
+    RETURN
+        A tuple of PlanEntry / None items, or None if the plan is not built
+    '''
+    return DRAW_PLANS.get(mode)
+
+
+def store_plan(mode, plan):
+    '''
+    DESCRIPTION
+        This function stores a compiled draw plan for a marking menu mode
+
+    ARGUMENTS
+        mode        (in)    The marking menu mode (object, object2, edit)
+        plan        (in)    The sequence of PlanEntry / None items
+
+    RETURN
+        The stored plan as a tuple
+    '''
+    plan = tuple(plan)
+    DRAW_PLANS[mode] = plan
+    return plan
+
+
+def invalidate(mode = None):
+    '''
+    DESCRIPTION
+        This function throws away compiled draw plans so they are rebuilt
+        the next time a pie menu is drawn
+
+    ARGUMENTS
+        mode        (in)    The mode to invalidate, or None for every mode
+
+    RETURN
+        None
+    '''
+    global generation
+
+    generation += 1
+    if mode is None:
+        DRAW_PLANS.clear()
+    else:
+        DRAW_PLANS.pop(mode, None)
+    SLOT_TRIES.clear()
+
+
+def invalidate_tries():
+    '''
+    DESCRIPTION
+        This function throws away the slot tries but keeps the draw plans,
+        e.g. when the operators shown by the Recent slots changed
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    SLOT_TRIES.clear()
+
+
+def get_trie(mode):
+    '''
+    DESCRIPTION
+        This function returns the slot trie for marking gestures started
+        in a marking menu mode
+
+    ARGUMENTS
+        mode        (in)    The marking menu mode at the root of the trie
+
+    RETURN
+        A {sector: gestures.TrieNode} dictionary, or None if not built
+    '''
+    return SLOT_TRIES.get(mode)
+
+
+def store_trie(mode, trie):
+    '''
+    DESCRIPTION
+        This function stores the slot trie of a marking menu mode
+
+    ARGUMENTS
+        mode        (in)    The marking menu mode at the root of the trie
+        trie        (in)    The {sector: gestures.TrieNode} dictionary
+
+    RETURN
+        The stored trie
+    '''
+    SLOT_TRIES[mode] = trie
+    return trie
+
+
+def get_operator_usage():
+    '''
+    DESCRIPTION
+        This function counts how often each operator is used in the
+        compiled draw plans
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A {op_name: count} dictionary
+    '''
+    usage = {}
+    for plan in DRAW_PLANS.values():
+        for entry in plan:
+            if entry is not None and entry.op_name is not None:
+                usage[entry.op_name] = usage.get(entry.op_name, 0) + 1
+    return usage
+
+
+def find_entry(plan, op_name, get_arg):
+    '''
+    DESCRIPTION
+        This function finds the entry of a draw plan that runs an operator,
+        e.g. to tell which pie button was chosen from the operator that
+        ran. When several entries run the operator, their arguments must
+        match too, and the entry setting the most arguments wins.
+
+    ARGUMENTS
+        plan        (in)    The tuple of PlanEntry / None items
+        op_name     (in)    The operator name, e.g. "object.delete"
+        get_arg     (in)    A function returning the value an argument of
+                            the operator ran with
+
+    RETURN
+        The index of the entry in the plan, or None if no entry matches
+    '''
+    found = [index for index, entry in enumerate(plan) if entry is not None and entry.op_name == op_name]
+    if len(found) > 1:
+        found = [index for index in found
+                 if all(get_arg(arg) == value for arg, value in plan[index].op_args)]
+    return max(found, key = lambda index: len(plan[index].op_args), default = None)
+
+
+###############################################################################
+#
+#   Slot Compilation Functions
+#
+###############################################################################
+def compile_slot(op_name, custom_op, catalog, validate_operator, validate_macro):
+    '''
+    DESCRIPTION
+        This function resolves a single slot into a plan entry
+
+    ARGUMENTS
+        op_name             (in)    The item of the slot, an operator string
+                                    from the catalog or Custom, Submenu,
+                                    Macro, Recent or Empty
+        custom_op           (in)    The custom operator, ring or macro text
+                                    of the slot
+        catalog             (in)    The catalog.OperatorCatalog of the ring
+        validate_operator   (in)    A function returning the (op_name,
+                                    op_args) of a valid operator string
+        validate_macro      (in)    A function returning the validated
+                                    steps of a macro string
+
+    RETURN
+        A PlanEntry, or None for an empty slot
+
+    RAISES
+        opstring.OperatorStringError when the slot is not valid
+    '''
+    if op_name == "Empty":
+        return None
+
+    if op_name in {"Custom", "Submenu", "Macro"} and not custom_op.strip():
+        return None
+
+    if op_name == "Custom":
+        return compile_custom_operator(custom_op, validate_operator)
+
+    if op_name == "Submenu":
+        return compile_submenu(custom_op)
+
+    if op_name == "Macro":
+        return compile_macro(custom_op, validate_macro)
+
+    if op_name == "Recent":
+        return compile_recent(custom_op)
+
+    return compile_operator(op_name, catalog, validate_operator)
+
+
+def compile_operator(op_string, catalog, validate_operator):
+    '''
+    DESCRIPTION
+        This function is called by compile_slot to resolve the plan entry
+        for the standard operators
+
+    ARGUMENTS
+        op_string           (in)    The operator string from the catalog
+        catalog             (in)    The catalog.OperatorCatalog of the ring
+        validate_operator   (in)    A function returning the (op_name,
+                                    op_args) of a valid operator string
+
+    RETURN
+        A PlanEntry
+
+    RAISES
+        opstring.OperatorStringError when the operator is not valid
+    '''
+
+    #   Seperate the operator name from its validated arguments
+    op_name, op_args = validate_operator(op_string)
+
+    #   The catalog has the text label of the operator
+    return PlanEntry(op_name, catalog.label(op_string, op_string), op_args)
+
+
+def compile_submenu(ring):
+    '''
+    DESCRIPTION
+        This function is called by compile_slot to resolve the plan entry
+        for a slot that opens the pie menu of another ring
+
+    ARGUMENTS
+        ring        (in)    The name of the ring to open
+
+    RETURN
+        A PlanEntry
+
+    RAISES
+        opstring.OperatorStringError when the ring does not exist
+    '''
+    ring = ring.strip()
+    if ring not in schema.RINGS:
+        raise opstring.OperatorStringError(f"Unknown marking menu '{ring}'")
+
+    return PlanEntry("pie.call_ring", schema.RINGS[ring].label, (("ring", ring),), ring)
+
+
+def compile_recent(ring):
+    '''
+    DESCRIPTION
+        This function is called by compile_slot to resolve the plan entry
+        for a slot that shows a recently or often used operator
+
+    ARGUMENTS
+        ring        (in)    The name of the ring whose operators are shown,
+                            empty for the ring of the slot
+
+    RETURN
+        A PlanEntry with no operator, see RECENT_ENTRY
+
+    RAISES
+        opstring.OperatorStringError when the ring does not exist
+    '''
+    ring = ring.strip()
+    if not ring:
+        return RECENT_ENTRY
+    if ring not in schema.RINGS:
+        raise opstring.OperatorStringError(f"Unknown marking menu '{ring}'")
+
+    return RECENT_ENTRY._replace(op_args = (("ring", ring),))
+
+
+def compile_macro(macro_string, validate_macro):
+    '''
+    DESCRIPTION
+        This function is called by compile_slot to resolve the plan entry
+        for a slot that runs a macro
+
+    ARGUMENTS
+        macro_string    (in)    The macro steps separated by ';'
+        validate_macro  (in)    A function returning the validated steps of
+                                a macro string
+
+    RETURN
+        A PlanEntry
+
+    RAISES
+        opstring.OperatorStringError when a step is not valid
+    '''
+    steps = validate_macro(macro_string)
+
+    #   Label the macro after its first step
+    op_text = get_operator_label(steps[0][0])
+    if len(steps) > 1:
+        op_text = f"{op_text} (+{len(steps) - 1})"
+
+    return PlanEntry("pie.run_macro", op_text, (("steps", macro_string),))
+
+
+def compile_custom_operator(op_string, validate_operator):
+    '''
+    DESCRIPTION
+        This function is called by compile_slot to resolve the plan entry
+        for the custom operators
+
+    ARGUMENTS
+        op_string           (in)    The operator string of the slot
+        validate_operator   (in)    A function returning the (op_name,
+                                    op_args) of a valid operator string
+
+    RETURN
+        A PlanEntry
+
+    RAISES
+        opstring.OperatorStringError when the operator is not valid
+    '''
+
+    #   Seperate the operator name from its validated arguments
+    op_name, op_args = validate_operator(op_string)
+
+    return PlanEntry(op_name, get_operator_label(op_name), op_args)
+
+
+def get_operator_label(op_name):
+    '''
+    DESCRIPTION
+        This function makes a text label from an operator name
+
+    ARGUMENTS
+        op_name     (in)    The operator name, e.g. object.shade_smooth
+
+    RETURN
+        The label, e.g. Shade Smooth
+    '''
+    return op_name.split(".")[-1].replace("_", " ").title()
@@ -0,0 +1,154 @@
+################################################################################
+#
+#   predicates.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the slot predicates of the Marking Menus Blender
+#       Add-on. A slot can have a condition on the selection that hides it,
+#       and a slot whose operator can not run (its poll fails) is greyed
+#       out. The results are cached per ring and only recomputed when the
+#       mode, the active object or the selection fingerprint change, or when
+#       the depsgraph handler throws them away.
+#
+#       This module does not depend on bpy, the selection state and the
+#       operator poll function are passed in.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+from collections import namedtuple
+
+###############################################################################
+#
+#   Predicate Definitions
+#
+###############################################################################
+
+#   A snapshot of the selection the conditions are tested against
+SelectionState = namedtuple("SelectionState", ("mode", "active_type", "selected_count"))
+
+#   A slot condition, its label, description and test function
+Condition = namedtuple("Condition", ("name", "label", "description", "test"))
+
+#   The conditions a slot can have, keyed by name
+CONDITIONS = {condition.name: condition for condition in (
+    Condition("ALWAYS",   "Always",        "Always show this slot",
+              lambda state: True),
+    Condition("SELECTED", "Any Selected",  "Only show this slot when something is selected",
+              lambda state: state.selected_count > 0),
+    Condition("MULTIPLE", "> 1 Selected",  "Only show this slot when more than one object is selected",
+              lambda state: state.selected_count > 1),
+    Condition("ACTIVE",   "Active Object", "Only show this slot when there is an active object",
+              lambda state: state.active_type is not None),
+    Condition("MESH",     "Active Mesh",   "Only show this slot when the active object is a mesh",
+              lambda state: state.active_type == 'MESH'),
+)}
+
+#   The conditions as EnumProperty items
+CONDITION_ITEMS = tuple((condition.name, condition.label, condition.description, 'NONE', index)
+                        for index, condition in enumerate(CONDITIONS.values()))
+
+#   The states of a slot
+SLOT_ENABLED  = 'ENABLED'
+SLOT_DISABLED = 'DISABLED'
+SLOT_HIDDEN   = 'HIDDEN'
+
+#   Cached slot states keyed by ring, (key, plan, states)
+_states = {}
+
+
+###############################################################################
+#
+#   Predicate Functions
+#
+###############################################################################
+def test(condition, state):
+    '''
+    DESCRIPTION
+        This function tests a slot condition against the selection
+
+    ARGUMENTS
+        condition   (in)    The name of the condition in CONDITIONS
+        state       (in)    The SelectionState
+
+    RETURN
+        True if the slot should be shown
+    '''
+    return CONDITIONS[condition].test(state)
+
+
+def evaluate(entry, state, poll):
+    '''
+    DESCRIPTION
+        This function returns the state of a single slot
+
+    ARGUMENTS
+        entry       (in)    The plans.PlanEntry of the slot, or None
+        state       (in)    The SelectionState
+        poll        (in)    A function returning True if an operator idname
+                            can run in the current context
+
+    RETURN
+        SLOT_ENABLED, SLOT_DISABLED or SLOT_HIDDEN
+    '''
+    if entry is None or not test(entry.condition, state):
+        return SLOT_HIDDEN
+    return SLOT_ENABLED if poll(entry.op_name) else SLOT_DISABLED
+
+
+def get_slot_states(ring, plan, key, state, poll):
+    '''
+    DESCRIPTION
+        This function returns the state of every entry of a draw plan,
+        evaluating them only when the cached states were made for another
+        plan or another selection key
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        plan        (in)    The draw plan of the ring
+        key         (in)    A hashable (mode, active object, selection
+                            generation) key
+        state       (in)    The SelectionState
+        poll        (in)    A function returning True if an operator idname
+                            can run in the current context
+
+    RETURN
+        A tuple of slot states in plan order
+    '''
+    cached = _states.get(ring)
+    if cached is not None and cached[0] == key and cached[1] is plan:
+        return cached[2]
+
+    states = tuple(evaluate(entry, state, poll) for entry in plan)
+    _states[ring] = (key, plan, states)
+    return states
+
+
+def invalidate():
+    '''
+    DESCRIPTION
+        This function throws away every cached slot state
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    _states.clear()
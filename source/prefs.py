@@ -26,8 +26,23 @@
 #
 ###############################################################################
 import bpy
+import itertools
+import time
 
+from   . import diagnostics
+from   . import gestures
+from   . import keymaps
+from   . import opstring
+from   . import plans
+from   . import predicates
+from   . import profiler
+from   . import profiles
+from   . import recent
+from   . import schema
+from   . import store
+from   . import telemetry
 from   . import utils
+from   . import watchdog
 
 ###############################################################################
 #
@@ -35,83 +50,675 @@ from   . import utils
 #
 ###############################################################################
 
-#   Default object mode operators
-OBJECT_OPERATORS = [
-    ("object.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all objects"),
-    ("object.select_all(action='DESELECT')", "Deselect All", "Deselect all objects"),
-    ("object.select_random", "Select Random", "Randomly select objects"),
-    ("object.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
-    ("object.duplicate_move", "Duplicate", "Duplicate selected objects"),
-    ("object.delete", "Delete", "Delete selected objects"),
-    ("object.join", "Join", "Join selected objects"),
-    ("object.subdivision_set(level=1)", "Set Subdivision Level 1", "Set subdivision level to 1"),
-    ("object.shade_smooth", "Shade Smooth", "Set shading to smooth"),
-    ("object.shade_flat", "Shade Flat", "Set shading to flat"),
-    ("object.origin_set(type='ORIGIN_GEOMETRY')", "Set Origin to Geometry", "Set origin to center of geometry"),
-    ("object.convert(target='MESH')", "Convert to Mesh", "Convert selected objects to mesh"),
-    ("object.modifier_add(type='SUBSURF')", "Add Subdivision Surface", "Add subdivision surface modifier"),
-    ("object.modifier_add", "Add Modifier Menu", "Open the Add Modifier menu"),
-    ("wm.call_menu(name='VIEW3D_MT_object_apply')", "Apply Menu", "Open the Apply menu"),
-    ("wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')", "Origin Pie Menu", "Open the origin/pivot pie menu"),
-    ("Custom", "Custom Operator", "Use a custom operator")
-]
-
-#    Default edit mode operators
-EDIT_OPERATORS = [
-    ("mesh.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all elements"),
-    ("mesh.select_all(action='DESELECT')", "Deselect All", "Deselect all elements"),
-    ("mesh.select_random", "Select Random", "Randomly select elements"),
-    ("mesh.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
-    ("mesh.duplicate_move", "Duplicate", "Duplicate selected elements"),
-    ("mesh.delete", "Delete", "Delete selected elements"),
-    ("mesh.separate(type='SELECTED')", "Separate Selected", "Separate selected elements"),
-    ("mesh.subdivide", "Subdivide", "Subdivide selected edges"),
-    ("mesh.faces_shade_smooth", "Shade Smooth", "Set shading to smooth"),
-    ("mesh.faces_shade_flat", "Shade Flat", "Set shading to flat"),
-    ("mesh.quads_convert_to_tris", "Triangulate Faces", "Convert quads to triangles"),
-    ("mesh.tris_convert_to_quads", "Quadrangulate Faces", "Convert triangles to quads"),
-    ("mesh.extrude_region_move", "Extrude Region", "Extrude selected region"),
-    ("wm.call_menu(name='VIEW3D_MT_edit_mesh_faces')", "Faces Menu", "Open the Faces menu"),
-    ("wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')", "Origin Pie Menu", "Open the origin/pivot pie menu"),
-    ("Custom", "Custom Operator", "Use a custom operator")
-]
-
-#   Default Object2 marking Menu Operators (Initially the same as OBJECT Operators)
-OBJECT2_OPERATORS = OBJECT_OPERATORS
-
-#   Define the default preference properties for this add-on
-defaults = {
-    "object":  [
-                "object.select_all(action='TOGGLE')",
-                "object.delete",
-                "object.duplicate_move",
-                "object.shade_smooth",
-                "object.join",
-                "object.convert(target='MESH')",
-                "object.origin_set(type='ORIGIN_GEOMETRY')",
-                "wm.call_menu(name='VIEW3D_MT_object_apply')"
-               ],
-    "object2": [
-                "object.select_all(action='TOGGLE')",
-                "object.delete",
-                "object.duplicate_move",
-                "object.shade_smooth",
-                "object.join",
-                "object.convert(target='MESH')",
-                "object.origin_set(type='ORIGIN_GEOMETRY')",
-                "wm.call_menu(name='VIEW3D_MT_object_apply')"
-               ],
-    "edit":    [
-                "mesh.select_all(action='TOGGLE')",
-                "mesh.delete",
-                "mesh.duplicate_move",
-                "mesh.extrude_region_move",
-                "mesh.subdivide",
-                "mesh.separate(type='SELECTED')",
-                "mesh.faces_shade_smooth",
-                "wm.call_menu(name='VIEW3D_MT_edit_mesh_faces')"
-            ]
-}
+#   The preference property of each ring's slot group, filled in by
+#   set_ring_properties()
+RING_PROPERTIES = {}
+
+#   The register() time of the add-on in seconds, shown in the preferences
+register_time = 0.0
+
+#   The time of the last schema reload in seconds, None before the first
+reload_time = None
+
+#   True while a profile is applied or the bindings are filled in, the
+#   update callbacks do nothing and the caches are rebuilt once at the end
+#   instead
+_updates_suspended = False
+
+
+###############################################################################
+#
+#   Slot Property Groups
+#
+###############################################################################
+def update_slot_item(self, context):
+    '''
+    DESCRIPTION
+        This is the update callback of a slot's item and condition. It
+        invalidates the draw plan of the slot's ring.
+
+    ARGUMENTS
+        self        (in)    The slot property group
+        context     (in)    A Blender context to get some info from.
+
+    RETURN
+        None
+    '''
+    if not _updates_suspended:
+        plans.invalidate(self.ring)
+
+
+def update_slot_custom_op(self, context):
+    '''
+    DESCRIPTION
+        This is the update callback of a slot's custom operator. It validates
+        the edited operator string or macro against the operators' RNA, so
+        errors are found at edit time and shown in the preferences instead
+        of on every pie redraw.
+
+    ARGUMENTS
+        self        (in)    The slot property group
+        context     (in)    A Blender context to get some info from.
+
+    RETURN
+        None
+    '''
+    if _updates_suspended:
+        return
+
+    try:
+        if self.custom_op and self.item == "Custom":
+            utils.validate_operator_string(self.custom_op, refresh = True)
+        elif self.custom_op and self.item == "Macro":
+            utils.validate_macro_string(self.custom_op, refresh = True)
+    except opstring.OperatorStringError:
+        pass
+    plans.invalidate(self.ring)
+
+
+def make_catalog_groups(name, operators):
+    '''
+    DESCRIPTION
+        This function generates the slot and the ring property group of an
+        operator catalog. The slot's item enum lists the catalog's operators
+        and the ring holds the collection of slots.
+
+    ARGUMENTS
+        name        (in)    The name of the catalog in schema.CATALOGS
+        operators   (in)    The catalog
+
+    RETURN
+        The slot and the ring property group, in registration order
+    '''
+    slot_group = type(f"MarkingMenuSlot_{name}", (bpy.types.PropertyGroup,), {
+        "__annotations__": {
+            "ring":      bpy.props.StringProperty(options = {'HIDDEN'}),
+            "item":      bpy.props.EnumProperty(name = "Item", items = operators.enum_items, default = "Empty", update = update_slot_item),
+            "custom_op": bpy.props.StringProperty(name = "Custom Operator", update = update_slot_custom_op),
+            "condition": bpy.props.EnumProperty(name = "Condition", items = predicates.CONDITION_ITEMS, default = "ALWAYS", update = update_slot_item)
+        }
+    })
+    ring_group = type(f"MarkingMenuRing_{name}", (bpy.types.PropertyGroup,), {
+        "__annotations__": {
+            "slots":     bpy.props.CollectionProperty(type = slot_group)
+        }
+    })
+    return slot_group, ring_group
+
+
+def make_property_groups():
+    '''
+    DESCRIPTION
+        This function generates the slot and ring property groups of every
+        operator catalog
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A {catalog name: (slot group, ring group)} dictionary
+    '''
+    return {name: make_catalog_groups(name, operators) for name, operators in schema.CATALOGS.items()}
+
+CATALOG_GROUPS = make_property_groups()
+classes = tuple(group for groups in CATALOG_GROUPS.values() for group in groups)
+
+
+###############################################################################
+#
+#   Hotkey Bindings
+#
+###############################################################################
+
+#   The event type items of the keymap items, read from the RNA once
+_event_items = []
+
+
+def get_event_items(self, context):
+    '''
+    DESCRIPTION
+        This is the items callback of a binding's event. The items keep the
+        value of the event, so the stored binding survives new event types.
+
+    ARGUMENTS
+        self        (in)    The binding property group
+        context     (in)    A Blender context to get some info from.
+
+    RETURN
+        The list of enum items
+    '''
+    if not _event_items:
+        for item in bpy.types.KeyMapItem.bl_rna.properties["type"].enum_items:
+            _event_items.append((item.identifier, item.name, item.description, item.value))
+    return _event_items
+
+
+def update_binding(self, context):
+    '''
+    DESCRIPTION
+        This is the update callback of a binding. It replaces the binding's
+        keymap item, or removes it when the binding is turned off.
+
+    ARGUMENTS
+        self        (in)    The binding property group
+        context     (in)    A Blender context to get some info from.
+
+    RETURN
+        None
+    '''
+    keyconfig = context.window_manager.keyconfigs.addon
+    if _updates_suspended or keyconfig is None or not self.mode:
+        return
+
+    binding = get_binding(self)
+    if binding is None:
+        keymaps.remove(self.mode, self.variant)
+    else:
+        keymaps.add(keyconfig, binding)
+    keymaps.invalidate_index()
+
+
+class MarkingMenuBinding(bpy.types.PropertyGroup):
+    '''
+    DESCRIPTION
+        This property group holds the key that opens the ring of a mode
+    '''
+    mode: bpy.props.StringProperty(options = {'HIDDEN'}) # type: ignore
+    variant: bpy.props.IntProperty(options = {'HIDDEN'}) # type: ignore
+    event: bpy.props.EnumProperty(name = "Key", items = get_event_items, update = update_binding) # type: ignore
+    shift: bpy.props.BoolProperty(name = "Shift", update = update_binding) # type: ignore
+    ctrl: bpy.props.BoolProperty(name = "Ctrl", update = update_binding) # type: ignore
+    alt: bpy.props.BoolProperty(name = "Alt", update = update_binding) # type: ignore
+    oskey: bpy.props.BoolProperty(name = "OS Key", update = update_binding) # type: ignore
+    active: bpy.props.BoolProperty(name = "Active", description = "Open the marking menu of this mode with the key", default = True, update = update_binding) # type: ignore
+
+classes += (MarkingMenuBinding,)
+
+#   The schema binding of every (mode, variant) pair, filled in by
+#   set_ring_properties()
+BINDING_BY_MODE = {}
+
+
+def ensure_bindings(preferences):
+    '''
+    DESCRIPTION
+        This function adds a binding to the preferences for every binding
+        of the schema that has none yet, with the keys of its hotkey
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+
+    RETURN
+        True if any binding was added
+    '''
+    global _updates_suspended
+
+    existing = {(item.mode, item.variant) for item in preferences.bindings}
+    added    = False
+
+    #   The keymap items are already registered with these keys
+    _updates_suspended = True
+    try:
+        for binding in keymaps.get_default_bindings():
+            if (binding.mode, binding.variant) in existing:
+                continue
+
+            item         = preferences.bindings.add()
+            item.mode    = binding.mode
+            item.variant = binding.variant
+            item.event   = binding.event
+            for modifier in keymaps.MODIFIERS:
+                setattr(item, modifier, modifier in binding.modifiers)
+            added = True
+    finally:
+        _updates_suspended = False
+    return added
+
+
+def get_binding(item):
+    '''
+    DESCRIPTION
+        This function returns the keymaps.KeyBinding of a binding in the
+        preferences
+
+    ARGUMENTS
+        item        (in)    The MarkingMenuBinding
+
+    RETURN
+        The KeyBinding, or None if the binding is turned off or no longer in
+        the schema
+    '''
+    binding = BINDING_BY_MODE.get((item.mode, item.variant))
+    if binding is None or not item.active or item.event == 'NONE':
+        return None
+
+    return keymaps.KeyBinding(binding.mode, binding.variant, binding.keymap,
+                              schema.HOTKEYS[binding.variant].idname, item.event,
+                              tuple(modifier for modifier in keymaps.MODIFIERS if getattr(item, modifier)))
+
+
+def get_bindings(preferences):
+    '''
+    DESCRIPTION
+        This function returns the bindings to register. The schema defaults
+        are used for the modes the preferences have no binding for, e.g.
+        when the add-on is enabled for the first time.
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package, or None
+
+    RETURN
+        A list of KeyBinding, None for the bindings that are turned off
+    '''
+    items = {}
+    if preferences is not None:
+        items = {(item.mode, item.variant): item for item in preferences.bindings}
+
+    bindings = []
+    for binding in keymaps.get_default_bindings():
+        item = items.get((binding.mode, binding.variant))
+        bindings.append(binding if item is None else get_binding(item))
+    return bindings
+
+
+def get_ring_slots(preferences, ring):
+    '''
+    DESCRIPTION
+        This function returns the slot collection of a ring
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+        ring        (in)    The name of the ring in schema.RINGS
+
+    RETURN
+        The slots collection, indexed by slot
+    '''
+    return getattr(preferences, RING_PROPERTIES[ring]).slots
+
+
+#   The rings whose operators a Recent slot shows, and the plans.generation
+#   they were read at
+_recent_sources = (None, frozenset())
+
+def get_recent_sources(preferences):
+    '''
+    DESCRIPTION
+        This function returns the rings whose operators are shown by a
+        Recent slot, so only their pie items need to be recorded. The
+        slots are read again after the draw plans were thrown away.
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+
+    RETURN
+        A frozenset of ring names
+    '''
+    global _recent_sources
+
+    if _recent_sources[0] != plans.generation:
+        sources = set()
+        for ring in schema.RINGS:
+            for slot in get_ring_slots(preferences, ring):
+                if slot.item == "Recent":
+                    sources.add(slot.custom_op.strip() or ring)
+        _recent_sources = (plans.generation, frozenset(sources))
+    return _recent_sources[1]
+
+
+def ensure_slots(preferences):
+    '''
+    DESCRIPTION
+        This function fills the slot collection of every ring up to
+        schema.SLOT_COUNT, using the defaults of the ring and the values of
+        the flat properties older versions of the add-on stored
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+
+    RETURN
+        True if any slot was added
+    '''
+    added = False
+    for ring in schema.RINGS.values():
+        slots = get_ring_slots(preferences, ring.name)
+        if len(slots) >= schema.SLOT_COUNT:
+            continue
+
+        ring_defaults = schema.DEFAULTS.get(ring.name, ())
+        for i in range(len(slots), schema.SLOT_COUNT):
+            slot      = slots.add()
+            slot.ring = ring.name
+            slot.item = ring_defaults[i] if i < len(ring_defaults) else "Empty"
+            migrate_slot(preferences, ring, i, slot)
+        added = True
+
+    if added:
+        plans.invalidate()
+    return added
+
+
+def migrate_slot(preferences, ring, index, slot):
+    '''
+    DESCRIPTION
+        This function copies a slot's value from the flat {ring}_pie_item_N
+        and {ring}_custom_op_N properties older versions stored, and removes
+        them from the preferences
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+        ring        (in)    The schema.Ring of the slot
+        index       (in)    The slot index
+        slot        (in)    The slot property group to fill
+
+    RETURN
+        None
+    '''
+    item_key   = f"{ring.name}_pie_item_{index}"
+    custom_key = f"{ring.name}_custom_op_{index}"
+
+    #   Enum values are stored as the index of the item in the catalog
+    item       = preferences.get(item_key)
+    enum_items = schema.CATALOGS[ring.catalog].enum_items
+    if isinstance(item, int) and 0 <= item < len(enum_items):
+        slot.item = enum_items[item][0]
+
+    custom_op = preferences.get(custom_key)
+    if isinstance(custom_op, str):
+        slot.custom_op = custom_op
+
+    for key in (item_key, custom_key):
+        if key in preferences:
+            del preferences[key]
+
+
+def ensure_slots_timer():
+    '''
+    DESCRIPTION
+        This is a one shot bpy.app.timers callback that fills the slot
+        collections when the preferences are drawn before the warm-up ran
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is not None and (ensure_slots(addon.preferences) | ensure_bindings(addon.preferences)):
+        tag_redraw({'PREFERENCES'})
+    return None
+
+
+def tag_redraw(area_types):
+    '''
+    DESCRIPTION
+        This function redraws every area of the given types in every window
+
+    ARGUMENTS
+        area_types  (in)    A set of area types, e.g. {'PREFERENCES'}
+
+    RETURN
+        None
+    '''
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type in area_types:
+                area.tag_redraw()
+
+
+###############################################################################
+#
+#   Profile Functions
+#
+###############################################################################
+def get_profile_directory():
+    '''
+    DESCRIPTION
+        This function returns the folder of the named profiles
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The path of the folder in the extension user directory
+    '''
+    return store.get_user_path(profiles.PROFILE_DIRECTORY)
+
+
+def validate_profile_slot(ring, value):
+    '''
+    DESCRIPTION
+        This function checks that a profile slot compiles, it is the slot
+        validation passed to the profiles module
+
+    ARGUMENTS
+        ring        (in)    The name of the ring in schema.RINGS
+        value       (in)    The profiles.SlotValue
+
+    RETURN
+        None
+
+    RAISES
+        opstring.OperatorStringError when the slot is not valid
+    '''
+    plans.compile_slot(value.item, value.custom_op, schema.CATALOGS[schema.RINGS[ring].catalog],
+                       utils.validate_operator_string, utils.validate_macro_string)
+
+
+def get_profile_slots(preferences):
+    '''
+    DESCRIPTION
+        This function takes a snapshot of the slots of every ring
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+
+    RETURN
+        A {ring: tuple of profiles.SlotValue} dictionary
+    '''
+    ensure_slots(preferences)
+    return {ring: tuple(profiles.SlotValue(slot.item, slot.custom_op, slot.condition)
+                        for slot in get_ring_slots(preferences, ring))
+            for ring in schema.RINGS}
+
+
+def apply_profile_slots(preferences, rings):
+    '''
+    DESCRIPTION
+        This function writes validated profile slots to the preferences as
+        a single batch. The update callbacks are suspended while the slots
+        are written, only the slots that differ are written, and the caches
+        are rebuilt and the areas redrawn once at the end.
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+        rings       (in)    A {ring: sequence of profiles.SlotValue}
+                            dictionary returned by profiles.parse_profile
+
+    RETURN
+        The number of slots that changed
+    '''
+    global _updates_suspended
+
+    ensure_slots(preferences)
+
+    changed = 0
+    _updates_suspended = True
+    try:
+        for ring, values in rings.items():
+            for slot, value in zip(get_ring_slots(preferences, ring), values):
+                if (slot.item, slot.custom_op, slot.condition) != value:
+                    slot.custom_op = value.custom_op
+                    slot.item      = value.item
+                    slot.condition = value.condition
+                    changed += 1
+    finally:
+        _updates_suspended = False
+
+    if changed:
+        plans.invalidate()
+        predicates.invalidate()
+        tag_redraw({'PREFERENCES', 'VIEW_3D'})
+    return changed
+
+
+def get_slot_label(preferences, ring, index):
+    '''
+    DESCRIPTION
+        This function returns the text that describes what a slot does
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+        ring        (in)    The name of the ring in schema.RINGS
+        index       (in)    The slot index
+
+    RETURN
+        The label of the catalog item, or the text of a custom slot
+    '''
+    slot = get_ring_slots(preferences, ring)[index]
+    if slot.item in {"Custom", "Submenu", "Macro"}:
+        return slot.custom_op.strip() or slot.item
+    return schema.CATALOGS[schema.RINGS[ring].catalog].label(slot.item, slot.item)
+
+
+def reorder_slots(preferences, ring, order):
+    '''
+    DESCRIPTION
+        This function moves the slots of a ring to new positions, with their
+        item, custom operator and condition
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+        ring        (in)    The name of the ring in schema.RINGS
+        order       (in)    The new slot index of every slot
+
+    RETURN
+        None
+    '''
+    slots  = get_ring_slots(preferences, ring)
+    values = [None] * len(slots)
+    for index, slot in enumerate(slots):
+        values[order[index]] = profiles.SlotValue(slot.item, slot.custom_op, slot.condition)
+
+    apply_profile_slots(preferences, {ring: values})
+
+
+def apply_settings(preferences):
+    '''
+    DESCRIPTION
+        This function hands the saved profiler, draw budget, usage and
+        Recent slot settings to their modules. It reads no files, so it can
+        run in register(). The files of earlier sessions are read by the
+        warm-up.
+
+    ARGUMENTS
+        preferences (in)    The preferences for this package
+
+    RETURN
+        None
+    '''
+    profiler.set_enabled(preferences.use_profiler)
+    watchdog.set_budget(preferences.draw_budget / 1000)
+    telemetry.set_enabled(preferences.use_telemetry)
+    recent.set_order(preferences.recent_order)
+    recent.set_enabled(preferences.use_recent)
+
+
+def update_use_profiler(self, context):
+    '''
+    DESCRIPTION
+        This function is called when the profiler is turned on or off
+
+    ARGUMENTS
+        self        (in)    The preferences for this package
+        context     (in)    A Blender context
+
+    RETURN
+        None
+    '''
+    profiler.set_enabled(self.use_profiler)
+
+
+def update_draw_budget(self, context):
+    '''
+    DESCRIPTION
+        This function is called when the draw budget changes, and hands it
+        to the watchdog in seconds
+
+    ARGUMENTS
+        self        (in)    The preferences for this package
+        context     (in)    A Blender context
+
+    RETURN
+        None
+    '''
+    watchdog.set_budget(self.draw_budget / 1000)
+
+
+def update_use_telemetry(self, context):
+    '''
+    DESCRIPTION
+        This function is called when usage recording is turned on or off,
+        and loads the usage of earlier sessions the first time
+
+    ARGUMENTS
+        self        (in)    The preferences for this package
+        context     (in)    A Blender context
+
+    RETURN
+        None
+    '''
+    if telemetry.set_enabled(self.use_telemetry):
+        telemetry.load(store.get_user_path(telemetry.TELEMETRY_FILE))
+
+
+def update_use_recent(self, context):
+    '''
+    DESCRIPTION
+        This function is called when the Recent slots are turned on or off,
+        and loads the rankings of earlier sessions
+
+    ARGUMENTS
+        self        (in)    The preferences for this package
+        context     (in)    A Blender context
+
+    RETURN
+        None
+    '''
+    if recent.set_enabled(self.use_recent):
+        load_recent()
+
+
+def update_recent_order(self, context):
+    '''
+    DESCRIPTION
+        This function is called when the order of the Recent slots changes
+
+    ARGUMENTS
+        self        (in)    The preferences for this package
+        context     (in)    A Blender context
+
+    RETURN
+        None
+    '''
+    recent.set_order(self.recent_order)
+
+
+def load_recent():
+    '''
+    DESCRIPTION
+        This function reads the Recent slot rankings from the extension
+        user directory, unless rankings recorded since are not saved yet.
+        Operators whose arguments no longer validate are left out.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    if not recent.is_dirty():
+        recent.from_json(store.load_json(recent.RECENT_FILE, {}), utils.validate_operator_args)
 
 
 ###############################################################################
@@ -122,60 +729,27 @@ defaults = {
 class MarkingMenu(bpy.types.AddonPreferences):
     bl_idname = __package__
 
-    #   Define the properties for the pie menu items
-    object_pie_item_0: bpy.props.EnumProperty(name="Object Pie Item 1", items=OBJECT_OPERATORS, default=defaults["object"][0]) # type: ignore
-    object_pie_item_1: bpy.props.EnumProperty(name="Object Pie Item 2", items=OBJECT_OPERATORS, default=defaults["object"][1]) # type: ignore
-    object_pie_item_2: bpy.props.EnumProperty(name="Object Pie Item 3", items=OBJECT_OPERATORS, default=defaults["object"][2]) # type: ignore
-    object_pie_item_3: bpy.props.EnumProperty(name="Object Pie Item 4", items=OBJECT_OPERATORS, default=defaults["object"][3]) # type: ignore
-    object_pie_item_4: bpy.props.EnumProperty(name="Object Pie Item 5", items=OBJECT_OPERATORS, default=defaults["object"][4]) # type: ignore
-    object_pie_item_5: bpy.props.EnumProperty(name="Object Pie Item 6", items=OBJECT_OPERATORS, default=defaults["object"][5]) # type: ignore
-    object_pie_item_6: bpy.props.EnumProperty(name="Object Pie Item 7", items=OBJECT_OPERATORS, default=defaults["object"][6]) # type: ignore
-    object_pie_item_7: bpy.props.EnumProperty(name="Object Pie Item 8", items=OBJECT_OPERATORS, default=defaults["object"][7]) # type: ignore
-
-    object2_pie_item_0: bpy.props.EnumProperty(name="Object2 Pie Item 1", items=OBJECT2_OPERATORS, default=defaults["object2"][0]) # type: ignore
-    object2_pie_item_1: bpy.props.EnumProperty(name="Object2 Pie Item 2", items=OBJECT2_OPERATORS, default=defaults["object2"][1]) # type: ignore
-    object2_pie_item_2: bpy.props.EnumProperty(name="Object2 Pie Item 3", items=OBJECT2_OPERATORS, default=defaults["object2"][2]) # type: ignore
-    object2_pie_item_3: bpy.props.EnumProperty(name="Object2 Pie Item 4", items=OBJECT2_OPERATORS, default=defaults["object2"][3]) # type: ignore
-    object2_pie_item_4: bpy.props.EnumProperty(name="Object2 Pie Item 5", items=OBJECT2_OPERATORS, default=defaults["object2"][4]) # type: ignore
-    object2_pie_item_5: bpy.props.EnumProperty(name="Object2 Pie Item 6", items=OBJECT2_OPERATORS, default=defaults["object2"][5]) # type: ignore
-    object2_pie_item_6: bpy.props.EnumProperty(name="Object2 Pie Item 7", items=OBJECT2_OPERATORS, default=defaults["object2"][6]) # type: ignore
-    object2_pie_item_7: bpy.props.EnumProperty(name="Object2 Pie Item 8", items=OBJECT2_OPERATORS, default=defaults["object2"][7]) # type: ignore
-
-    edit_pie_item_0: bpy.props.EnumProperty(name="Edit Pie Item 1", items=EDIT_OPERATORS, default=defaults["edit"][0]) # type: ignore
-    edit_pie_item_1: bpy.props.EnumProperty(name="Edit Pie Item 2", items=EDIT_OPERATORS, default=defaults["edit"][1]) # type: ignore
-    edit_pie_item_2: bpy.props.EnumProperty(name="Edit Pie Item 3", items=EDIT_OPERATORS, default=defaults["edit"][2]) # type: ignore
-    edit_pie_item_3: bpy.props.EnumProperty(name="Edit Pie Item 4", items=EDIT_OPERATORS, default=defaults["edit"][3]) # type: ignore
-    edit_pie_item_4: bpy.props.EnumProperty(name="Edit Pie Item 5", items=EDIT_OPERATORS, default=defaults["edit"][4]) # type: ignore
-    edit_pie_item_5: bpy.props.EnumProperty(name="Edit Pie Item 6", items=EDIT_OPERATORS, default=defaults["edit"][5]) # type: ignore
-    edit_pie_item_6: bpy.props.EnumProperty(name="Edit Pie Item 7", items=EDIT_OPERATORS, default=defaults["edit"][6]) # type: ignore
-    edit_pie_item_7: bpy.props.EnumProperty(name="Edit Pie Item 8", items=EDIT_OPERATORS, default=defaults["edit"][7]) # type: ignore
-
-    object_custom_op_0: bpy.props.StringProperty(name="Object Custom Operator 1") # type: ignore
-    object_custom_op_1: bpy.props.StringProperty(name="Object Custom Operator 2") # type: ignore
-    object_custom_op_2: bpy.props.StringProperty(name="Object Custom Operator 3") # type: ignore
-    object_custom_op_3: bpy.props.StringProperty(name="Object Custom Operator 4") # type: ignore
-    object_custom_op_4: bpy.props.StringProperty(name="Object Custom Operator 5") # type: ignore
-    object_custom_op_5: bpy.props.StringProperty(name="Object Custom Operator 6") # type: ignore
-    object_custom_op_6: bpy.props.StringProperty(name="Object Custom Operator 7") # type: ignore
-    object_custom_op_7: bpy.props.StringProperty(name="Object Custom Operator 8") # type: ignore
-
-    object2_custom_op_0: bpy.props.StringProperty(name="Object2 Custom Operator 1") # type: ignore
-    object2_custom_op_1: bpy.props.StringProperty(name="Object2 Custom Operator 2") # type: ignore
-    object2_custom_op_2: bpy.props.StringProperty(name="Object2 Custom Operator 3") # type: ignore
-    object2_custom_op_3: bpy.props.StringProperty(name="Object2 Custom Operator 4") # type: ignore
-    object2_custom_op_4: bpy.props.StringProperty(name="Object2 Custom Operator 5") # type: ignore
-    object2_custom_op_5: bpy.props.StringProperty(name="Object2 Custom Operator 6") # type: ignore
-    object2_custom_op_6: bpy.props.StringProperty(name="Object2 Custom Operator 7") # type: ignore
-    object2_custom_op_7: bpy.props.StringProperty(name="Object2 Custom Operator 8") # type: ignore
-
-    edit_custom_op_0: bpy.props.StringProperty(name="Edit Custom Operator 1") # type: ignore
-    edit_custom_op_1: bpy.props.StringProperty(name="Edit Custom Operator 2") # type: ignore
-    edit_custom_op_2: bpy.props.StringProperty(name="Edit Custom Operator 3") # type: ignore
-    edit_custom_op_3: bpy.props.StringProperty(name="Edit Custom Operator 4") # type: ignore
-    edit_custom_op_4: bpy.props.StringProperty(name="Edit Custom Operator 5") # type: ignore
-    edit_custom_op_5: bpy.props.StringProperty(name="Edit Custom Operator 6") # type: ignore
-    edit_custom_op_6: bpy.props.StringProperty(name="Edit Custom Operator 7") # type: ignore
-    edit_custom_op_7: bpy.props.StringProperty(name="Edit Custom Operator 8") # type: ignore
+    #   Define the properties for marking gestures
+    use_marking_gestures: bpy.props.BoolProperty(name="Marking Gestures", description="Flick in a direction and release the hotkey to run a slot without drawing the pie menu", default=False) # type: ignore
+    marking_dead_zone: bpy.props.IntProperty(name="Dead Zone", description="Strokes shorter than this many pixels are not treated as a flick", default=20, min=4, max=200, subtype='PIXEL') # type: ignore
+    marking_delay: bpy.props.FloatProperty(name="Hesitation Delay", description="Seconds to wait inside the dead zone before the pie menu is shown", default=0.25, min=0.05, max=2.0, subtype='TIME', unit='TIME') # type: ignore
+
+    #   Define the properties for the profiler
+    use_profiler: bpy.props.BoolProperty(name="Profiler", description="Record how long the pie menus, the search and the dispatch take", default=False, update=update_use_profiler) # type: ignore
+    draw_budget: bpy.props.FloatProperty(name="Draw Budget", description="Milliseconds a pie menu draw may take. Pie menus that keep drawing slower only show their labels until they are fast again, 0 turns this off", default=4.0, min=0.0, max=100.0, precision=1, update=update_draw_budget) # type: ignore
+
+    #   Define the properties for the usage telemetry
+    use_telemetry: bpy.props.BoolProperty(name="Usage", description="Count which slots are chosen and how long choosing takes, stored on this computer only", default=False, update=update_use_telemetry) # type: ignore
+
+    #   Define the properties for the Recent slots
+    use_recent: bpy.props.BoolProperty(name="Recent Slots", description="Remember the operators run from the marking menus and show them in the Recent slots", default=True, update=update_use_recent) # type: ignore
+    recent_order: bpy.props.EnumProperty(name="Order", description="The order the Recent slots show the operators in", items=recent.ORDER_ITEMS, default="RECENT", update=update_recent_order) # type: ignore
+
+    #   Define the hotkey of every mode
+    bindings: bpy.props.CollectionProperty(type=MarkingMenuBinding) # type: ignore
+
+    #   Define the name the slots are saved under as a profile
+    active_profile: bpy.props.StringProperty(name="Profile", description="The name of the profile the slots are saved under, and of the last profile applied", default="Default") # type: ignore
 
     def draw(self, context):
         '''
@@ -190,6 +764,9 @@ class MarkingMenu(bpy.types.AddonPreferences):
         RETURN
             None
         '''
+        #   The slot errors below must match the add-ons enabled now
+        utils.check_operator_catalog(context)
+
         #   Create a parent layout for our preference panels
         parentLayt = self.layout
 
@@ -197,24 +774,213 @@ class MarkingMenu(bpy.types.AddonPreferences):
         parentLayt.label(text = "Marking Menu Settings")
 
         #   Populate the parentLayout with the Marking Menu ui elements
-        for mode in defaults:
-            #   Create a panel in our layout for each mode
-            header, panel = parentLayt.panel(f"linkage_{mode}_marking_menus", default_closed = True)
-            header.label(text=f"{mode.capitalize()} Marking Menus")
+        for ring in schema.RINGS.values():
+            #   Create a panel in our layout for each ring
+            header, panel = parentLayt.panel(f"linkage_{ring.name}_marking_menus", default_closed = True)
+            header.label(text=f"{ring.label} Marking Menus")
 
             if panel:
-                #   Create a row for each mode and populate it with its pie menu options
-                for i in range(8):
+                slots = get_ring_slots(self, ring.name)
+                if len(slots) < schema.SLOT_COUNT:
+                    #   Slots can not be added while drawing
+                    if not bpy.app.timers.is_registered(ensure_slots_timer):
+                        bpy.app.timers.register(ensure_slots_timer)
+                    panel.label(text = "Loading...")
+                    continue
+
+                #   Create a row for each slot and populate it with its pie menu options
+                for i, slot in enumerate(slots):
                     row = panel.row()
-                    prop_name = f"{mode}_pie_item_{i}"
-                    custom_name = f"{mode}_custom_op_{i}"
-                    row.prop(self, prop_name)
+                    row.prop(slot, "item", text = f"{ring.label} Pie Item {i + 1}")
+                    row.prop(slot, "condition", text = "")
 
-                    if getattr(self, prop_name) == "Custom":
+                    if slot.item == "Custom":
                         sub_row = row.row(align=True)
-                        sub_row.prop(self, custom_name, text="")
+                        sub_row.prop(slot, "custom_op", text="")
                         op = sub_row.operator("pie.search_operator", text="", icon='VIEWZOOM')
-                        op.target_property = custom_name
+                        op.target_ring = ring.name
+                        op.target_slot = i
+
+                        #   Show the validation error of the custom operator
+                        error = utils.get_operator_string_error(slot.custom_op)
+                        if error:
+                            panel.label(text = error, icon = 'ERROR')
+
+                    elif slot.item == "Macro":
+                        #   The custom operator field holds the macro steps
+                        row.prop(slot, "custom_op", text="")
+                        error = utils.get_macro_string_error(slot.custom_op)
+                        if error:
+                            panel.label(text = error, icon = 'ERROR')
+
+                    elif slot.item == "Submenu":
+                        #   The custom operator field holds the ring to open
+                        row.prop(slot, "custom_op", text="")
+                        if slot.custom_op.strip() not in schema.RINGS:
+                            panel.label(text = f"Enter the marking menu to open: {', '.join(schema.RINGS)}", icon = 'ERROR')
+
+                    elif slot.item == "Recent":
+                        #   The custom operator field holds the ring whose
+                        #   operators are shown, empty for this ring
+                        row.prop(slot, "custom_op", text="")
+                        if slot.custom_op.strip() and slot.custom_op.strip() not in schema.RINGS:
+                            panel.label(text = f"Enter the marking menu to show: {', '.join(schema.RINGS)}", icon = 'ERROR')
+
+        #   Create a panel for the hotkeys of every mode
+        self.draw_bindings(context, parentLayt)
+
+        #   Create a panel for the named slot profiles
+        header, panel = parentLayt.panel("linkage_marking_profiles", default_closed = True)
+        header.label(text = "Profiles")
+
+        if panel:
+            row = panel.row(align = True)
+            row.prop(self, "active_profile", text = "Name")
+            row.operator("pie.save_profile", text = "", icon = 'FILE_TICK').name = self.active_profile
+
+            #   The profiles are listed by file name
+            active = profiles.get_profile_stem(self.active_profile)
+            for name in profiles.list_profiles(get_profile_directory()):
+                row = panel.row(align = True)
+                row.label(text = name, icon = 'CHECKMARK' if name == active else 'BLANK1')
+                row.operator("pie.apply_profile", text = "Apply").name = name
+                row.operator("pie.delete_profile", text = "", icon = 'TRASH').name = name
+
+            row = panel.row()
+            row.operator("pie.import_profile", icon = 'IMPORT')
+            row.operator("pie.export_profile", icon = 'EXPORT')
+
+        #   Create a panel for the marking gesture settings
+        header, panel = parentLayt.panel("linkage_marking_gestures", default_closed = True)
+        header.prop(self, "use_marking_gestures", text = "")
+        header.label(text = "Marking Gestures")
+
+        if panel:
+            panel.active = self.use_marking_gestures
+            panel.prop(self, "marking_dead_zone")
+            panel.prop(self, "marking_delay")
+
+        #   Create a panel for the profiler timings
+        header, panel = parentLayt.panel("linkage_marking_profiler", default_closed = True)
+        header.prop(self, "use_profiler", text = "")
+        header.label(text = "Profiler")
+
+        if panel:
+            report = profiler.get_report()
+            if not report:
+                panel.label(text = "No timings recorded")
+            else:
+                grid = panel.grid_flow(columns = 5, row_major = True, even_columns = False)
+                for text in ("Path", "Count", "p50 ms", "p95 ms", "Max ms"):
+                    grid.label(text = text)
+                for name, summary in report.items():
+                    grid.label(text = name)
+                    grid.label(text = str(summary["count"]))
+                    grid.label(text = f"{summary['p50']:.3f}")
+                    grid.label(text = f"{summary['p95']:.3f}")
+                    grid.label(text = f"{summary['max']:.3f}")
+
+            #   The draw budget works whether or not timings are recorded
+            row = panel.row()
+            row.prop(self, "draw_budget")
+            row.label(text = watchdog.format_status())
+
+            row = panel.row()
+            row.operator("pie.dump_profile", text = "Dump to Text", icon = 'TEXT').target = 'TEXT'
+            row.operator("pie.dump_profile", text = "Dump to JSON", icon = 'FILE').target = 'JSON'
+            row.operator("pie.reset_profile", text = "Reset", icon = 'TRASH')
+
+        #   Create a panel for the slot usage and the suggested order
+        header, panel = parentLayt.panel("linkage_marking_usage", default_closed = True)
+        header.prop(self, "use_telemetry", text = "")
+        header.label(text = "Usage")
+
+        if panel:
+            rings = telemetry.get_rings()
+            if not rings:
+                panel.label(text = "No usage recorded")
+
+            for ring in (ring for ring in schema.RINGS if ring in rings):
+                stats = telemetry.get_stats(ring)
+                box = panel.box()
+                box.label(text = schema.RINGS[ring].label)
+
+                grid = box.grid_flow(columns = 4, row_major = True, even_columns = False)
+                for text in ("Slot", "Chosen", "Mean Time", "Cancelled"):
+                    grid.label(text = text)
+                for slot in schema.PIE_POSITIONS:
+                    if slot in stats:
+                        mean = stats[slot].mean_select_time()
+                        grid.label(text = f"{gestures.SECTOR_NAMES[slot]}: {get_slot_label(self, ring, slot)}")
+                        grid.label(text = str(stats[slot].invocations))
+                        grid.label(text = "-" if mean is None else f"{mean * 1000:.0f} ms")
+                        grid.label(text = str(stats[slot].cancellations))
+
+                if None in stats:
+                    box.label(text = f"Cancelled without a slot: {stats[None].cancellations}")
+
+                #   Suggest moving the most used slots to the fastest positions,
+                #   listing every slot the suggestion moves
+                order = telemetry.suggest(ring, schema.PIE_POSITIONS)
+                if order is not None:
+                    column = box.column(align = True)
+                    for slot in schema.PIE_POSITIONS:
+                        if order[slot] != slot:
+                            column.label(text = f"Move {get_slot_label(self, ring, slot)} from {gestures.SECTOR_NAMES[slot]} "
+                                                f"to {gestures.SECTOR_NAMES[order[slot]]}", icon = 'INFO')
+                    box.operator("pie.apply_usage_suggestion", icon = 'CHECKMARK').ring = ring
+
+            panel.operator("pie.reset_usage", icon = 'TRASH')
+
+        #   Create a panel for the operators shown by the Recent slots
+        header, panel = parentLayt.panel("linkage_marking_recent", default_closed = True)
+        header.prop(self, "use_recent", text = "")
+        header.label(text = "Recent Slots")
+
+        if panel:
+            panel.prop(self, "recent_order")
+            rankings = recent.get_rankings()
+            if not rankings:
+                panel.label(text = "No operators recorded")
+
+            for ring in (ring for ring in schema.RINGS if ring in rankings):
+                column = panel.column(align = True)
+                column.label(text = schema.RINGS[ring].label)
+                for entry in itertools.islice(recent.get_entries(ring), schema.SLOT_COUNT):
+                    row = column.row()
+                    row.label(text = entry.label)
+                    sub_row = row.row()
+                    sub_row.alignment = 'RIGHT'
+                    sub_row.label(text = f"{rankings[ring].get_count(recent.get_key(entry))}x")
+
+            panel.operator("pie.clear_recent", icon = 'TRASH')
+
+        #   Create a panel for the problems found in the slots
+        entries = diagnostics.get_entries()
+        header, panel = parentLayt.panel("linkage_marking_diagnostics", default_closed = True)
+        header.label(text = f"Diagnostics ({len(entries)})", icon = 'ERROR' if entries else 'NONE')
+
+        if panel:
+            if not entries:
+                panel.label(text = "No problems found")
+
+            for entry in entries:
+                row = panel.row()
+                row.label(text = diagnostics.describe(entry))
+                sub_row = row.row()
+                sub_row.alignment = 'RIGHT'
+                sub_row.label(text = f"{entry.count}x, last {time.strftime('%H:%M:%S', time.localtime(entry.last))}")
+
+            panel.operator("pie.clear_diagnostics", icon = 'TRASH')
+
+        #   Show how long register() and the last schema reload took for
+        #   the generated slots
+        row = parentLayt.row()
+        sub_row = row.row()
+        sub_row.enabled = False
+        sub_row.label(text = f"{len(schema.RINGS) * schema.SLOT_COUNT} slots in {len(schema.RINGS)} rings, registered in {register_time * 1000:.1f} ms"
+                             + (f", reloaded in {reload_time * 1000:.1f} ms" if reload_time is not None else ""))
+        row.operator("pie.reload_schema", text = "", icon = 'FILE_REFRESH')
 
         #   Add a separator line in the ui
         parentLayt.separator(type = "LINE")
@@ -223,3 +989,115 @@ class MarkingMenu(bpy.types.AddonPreferences):
         rowLayt = parentLayt.row()
         op = rowLayt.operator("wm.url_open", text = "Report Issues / Request Feature", icon = "URL")
         op.url = "https://www.github.com/Linkage-Design/MarkingMenu/issues"
+
+    def draw_bindings(self, context, parentLayt):
+        '''
+        DESCRIPTION
+            This method draws the hotkey of every mode, with the other
+            operators that use the same key
+
+        ARGUMENTS
+            context     (in)    A Blender context to get some info from.
+            parentLayt  (in)    The layout to draw in
+
+        RETURN
+            None
+        '''
+        keyconfigs = context.window_manager.keyconfigs
+        keymaps.refresh_index((keyconfigs.user, keyconfigs.addon))
+
+        conflicts = {}
+        for item in self.bindings:
+            binding = get_binding(item)
+            if binding is not None:
+                conflicts[item.mode, item.variant] = keymaps.find_conflicts(binding)
+        count = sum(len(found) for found in conflicts.values())
+
+        header, panel = parentLayt.panel("linkage_marking_hotkeys", default_closed = True)
+        header.label(text = f"Hotkeys ({count} conflicts)" if count else "Hotkeys", icon = 'ERROR' if count else 'NONE')
+
+        if panel:
+            if len(self.bindings) < len(schema.BINDINGS):
+                #   Bindings can not be added while drawing
+                if not bpy.app.timers.is_registered(ensure_slots_timer):
+                    bpy.app.timers.register(ensure_slots_timer)
+                panel.label(text = "Loading...")
+                return
+
+            for item in self.bindings:
+                binding = BINDING_BY_MODE.get((item.mode, item.variant))
+                if binding is None:
+                    continue
+
+                row = panel.row()
+                row.prop(item, "active", text = schema.RINGS[binding.ring].label)
+                sub_row = row.row(align = True)
+                sub_row.active = item.active
+                for modifier in keymaps.MODIFIERS:
+                    sub_row.prop(item, modifier, toggle = True)
+                sub_row.prop(item, "event", text = "")
+
+                for km_name, idname in conflicts.get((item.mode, item.variant), ()):
+                    panel.label(text = f"Also used by {idname} in {km_name}", icon = 'ERROR')
+
+
+def set_ring_properties():
+    '''
+    DESCRIPTION
+        This function adds a slot group for each ring of the schema to the
+        preferences. It is called before the class is registered.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    for name in RING_PROPERTIES.values():
+        MarkingMenu.__annotations__.pop(name, None)
+
+    RING_PROPERTIES.clear()
+    RING_PROPERTIES.update({ring: f"ring_{ring}" for ring in schema.RINGS})
+    MarkingMenu.__annotations__.update({
+        RING_PROPERTIES[ring.name]: bpy.props.PointerProperty(type = CATALOG_GROUPS[ring.catalog][1])
+        for ring in schema.RINGS.values()
+    })
+
+    BINDING_BY_MODE.clear()
+    BINDING_BY_MODE.update({(binding.mode, binding.variant): binding for binding in schema.BINDINGS})
+
+set_ring_properties()
+
+
+def rebuild_property_groups(catalogs):
+    '''
+    DESCRIPTION
+        This function registers the preferences again after the schema was
+        reloaded. Only the property groups of the given catalogs are
+        generated again, the other groups stay registered and keep their
+        values.
+
+    ARGUMENTS
+        catalogs    (in)    The names of the catalogs that changed
+
+    RETURN
+        None
+    '''
+    global classes
+
+    #   The preferences hold pointers to the groups, they go first
+    bpy.utils.unregister_class(MarkingMenu)
+
+    for name in catalogs:
+        for group in reversed(CATALOG_GROUPS.pop(name, ())):
+            bpy.utils.unregister_class(group)
+
+        if name in schema.CATALOGS:
+            CATALOG_GROUPS[name] = make_catalog_groups(name, schema.CATALOGS[name])
+            for group in CATALOG_GROUPS[name]:
+                bpy.utils.register_class(group)
+
+    classes = (*(group for groups in CATALOG_GROUPS.values() for group in groups), MarkingMenuBinding)
+
+    set_ring_properties()
+    bpy.utils.register_class(MarkingMenu)
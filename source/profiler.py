@@ -0,0 +1,319 @@
+################################################################################
+#
+#   profiler.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the opt-in profiler of the Marking Menus Blender
+#       Add-on. Hot paths are wrapped with the timed() decorator, which only
+#       checks a flag when profiling is off. When it is on, every call is
+#       added to a histogram of log-spaced buckets, so the count, p50, p95
+#       and max of each path are kept in constant memory.
+#
+#       Profiling is turned on from the add-on preferences, or for the whole
+#       session by setting the MARKINGMENU_PROFILE environment variable.
+#
+#       This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  functools
+import  math
+import  os
+import  time
+
+###############################################################################
+#
+#   Profiler Definitions
+#
+###############################################################################
+
+#   Setting this environment variable to anything but "" or "0" turns the
+#   profiler on for the session
+ENV_VARIABLE = "MARKINGMENU_PROFILE"
+
+#   The histogram buckets, 8 per doubling from 100 nanoseconds up
+BUCKETS_PER_OCTAVE = 8
+MIN_SECONDS        = 1e-7
+
+#   True while timings are recorded
+enabled = os.environ.get(ENV_VARIABLE, "") not in ("", "0")
+
+#   The histograms keyed by the name of the timed path
+_histograms = {}
+
+#   The perf_counter of the last hotkey press, until the pie is drawn and
+#   until the operator chosen with it runs
+_keypress          = None
+_operator_keypress = None
+
+
+class Histogram:
+    '''
+    DESCRIPTION
+        This class aggregates the timings of a single path into log-spaced
+        buckets. Percentiles are accurate to one bucket (about 9%).
+    '''
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count   = 0
+        self.total   = 0.0
+        self.max     = 0.0
+        self.buckets = {}
+
+    def add(self, seconds):
+        '''
+        DESCRIPTION
+            This method adds a timing to the histogram
+
+        ARGUMENTS
+            seconds     (in)    The duration in seconds
+
+        RETURN
+            None
+        '''
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+        index = 0
+        if seconds > MIN_SECONDS:
+            index = int(math.log2(seconds / MIN_SECONDS) * BUCKETS_PER_OCTAVE) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, fraction):
+        '''
+        DESCRIPTION
+            This method returns the upper bound of the bucket a percentile
+            falls into
+
+        ARGUMENTS
+            fraction    (in)    The percentile as a fraction, e.g. 0.95
+
+        RETURN
+            The duration in seconds
+        '''
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(MIN_SECONDS * 2 ** (index / BUCKETS_PER_OCTAVE), self.max)
+        return self.max
+
+    def summary(self):
+        '''
+        DESCRIPTION
+            This method summarizes the histogram in milliseconds
+
+        ARGUMENTS
+            None
+
+        RETURN
+            A {count, mean, p50, p95, max} dictionary
+        '''
+        return { "count": self.count,
+                 "mean":  round(self.total / self.count * 1000, 4) if self.count else 0.0,
+                 "p50":   round(self.percentile(0.50) * 1000, 4),
+                 "p95":   round(self.percentile(0.95) * 1000, 4),
+                 "max":   round(self.max * 1000, 4) }
+
+
+###############################################################################
+#
+#   Profiler Functions
+#
+###############################################################################
+def set_enabled(value):
+    '''
+    DESCRIPTION
+        This function turns the profiler on or off. The environment variable
+        keeps it on for the whole session.
+
+    ARGUMENTS
+        value       (in)    True to record timings
+
+    RETURN
+        True if the profiler is on
+    '''
+    global enabled
+
+    enabled = bool(value) or os.environ.get(ENV_VARIABLE, "") not in ("", "0")
+    return enabled
+
+
+def record(name, seconds):
+    '''
+    DESCRIPTION
+        This function adds a timing to the histogram of a path
+
+    ARGUMENTS
+        name        (in)    The name of the timed path
+        seconds     (in)    The duration in seconds
+
+    RETURN
+        None
+    '''
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    histogram.add(seconds)
+
+
+def timed(name):
+    '''
+    DESCRIPTION
+        This function creates a decorator that records the duration of every
+        call of a function while the profiler is on. The attributes of
+        functools.lru_cache wrappers are kept.
+
+    ARGUMENTS
+        name        (in)    The name of the timed path
+
+    RETURN
+        A decorator
+    '''
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        for attr in ("cache_info", "cache_clear"):
+            if hasattr(func, attr):
+                setattr(wrapper, attr, getattr(func, attr))
+        return wrapper
+
+    return decorator
+
+
+def mark_keypress():
+    '''
+    DESCRIPTION
+        This function remembers when a hotkey was pressed, so the time until
+        the pie is drawn can be recorded by draw_done(), and the time until
+        the chosen operator ran by operator_done()
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _keypress, _operator_keypress
+
+    if enabled:
+        _keypress = _operator_keypress = time.perf_counter()
+
+
+def draw_done():
+    '''
+    DESCRIPTION
+        This function records the time from the last hotkey press to the
+        first draw of its pie
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _keypress
+
+    if _keypress is not None:
+        record("keypress_to_draw", time.perf_counter() - _keypress)
+        _keypress = None
+
+
+def operator_done():
+    '''
+    DESCRIPTION
+        This function records the time from the last hotkey press to the
+        operator chosen from its pie or with a marking gesture, including
+        any sub-menus opened on the way
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _operator_keypress
+
+    if _operator_keypress is not None:
+        record("keypress_to_operator", time.perf_counter() - _operator_keypress)
+        _operator_keypress = None
+
+
+def get_report():
+    '''
+    DESCRIPTION
+        This function summarizes every histogram
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A {name: summary} dictionary sorted by name, times in milliseconds
+    '''
+    return {name: _histograms[name].summary() for name in sorted(_histograms)}
+
+
+def format_report():
+    '''
+    DESCRIPTION
+        This function formats the report as a text table
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A string
+    '''
+    lines = [f"{'path':<28}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for name, summary in get_report().items():
+        lines.append(f"{name:<28}{summary['count']:>8}{summary['p50']:>10.3f}"
+                     f"{summary['p95']:>10.3f}{summary['max']:>10.3f}")
+    return "\n".join(lines)
+
+
+def reset():
+    '''
+    DESCRIPTION
+        This function throws away every recorded timing
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _keypress, _operator_keypress
+
+    _histograms.clear()
+    _keypress          = None
+    _operator_keypress = None
@@ -0,0 +1,393 @@
+################################################################################
+#
+#   profiles.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the slot profiles of the Marking Menus Blender
+#       Add-on. A profile is a named snapshot of every ring's slots, stored
+#       as a compact JSON file so the same layout can be shared between
+#       seats:
+#
+#           { "version": 1,
+#             "name":    "Studio",
+#             "rings":   { "object": [["object.delete"],
+#                                     ["Custom", "object.shade_smooth_by_angle"],
+#                                     ["Macro", "object.select_all; object.join", "MULTIPLE"],
+#                                     ...] } }
+#
+#       A slot is [item, custom operator, condition], trailing defaults are
+#       left out. Files written by hand may also use the flat properties of
+#       older versions, {ring}_pie_item_N and {ring}_custom_op_N, in a
+#       "properties" object.
+#
+#       A profile is validated as a whole before anything is applied, and
+#       parsed profiles are cached by file, so switching between profiles
+#       does not touch the disk again.
+#
+#       This module does not depend on bpy, the slot validation is passed
+#       in.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  json
+import  os
+import  re
+
+from    collections import namedtuple
+
+from    . import opstring
+from    . import predicates
+from    . import schema
+
+###############################################################################
+#
+#   Profile Definitions
+#
+###############################################################################
+
+#   The version of the file format
+PROFILE_VERSION = 1
+
+#   The folder of the named profiles in the extension user directory
+PROFILE_DIRECTORY = "profiles"
+
+#   The extension of a profile file
+PROFILE_EXTENSION = ".json"
+
+#   The value of a single slot
+SlotValue = namedtuple("SlotValue", ("item", "custom_op", "condition"), defaults = ("", "ALWAYS"))
+
+#   An empty slot
+EMPTY_SLOT = SlotValue("Empty")
+
+#   The flat property names of older versions
+FLAT_PROPERTY = re.compile(r"^(\w+)_(pie_item|custom_op)_(\d+)$")
+
+#   Parsed profiles keyed by path, (modification time, catalog key, name,
+#   rings)
+_cache = {}
+
+
+class ProfileError(Exception):
+    '''
+    DESCRIPTION
+        This exception is raised when a profile can not be applied. It
+        holds every problem found, not just the first.
+    '''
+    def __init__(self, problems):
+        self.problems = list(problems)
+        super().__init__("; ".join(self.problems))
+
+
+###############################################################################
+#
+#   Profile Functions
+#
+###############################################################################
+def to_json(name, rings):
+    '''
+    DESCRIPTION
+        This function converts the slots of every ring to the profile format
+
+    ARGUMENTS
+        name        (in)    The name of the profile
+        rings       (in)    A {ring: sequence of SlotValue} dictionary
+
+    RETURN
+        The json serializable profile
+    '''
+    data = {}
+    for ring, values in rings.items():
+        slots = []
+        for value in values:
+            #   Leave out the default condition and the empty custom operator
+            slot = [value.item, value.custom_op, value.condition]
+            if value.condition == "ALWAYS":
+                slot.pop()
+                if not value.custom_op:
+                    slot.pop()
+            slots.append(slot)
+        data[ring] = slots
+
+    return {"version": PROFILE_VERSION, "name": name, "rings": data}
+
+
+def parse_profile(data, validate_slot):
+    '''
+    DESCRIPTION
+        This function validates a whole profile before any of it is applied
+
+    ARGUMENTS
+        data            (in)    The decoded json of the profile
+        validate_slot   (in)    A function called with the ring name and
+                                the SlotValue, raising an
+                                opstring.OperatorStringError when the slot
+                                can not be compiled
+
+    RETURN
+        A {ring: tuple of schema.SLOT_COUNT SlotValue} dictionary of the
+        rings in the profile
+
+    RAISES
+        ProfileError with every problem found
+    '''
+    if not isinstance(data, dict):
+        raise ProfileError(["A profile must be a JSON object"])
+
+    version = data.get("version", PROFILE_VERSION)
+    if not isinstance(version, int) or version > PROFILE_VERSION:
+        raise ProfileError([f"Profile version {version} is newer than this add-on supports"])
+
+    problems = []
+    slots    = {}
+
+    rings = data.get("rings", {})
+    if not isinstance(rings, dict):
+        problems.append("'rings' must be an object of ring names")
+        rings = {}
+
+    for ring, values in rings.items():
+        if ring not in schema.RINGS:
+            problems.append(f"Unknown marking menu '{ring}'")
+            continue
+        if not isinstance(values, list) or len(values) > schema.SLOT_COUNT:
+            problems.append(f"{ring}: expected a list of up to {schema.SLOT_COUNT} slots")
+            continue
+        for index, value in enumerate(values):
+            if isinstance(value, str):
+                value = [value]
+            if not isinstance(value, list) or not 1 <= len(value) <= 3 or not all(isinstance(v, str) for v in value):
+                problems.append(f"{ring} slot {index + 1}: expected [item, custom operator, condition]")
+                continue
+            slots[ring, index] = SlotValue(*value)
+
+    #   The flat properties of older versions, indexed from 0
+    flat = data.get("properties", {})
+    for key, value in (flat.items() if isinstance(flat, dict) else ()):
+        match = FLAT_PROPERTY.match(key)
+        if match is None:
+            problems.append(f"Unknown property '{key}'")
+            continue
+
+        ring, kind, index = match.group(1), match.group(2), int(match.group(3))
+        slot = slots.get((ring, index), EMPTY_SLOT)
+        if kind == "custom_op":
+            slots[ring, index] = slot._replace(custom_op = str(value))
+            continue
+
+        #   Items were stored as the index of the item in the catalog
+        if isinstance(value, int) and ring in schema.RINGS:
+            enum_items = schema.CATALOGS[schema.RINGS[ring].catalog].enum_items
+            value = enum_items[value][0] if 0 <= value < len(enum_items) else str(value)
+        slots[ring, index] = slot._replace(item = str(value))
+
+    profile = {}
+    for (ring, index), value in sorted(slots.items()):
+        if ring not in schema.RINGS:
+            problems.append(f"Unknown marking menu '{ring}'")
+            continue
+        if not 0 <= index < schema.SLOT_COUNT:
+            problems.append(f"{ring} slot {index + 1}: a ring has {schema.SLOT_COUNT} slots")
+            continue
+
+        problem = check_slot(ring, value, validate_slot)
+        if problem is not None:
+            problems.append(f"{ring} slot {index + 1}: {problem}")
+            continue
+
+        profile.setdefault(ring, [EMPTY_SLOT] * schema.SLOT_COUNT)[index] = value
+
+    #   Report each unknown ring once
+    problems = list(dict.fromkeys(problems))
+    if problems:
+        raise ProfileError(problems)
+    if not profile:
+        raise ProfileError(["The profile has no slots"])
+
+    return {ring: tuple(values) for ring, values in profile.items()}
+
+
+def check_slot(ring, value, validate_slot):
+    '''
+    DESCRIPTION
+        This function checks the value of a single slot
+
+    ARGUMENTS
+        ring            (in)    The name of the ring in schema.RINGS
+        value           (in)    The SlotValue
+        validate_slot   (in)    The slot validation of parse_profile
+
+    RETURN
+        The problem, or None if the slot is valid
+    '''
+    catalog = schema.CATALOGS[schema.RINGS[ring].catalog]
+    if value.item not in catalog:
+        return f"'{value.item}' is not in the {catalog.name} catalog"
+    if value.condition not in predicates.CONDITIONS:
+        return f"Unknown condition '{value.condition}'"
+
+    try:
+        validate_slot(ring, value)
+    except opstring.OperatorStringError as err:
+        return str(err)
+    return None
+
+
+###############################################################################
+#
+#   Profile File Functions
+#
+###############################################################################
+def get_profile_stem(name):
+    '''
+    DESCRIPTION
+        This function returns the file name of a named profile without its
+        extension, which is the name list_profiles() returns for it
+
+    ARGUMENTS
+        name        (in)    The name of the profile
+
+    RETURN
+        The name with the characters a file name can not hold replaced
+    '''
+    return re.sub(r"[^\w\- ]", "_", name).strip() or "Profile"
+
+
+def get_profile_path(directory, name):
+    '''
+    DESCRIPTION
+        This function returns the file of a named profile
+
+    ARGUMENTS
+        directory   (in)    The profile directory
+        name        (in)    The name of the profile
+
+    RETURN
+        The path of the file
+    '''
+    return os.path.join(directory, get_profile_stem(name) + PROFILE_EXTENSION)
+
+
+def list_profiles(directory):
+    '''
+    DESCRIPTION
+        This function returns the names of the profiles in a directory
+
+    ARGUMENTS
+        directory   (in)    The profile directory
+
+    RETURN
+        A sorted list of names
+    '''
+    try:
+        filenames = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted((os.path.splitext(filename)[0] for filename in filenames
+                   if filename.endswith(PROFILE_EXTENSION)), key = str.lower)
+
+
+def load_profile(path, validate_slot, catalog_key = None):
+    '''
+    DESCRIPTION
+        This function reads and validates a profile file. The result is
+        cached until the file or the set of operators changes.
+
+    ARGUMENTS
+        path            (in)    The path of the file
+        validate_slot   (in)    The slot validation of parse_profile
+        catalog_key     (in)    The key of the operators validate_slot
+                                checks against, which changes when an
+                                add-on is enabled or disabled
+
+    RETURN
+        The name of the profile and its {ring: tuple of SlotValue}
+
+    RAISES
+        ProfileError when the file can not be read or is not valid
+    '''
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError as err:
+        raise ProfileError([f"Could not read {path}: {err.strerror}"]) from None
+
+    cached = _cache.get(path)
+    if cached is not None and cached[:2] == (mtime, catalog_key):
+        return cached[2], cached[3]
+
+    try:
+        with open(path, "r", encoding = "utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError) as err:
+        raise ProfileError([f"Could not read {path}: {err}"]) from None
+
+    rings = parse_profile(data, validate_slot)
+    name  = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+    _cache[path] = (mtime, catalog_key, str(name), rings)
+    return str(name), rings
+
+
+def save_profile(path, name, rings):
+    '''
+    DESCRIPTION
+        This function writes a profile file. The file is replaced
+        atomically so a reader never sees a partial file.
+
+    ARGUMENTS
+        path        (in)    The path of the file
+        name        (in)    The name of the profile
+        rings       (in)    A {ring: sequence of SlotValue} dictionary
+
+    RETURN
+        None
+
+    RAISES
+        ProfileError when the file can not be written
+    '''
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok = True)
+        with open(f"{path}.tmp", "w", encoding = "utf-8") as file:
+            json.dump(to_json(name, rings), file, separators = (",", ":"))
+        os.replace(f"{path}.tmp", path)
+    except OSError as err:
+        raise ProfileError([f"Could not write {path}: {err.strerror}"]) from None
+
+    #   The preferences may hold slots that do not compile, so the file is
+    #   validated again when it is loaded
+    _cache.pop(path, None)
+
+
+def delete_profile(path):
+    '''
+    DESCRIPTION
+        This function deletes a profile file
+
+    ARGUMENTS
+        path        (in)    The path of the file
+
+    RETURN
+        True if the file was deleted
+    '''
+    _cache.pop(path, None)
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,611 @@
+################################################################################
+#
+#   recent.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the Recent slots of the Marking Menus Blender
+#       Add-on. Every operator run from a marking menu is added to the
+#       ranking of its ring, which keeps both the order the operators were
+#       last used in and how often they were used, each updated in constant
+#       time. The ranking stores the compiled plan entries, so a Recent
+#       slot shows an operator without parsing anything.
+#
+#       A draw plan with Recent slots is resolved against the rankings
+#       before it is drawn. The resolved plan is cached until a ranking
+#       changes, so a redraw costs the same as for a plan of fixed slots.
+#
+#       This module does not depend on bpy, the file in the extension user
+#       directory is read and written by the add-on.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+from    collections import OrderedDict
+
+from    . import plans
+
+###############################################################################
+#
+#   Ranking Definitions
+#
+###############################################################################
+
+#   The file in the extension user directory
+RECENT_FILE = "recent.json"
+
+#   The version of the file format. Version 2 tags the tuples and sets of
+#   operator arguments, version 1 only stored tuples, as lists.
+RECENT_VERSION = 2
+
+#   The most operators remembered for a ring. The least recently used one
+#   is forgotten first.
+CAPACITY = 32
+
+#   The orders the Recent slots can show the operators in
+ORDER_ITEMS = [
+    ("RECENT",   "Most Recent", "Show the operators run last first"),
+    ("FREQUENT", "Most Used",   "Show the operators run most often first")
+]
+
+
+class _Bucket:
+    '''
+    DESCRIPTION
+        This class holds the keys used the same number of times. The buckets
+        of a ranking form a list sorted by count, and the keys of a bucket
+        are kept in the order they reached it.
+    '''
+    __slots__ = ("count", "keys", "lower", "higher")
+
+    def __init__(self, count, lower, higher):
+        self.count  = count
+        self.keys   = OrderedDict()
+        self.lower  = lower
+        self.higher = higher
+
+
+class UsageRanking:
+    '''
+    DESCRIPTION
+        This class ranks the operators run from a ring by recency and by
+        frequency. Using an operator moves it to the end of the recency
+        order and into the next bucket of the frequency list, both in
+        constant time. Reading the first n operators of either order takes
+        n steps.
+    '''
+    __slots__ = ("capacity", "_entries", "_buckets", "_lowest", "_highest")
+
+    def __init__(self, capacity = CAPACITY):
+        self.capacity  = capacity
+        self._entries  = OrderedDict()
+        self._buckets  = {}
+        self._lowest   = None
+        self._highest  = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key, entry, count = 1):
+        '''
+        DESCRIPTION
+            This method records the use of an operator
+
+        ARGUMENTS
+            key         (in)    The hashable key of the operator
+            entry       (in)    The PlanEntry that runs it
+            count       (in)    The number of uses to add
+
+        RETURN
+            None
+        '''
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.capacity:
+            self.remove(next(iter(self._entries)))
+        self._entries[key] = entry
+
+        old    = self._buckets.get(key)
+        target = (old.count if old is not None else 0) + count
+
+        #   A single use moves at most one bucket up, only counts read
+        #   from the file walk further
+        lower  = old
+        higher = old.higher if old is not None else self._lowest
+        while higher is not None and higher.count < target:
+            lower, higher = higher, higher.higher
+
+        if higher is not None and higher.count == target:
+            bucket = higher
+        else:
+            bucket = _Bucket(target, lower, higher)
+            if lower is not None:
+                lower.higher = bucket
+            else:
+                self._lowest = bucket
+            if higher is not None:
+                higher.lower = bucket
+            else:
+                self._highest = bucket
+
+        bucket.keys[key]   = None
+        self._buckets[key] = bucket
+        if old is not None:
+            self._discard(old, key)
+
+    def remove(self, key):
+        '''
+        DESCRIPTION
+            This method forgets an operator
+
+        ARGUMENTS
+            key         (in)    The key of the operator
+
+        RETURN
+            None
+        '''
+        del self._entries[key]
+        self._discard(self._buckets.pop(key), key)
+
+    def _discard(self, bucket, key):
+        del bucket.keys[key]
+        if bucket.keys:
+            return
+
+        if bucket.lower is not None:
+            bucket.lower.higher = bucket.higher
+        else:
+            self._lowest = bucket.higher
+        if bucket.higher is not None:
+            bucket.higher.lower = bucket.lower
+        else:
+            self._highest = bucket.lower
+
+    def get_count(self, key):
+        '''
+        DESCRIPTION
+            This method returns how often an entry was run
+
+        ARGUMENTS
+            key         (in)    The key of the entry
+
+        RETURN
+            The count, 0 for entries that are not ranked
+        '''
+        bucket = self._buckets.get(key)
+        return bucket.count if bucket is not None else 0
+
+    def most_recent(self):
+        '''
+        DESCRIPTION
+            This method iterates the entries, the one run last first
+
+        ARGUMENTS
+            None
+
+        RETURN
+            An iterator of PlanEntry
+        '''
+        return reversed(self._entries.values())
+
+    def most_frequent(self):
+        '''
+        DESCRIPTION
+            This method iterates the entries, the one run most often first.
+            Entries run equally often are in the order they were run last.
+
+        ARGUMENTS
+            None
+
+        RETURN
+            An iterator of PlanEntry
+        '''
+        bucket = self._highest
+        while bucket is not None:
+            for key in reversed(bucket.keys):
+                yield self._entries[key]
+            bucket = bucket.lower
+
+    def items(self):
+        '''
+        DESCRIPTION
+            This method returns the entries and their counts, the least
+            recently used first, which is the order to add them back in
+
+        ARGUMENTS
+            None
+
+        RETURN
+            A list of (key, PlanEntry, count) tuples
+        '''
+        return [(key, entry, self._buckets[key].count) for key, entry in self._entries.items()]
+
+
+#   True while the operators run from the marking menus are recorded
+enabled = False
+
+#   The order of the Recent slots, an identifier of ORDER_ITEMS
+order = "RECENT"
+
+#   The rankings keyed by ring
+_rankings = {}
+
+#   Incremented whenever a ranking or the order changes
+_version = 0
+
+#   The resolved plans keyed by ring, (plan, version, resolved plan)
+_resolved = {}
+
+#   True once a resolved plan had a Recent slot, the slot tries must then
+#   follow the rankings
+_in_use = False
+
+#   True when the rankings changed since they were saved
+_dirty = False
+
+
+###############################################################################
+#
+#   Recording Functions
+#
+###############################################################################
+def set_enabled(value):
+    '''
+    DESCRIPTION
+        This function turns the recording on or off
+
+    ARGUMENTS
+        value       (in)    True to record the operators run
+
+    RETURN
+        True if recording is on
+    '''
+    global enabled
+
+    enabled = bool(value)
+    return enabled
+
+
+def set_order(value):
+    '''
+    DESCRIPTION
+        This function sets the order of the Recent slots
+
+    ARGUMENTS
+        value       (in)    An identifier of ORDER_ITEMS
+
+    RETURN
+        None
+    '''
+    global order
+
+    if value != order:
+        order = value
+        _changed()
+
+
+def get_key(entry):
+    '''
+    DESCRIPTION
+        This function returns the ranking key of a plan entry. The label
+        and condition do not make a different operator.
+
+    ARGUMENTS
+        entry       (in)    The PlanEntry
+
+    RETURN
+        A hashable key
+    '''
+    return entry.op_name, entry.op_args
+
+
+def record(ring, entry):
+    '''
+    DESCRIPTION
+        This function records an operator run from a ring
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        entry       (in)    The PlanEntry that was run
+
+    RETURN
+        None
+    '''
+    global _dirty
+
+    #   Opening a sub-menu does not run an operator
+    if not enabled or entry is None or entry.op_name is None or entry.submenu is not None:
+        return
+
+    ranking = _rankings.get(ring)
+    if ranking is None:
+        ranking = _rankings[ring] = UsageRanking()
+    ranking.add(get_key(entry), entry._replace(condition = "ALWAYS"))
+
+    _dirty = True
+    _changed()
+
+
+def get_entries(ring):
+    '''
+    DESCRIPTION
+        This function iterates the operators of a ring in the order of the
+        Recent slots
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+
+    RETURN
+        An iterator of PlanEntry
+    '''
+    ranking = _rankings.get(ring)
+    if ranking is None:
+        return iter(())
+    return ranking.most_frequent() if order == "FREQUENT" else ranking.most_recent()
+
+
+def get_rankings():
+    '''
+    DESCRIPTION
+        This function returns the rankings
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A {ring: UsageRanking} dictionary
+    '''
+    return dict(_rankings)
+
+
+def clear():
+    '''
+    DESCRIPTION
+        This function forgets every operator
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _dirty
+
+    _rankings.clear()
+    _dirty = True
+    _changed()
+
+
+def _changed():
+    '''
+    DESCRIPTION
+        This function is called when a ranking or the order changes. The
+        resolved plans are built again when they are next asked for, and
+        the gesture tries are thrown away once the Recent slots are in use.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _version
+
+    _version += 1
+    if _in_use:
+        plans.invalidate_tries()
+
+
+###############################################################################
+#
+#   Draw Plan Functions
+#
+###############################################################################
+def resolve(ring, plan, refresh = True):
+    '''
+    DESCRIPTION
+        This function fills the Recent slots of a draw plan with the
+        operators of their ranking. The slots are filled in plan order, so
+        the first operator goes to the first pie position, and operators
+        already in a fixed slot of the plan are skipped. A plan without
+        Recent slots is returned as it is.
+
+    ARGUMENTS
+        ring        (in)    The name of the ring of the plan
+        plan        (in)    The tuple of PlanEntry / None items
+        refresh     (in)    False to keep the cached result of the plan
+                            when only a ranking changed
+
+    RETURN
+        The resolved plan, the same tuple until the plan or a ranking
+        changes
+    '''
+    global _in_use
+
+    cached = _resolved.get(ring)
+    if cached is not None and cached[0] is plan and (cached[1] == _version or not refresh):
+        return cached[2]
+
+    resolved = plan
+    if any(entry is not None and entry.op_name is None for entry in plan):
+        _in_use = True
+        fixed   = {get_key(entry) for entry in plan if entry is not None and entry.op_name is not None}
+        sources = {}
+        resolved = []
+        for entry in plan:
+            if entry is None or entry.op_name is not None:
+                resolved.append(entry)
+                continue
+
+            source  = dict(entry.op_args).get("ring", ring)
+            entries = sources.get(source)
+            if entries is None:
+                entries = sources[source] = get_entries(source)
+
+            recent = next((item for item in entries if get_key(item) not in fixed), None)
+            resolved.append(recent._replace(condition = entry.condition) if recent is not None else None)
+        resolved = tuple(resolved)
+
+    _resolved[ring] = (plan, _version, resolved)
+    return resolved
+
+
+###############################################################################
+#
+#   File Functions
+#
+###############################################################################
+def is_dirty():
+    '''
+    DESCRIPTION
+        This function tells whether the rankings changed since they were
+        last saved or loaded
+
+    ARGUMENTS
+        None
+
+    RETURN
+        True if the rankings must be saved
+    '''
+    return _dirty
+
+
+def mark_saved():
+    '''
+    DESCRIPTION
+        This function records that the rankings were written to the file
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _dirty
+
+    _dirty = False
+
+
+def to_json():
+    '''
+    DESCRIPTION
+        This function converts the rankings to the file format
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The json serializable rankings
+    '''
+    rings = {}
+    for ring, ranking in _rankings.items():
+        rings[ring] = [[entry.op_name, entry.label, [[arg, encode_value(value)] for arg, value in entry.op_args], count]
+                       for _, entry, count in ranking.items()]
+    return {"version": RECENT_VERSION, "rings": rings}
+
+
+def encode_value(value):
+    '''
+    DESCRIPTION
+        This function converts an operator argument value to json. Tuples
+        and the sets of enum flag arguments become tagged objects, so they
+        are read back as the same type.
+
+    ARGUMENTS
+        value       (in)    A bool, int, float, str, tuple or frozenset
+
+    RETURN
+        The json serializable value
+    '''
+    if isinstance(value, tuple):
+        return {"tuple": [encode_value(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"set": sorted(value)}
+    return value
+
+
+def decode_value(value):
+    '''
+    DESCRIPTION
+        This function converts a json operator argument value back, the
+        inverse of encode_value. Lists are the tuples of version 1.
+
+    ARGUMENTS
+        value       (in)    The decoded json value
+
+    RETURN
+        A bool, int, float, str, tuple or frozenset
+
+    RAISES
+        ValueError when the value is not an operator argument value
+    '''
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return tuple(decode_value(item) for item in value)
+    if isinstance(value, dict) and len(value) == 1:
+        if isinstance(value.get("tuple"), list):
+            return tuple(decode_value(item) for item in value["tuple"])
+        if isinstance(value.get("set"), list) and all(isinstance(item, str) for item in value["set"]):
+            return frozenset(value["set"])
+    raise ValueError(f"Unknown argument value {value!r}")
+
+
+def from_json(data, validate_operator = None):
+    '''
+    DESCRIPTION
+        This function replaces the rankings with the ones read from the
+        file. Entries that can not be read are skipped, and so are the
+        operators validate_operator rejects, because their arguments are
+        set on the pie items as they are.
+
+    ARGUMENTS
+        data                (in)    The decoded json of the file
+        validate_operator   (in)    A function returning the (op_name,
+                                    op_args) of a valid operator, with the
+                                    values coerced, and raising ValueError
+                                    otherwise. None to keep every operator.
+
+    RETURN
+        The number of entries read
+    '''
+    global _dirty
+
+    _rankings.clear()
+    count = 0
+    rings = data.get("rings", {}) if isinstance(data, dict) else {}
+    for ring, items in (rings.items() if isinstance(rings, dict) else ()):
+        ranking = UsageRanking()
+        for item in items if isinstance(items, list) else ():
+            try:
+                op_name, label, op_args, uses = item
+                op_name = str(op_name)
+                op_args = tuple((str(arg), decode_value(value)) for arg, value in op_args)
+                if validate_operator is not None:
+                    op_name, op_args = validate_operator(op_name, op_args)
+                entry   = plans.PlanEntry(op_name, str(label), op_args)
+                ranking.add(get_key(entry), entry, max(1, int(uses)))
+                count += 1
+            except (ValueError, TypeError):
+                continue
+        if len(ranking):
+            _rankings[ring] = ranking
+
+    _dirty = False
+    _changed()
+    return count
@@ -0,0 +1,374 @@
+################################################################################
+#
+#   schema.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the schema of the Marking Menus Blender Add-on. It
+#       declares every ring (pie menu) and which Blender mode and hotkey opens
+#       it, and the operator catalogs and default slots of the rings. The
+#       pie menu classes, the preference properties and the keymap entries
+#       are all generated from these tables, so supporting another mode is a
+#       matter of adding a row and an operator catalog here.
+#
+#       This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+from collections import namedtuple
+
+from . import catalog
+
+###############################################################################
+#
+#   Schema Definitions
+#
+###############################################################################
+
+#   The number of slots in a ring
+SLOT_COUNT = 8
+
+#   The order Blender fills the positions of a pie in, as slot indexes
+#   (compass sectors, 0 = North, clockwise): West, East, South, North, then
+#   the diagonals. The first positions are also the fastest to reach.
+PIE_POSITIONS = (6, 2, 4, 0, 7, 1, 5, 3)
+
+#   A ring is a single pie menu of SLOT_COUNT slots. catalog is the key of
+#   its operator catalog in CATALOGS.
+Ring = namedtuple("Ring", ("name", "label", "bl_idname", "catalog"))
+
+#   A hotkey variant, the operator it calls and the event that calls it
+Hotkey = namedtuple("Hotkey", ("variant", "idname", "event", "modifiers"))
+
+#   A binding opens a ring when the hotkey variant is pressed in a Blender
+#   mode (context.mode). keymap is the name of the keymap of that mode.
+Binding = namedtuple("Binding", ("mode", "variant", "ring", "keymap"))
+
+#   The rings, keyed by name
+RINGS = {ring.name: ring for ring in (
+    Ring("object",   "Object Mode",        "PIE_MT_customizable_selections_object",   "object"),
+    Ring("object2",  "Object Mode 2",      "PIE_MT_customizable_selections_object_2", "object"),
+    Ring("edit",     "Edit Mode",          "PIE_MT_customizable_selections_edit",     "edit"),
+    Ring("curve",    "Edit Curve",         "PIE_MT_customizable_selections_curve",    "curve"),
+    Ring("armature", "Edit Armature",      "PIE_MT_customizable_selections_armature", "armature"),
+    Ring("sculpt",   "Sculpt Mode",        "PIE_MT_customizable_selections_sculpt",   "sculpt"),
+    Ring("pose",     "Pose Mode",          "PIE_MT_customizable_selections_pose",     "pose"),
+    Ring("weight",   "Weight Paint",       "PIE_MT_customizable_selections_weight",   "weight"),
+    Ring("gpencil",  "Grease Pencil Edit", "PIE_MT_customizable_selections_gpencil",  "gpencil"),
+
+    #   Rings without a binding, only opened from Sub-Menu slots
+    Ring("object_extra", "Object Extra",   "PIE_MT_customizable_selections_object_extra", "object"),
+    Ring("edit_extra",   "Edit Extra",     "PIE_MT_customizable_selections_edit_extra",   "edit"),
+)}
+
+#   The hotkey variants, keyed by variant number
+HOTKEYS = {hotkey.variant: hotkey for hotkey in (
+    Hotkey(1, "pie.call_customizable_pie_menu",   'LEFTMOUSE',  ("shift", "ctrl")),
+    Hotkey(2, "pie.call_customizable_pie_menu_2", 'RIGHTMOUSE', ("shift", "ctrl")),
+)}
+
+#   The bindings of every supported Blender mode
+BINDINGS = (
+    Binding('OBJECT',             1, "object",   "Object Mode"),
+    Binding('OBJECT',             2, "object2",  "Object Mode"),
+    Binding('EDIT_MESH',          1, "edit",     "Mesh"),
+    Binding('EDIT_CURVE',         1, "curve",    "Curve"),
+    Binding('EDIT_ARMATURE',      1, "armature", "Armature"),
+    Binding('SCULPT',             1, "sculpt",   "Sculpt"),
+    Binding('POSE',               1, "pose",     "Pose"),
+    Binding('PAINT_WEIGHT',       1, "weight",   "Weight Paint"),
+    Binding('EDIT_GREASE_PENCIL', 1, "gpencil",  "Grease Pencil Edit Mode"),
+)
+
+#   The ring of every (context.mode, variant) pair
+RING_BY_MODE = {(binding.mode, binding.variant): binding.ring for binding in BINDINGS}
+
+
+###############################################################################
+#
+#   Operator Catalogs
+#
+###############################################################################
+
+#   The items every catalog ends with
+SLOT_ITEMS = [
+    ("Custom", "Custom Operator", "Use a custom operator"),
+    ("Submenu", "Sub-Menu", "Open another marking menu from this slot"),
+    ("Empty", "Empty", "Leave this slot empty"),
+    ("Macro", "Macro", "Run a chain of operators separated by ';' as one undo step"),
+    ("Recent", "Recent", "Show an operator recently or often run from the marking menus")
+]
+
+#   Default object mode operators
+OBJECT_OPERATORS = catalog.OperatorCatalog("Object", [
+    ("object.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all objects"),
+    ("object.select_all(action='DESELECT')", "Deselect All", "Deselect all objects"),
+    ("object.select_random", "Select Random", "Randomly select objects"),
+    ("object.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("object.duplicate_move", "Duplicate", "Duplicate selected objects"),
+    ("object.delete", "Delete", "Delete selected objects"),
+    ("object.join", "Join", "Join selected objects"),
+    ("object.subdivision_set(level=1)", "Set Subdivision Level 1", "Set subdivision level to 1"),
+    ("object.shade_smooth", "Shade Smooth", "Set shading to smooth"),
+    ("object.shade_flat", "Shade Flat", "Set shading to flat"),
+    ("object.origin_set(type='ORIGIN_GEOMETRY')", "Set Origin to Geometry", "Set origin to center of geometry"),
+    ("object.convert(target='MESH')", "Convert to Mesh", "Convert selected objects to mesh"),
+    ("object.modifier_add(type='SUBSURF')", "Add Subdivision Surface", "Add subdivision surface modifier"),
+    ("object.modifier_add", "Add Modifier Menu", "Open the Add Modifier menu"),
+    ("wm.call_menu(name='VIEW3D_MT_object_apply')", "Apply Menu", "Open the Apply menu"),
+    ("wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')", "Origin Pie Menu", "Open the origin/pivot pie menu")
+] + SLOT_ITEMS)
+
+#    Default edit mode operators
+EDIT_OPERATORS = catalog.OperatorCatalog("Edit", [
+    ("mesh.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all elements"),
+    ("mesh.select_all(action='DESELECT')", "Deselect All", "Deselect all elements"),
+    ("mesh.select_random", "Select Random", "Randomly select elements"),
+    ("mesh.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("mesh.duplicate_move", "Duplicate", "Duplicate selected elements"),
+    ("mesh.delete", "Delete", "Delete selected elements"),
+    ("mesh.separate(type='SELECTED')", "Separate Selected", "Separate selected elements"),
+    ("mesh.subdivide", "Subdivide", "Subdivide selected edges"),
+    ("mesh.faces_shade_smooth", "Shade Smooth", "Set shading to smooth"),
+    ("mesh.faces_shade_flat", "Shade Flat", "Set shading to flat"),
+    ("mesh.quads_convert_to_tris", "Triangulate Faces", "Convert quads to triangles"),
+    ("mesh.tris_convert_to_quads", "Quadrangulate Faces", "Convert triangles to quads"),
+    ("mesh.extrude_region_move", "Extrude Region", "Extrude selected region"),
+    ("wm.call_menu(name='VIEW3D_MT_edit_mesh_faces')", "Faces Menu", "Open the Faces menu"),
+    ("wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')", "Origin Pie Menu", "Open the origin/pivot pie menu")
+] + SLOT_ITEMS)
+
+#   Default edit curve operators
+CURVE_OPERATORS = catalog.OperatorCatalog("Curve", [
+    ("curve.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all control points"),
+    ("curve.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("curve.duplicate_move", "Duplicate", "Duplicate selected control points"),
+    ("curve.delete(type='VERT')", "Delete Vertices", "Delete selected control points"),
+    ("curve.extrude_move", "Extrude", "Extrude selected control points"),
+    ("curve.subdivide", "Subdivide", "Subdivide selected segments"),
+    ("curve.make_segment", "Make Segment", "Join two curves by their selected ends"),
+    ("curve.switch_direction", "Switch Direction", "Switch the direction of the selected splines"),
+    ("curve.cyclic_toggle", "Toggle Cyclic", "Make the selected splines cyclic or open"),
+    ("curve.handle_type_set(type='AUTOMATIC')", "Automatic Handles", "Set handle type to automatic"),
+    ("curve.handle_type_set(type='VECTOR')", "Vector Handles", "Set handle type to vector"),
+    ("curve.separate", "Separate", "Separate selected splines into a new object"),
+    ("wm.call_menu_pie(name='VIEW3D_MT_pivot_pie')", "Origin Pie Menu", "Open the origin/pivot pie menu")
+] + SLOT_ITEMS)
+
+#   Default edit armature operators
+ARMATURE_OPERATORS = catalog.OperatorCatalog("Armature", [
+    ("armature.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all bones"),
+    ("armature.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("armature.duplicate_move", "Duplicate", "Duplicate selected bones"),
+    ("armature.delete", "Delete", "Delete selected bones"),
+    ("armature.extrude_move", "Extrude", "Extrude selected bones"),
+    ("armature.subdivide", "Subdivide", "Subdivide selected bones"),
+    ("armature.bone_primitive_add", "Add Bone", "Add a new bone at the 3D cursor"),
+    ("armature.switch_direction", "Switch Direction", "Switch the direction of the selected bones"),
+    ("armature.symmetrize", "Symmetrize", "Mirror the selected bones to the other side"),
+    ("armature.calculate_roll(type='GLOBAL_POS_Z')", "Recalculate Roll", "Recalculate roll towards global +Z"),
+    ("armature.parent_set(type='OFFSET')", "Parent (Keep Offset)", "Parent the selected bones to the active bone"),
+    ("armature.parent_clear(type='CLEAR')", "Clear Parent", "Clear the parent of the selected bones")
+] + SLOT_ITEMS)
+
+#   Default sculpt mode operators
+SCULPT_OPERATORS = catalog.OperatorCatalog("Sculpt", [
+    ("paint.mask_flood_fill(mode='VALUE', value=0.0)", "Clear Mask", "Clear the mask"),
+    ("paint.mask_flood_fill(mode='VALUE', value=1.0)", "Fill Mask", "Mask everything"),
+    ("paint.mask_flood_fill(mode='INVERT')", "Invert Mask", "Invert the mask"),
+    ("sculpt.face_sets_create(mode='MASKED')", "Face Set from Mask", "Create a face set from the masked faces"),
+    ("sculpt.face_sets_randomize_colors", "Randomize Face Set Colors", "Give every face set a new color"),
+    ("sculpt.dynamic_topology_toggle", "Toggle Dyntopo", "Toggle dynamic topology"),
+    ("object.voxel_remesh", "Voxel Remesh", "Remesh the object with voxels"),
+    ("object.quadriflow_remesh", "Quadriflow Remesh", "Remesh the object with quads"),
+    ("wm.call_menu_pie(name='VIEW3D_MT_sculpt_mask_edit_pie')", "Mask Pie Menu", "Open the mask edit pie menu"),
+    ("wm.call_menu_pie(name='VIEW3D_MT_sculpt_face_sets_edit_pie')", "Face Sets Pie Menu", "Open the face sets edit pie menu")
+] + SLOT_ITEMS)
+
+#   Default pose mode operators
+POSE_OPERATORS = catalog.OperatorCatalog("Pose", [
+    ("pose.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all bones"),
+    ("pose.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("pose.select_mirror", "Select Mirror", "Select the mirrored bones"),
+    ("pose.transforms_clear", "Clear Transform", "Reset location, rotation and scale"),
+    ("pose.loc_clear", "Clear Location", "Reset the location"),
+    ("pose.rot_clear", "Clear Rotation", "Reset the rotation"),
+    ("pose.scale_clear", "Clear Scale", "Reset the scale"),
+    ("pose.copy", "Copy Pose", "Copy the pose of the selected bones"),
+    ("pose.paste", "Paste Pose", "Paste the copied pose"),
+    ("pose.paste(flipped=True)", "Paste Pose Flipped", "Paste the copied pose mirrored"),
+    ("anim.keyframe_insert", "Insert Keyframe", "Insert a keyframe on the selected bones"),
+    ("wm.call_menu(name='VIEW3D_MT_pose_apply')", "Apply Menu", "Open the Apply menu")
+] + SLOT_ITEMS)
+
+#   Default weight paint operators
+WEIGHT_OPERATORS = catalog.OperatorCatalog("Weight", [
+    ("object.vertex_group_normalize_all", "Normalize All", "Normalize all vertex groups"),
+    ("object.vertex_group_normalize", "Normalize", "Normalize the active vertex group"),
+    ("object.vertex_group_smooth", "Smooth", "Smooth the weights of the active vertex group"),
+    ("object.vertex_group_clean", "Clean", "Remove tiny weights"),
+    ("object.vertex_group_invert", "Invert", "Invert the weights of the active vertex group"),
+    ("object.vertex_group_levels", "Levels", "Offset and scale the weights"),
+    ("object.vertex_group_limit_total", "Limit Total", "Limit the number of groups per vertex"),
+    ("object.vertex_group_quantize", "Quantize", "Snap weights to steps"),
+    ("object.vertex_group_mirror", "Mirror", "Mirror the active vertex group"),
+    ("paint.weight_sample", "Sample Weight", "Use the weight under the mouse")
+] + SLOT_ITEMS)
+
+#   Default grease pencil edit mode operators
+GPENCIL_OPERATORS = catalog.OperatorCatalog("Grease Pencil", [
+    ("grease_pencil.select_all(action='TOGGLE')", "Select All (Toggle)", "Toggle selection of all points"),
+    ("grease_pencil.select_all(action='INVERT')", "Inverse Selection", "Invert the current selection"),
+    ("grease_pencil.duplicate_move", "Duplicate", "Duplicate selected points"),
+    ("grease_pencil.delete", "Delete", "Delete selected points"),
+    ("grease_pencil.dissolve", "Dissolve", "Dissolve selected points"),
+    ("grease_pencil.stroke_simplify", "Simplify", "Simplify selected strokes"),
+    ("grease_pencil.stroke_smooth", "Smooth", "Smooth selected strokes"),
+    ("grease_pencil.stroke_subdivide", "Subdivide", "Subdivide selected strokes"),
+    ("grease_pencil.stroke_switch_direction", "Switch Direction", "Switch the direction of selected strokes"),
+    ("grease_pencil.cyclical_set(type='TOGGLE')", "Toggle Cyclic", "Close or open selected strokes"),
+    ("grease_pencil.separate(mode='SELECTED')", "Separate Selected", "Separate selected points into a new object")
+] + SLOT_ITEMS)
+
+#   The operator catalogs, keyed by the catalog name of RINGS
+CATALOGS = {
+    "object":   OBJECT_OPERATORS,
+    "edit":     EDIT_OPERATORS,
+    "curve":    CURVE_OPERATORS,
+    "armature": ARMATURE_OPERATORS,
+    "sculpt":   SCULPT_OPERATORS,
+    "pose":     POSE_OPERATORS,
+    "weight":   WEIGHT_OPERATORS,
+    "gpencil":  GPENCIL_OPERATORS
+}
+
+#   The default slot items of each ring, keyed by ring name. Rings without
+#   defaults start empty.
+DEFAULTS = {
+    "object":  [
+                "object.select_all(action='TOGGLE')",
+                "object.delete",
+                "object.duplicate_move",
+                "object.shade_smooth",
+                "object.join",
+                "object.convert(target='MESH')",
+                "object.origin_set(type='ORIGIN_GEOMETRY')",
+                "wm.call_menu(name='VIEW3D_MT_object_apply')"
+               ],
+    "object2": [
+                "object.select_all(action='TOGGLE')",
+                "object.delete",
+                "object.duplicate_move",
+                "object.shade_smooth",
+                "object.join",
+                "object.convert(target='MESH')",
+                "object.origin_set(type='ORIGIN_GEOMETRY')",
+                "wm.call_menu(name='VIEW3D_MT_object_apply')"
+               ],
+    "edit":    [
+                "mesh.select_all(action='TOGGLE')",
+                "mesh.delete",
+                "mesh.duplicate_move",
+                "mesh.extrude_region_move",
+                "mesh.subdivide",
+                "mesh.separate(type='SELECTED')",
+                "mesh.faces_shade_smooth",
+                "wm.call_menu(name='VIEW3D_MT_edit_mesh_faces')"
+               ],
+    "curve":   [
+                "curve.select_all(action='TOGGLE')",
+                "curve.delete(type='VERT')",
+                "curve.duplicate_move",
+                "curve.extrude_move",
+                "curve.subdivide",
+                "curve.cyclic_toggle",
+                "curve.switch_direction",
+                "curve.handle_type_set(type='AUTOMATIC')"
+               ],
+    "armature": [
+                "armature.select_all(action='TOGGLE')",
+                "armature.delete",
+                "armature.duplicate_move",
+                "armature.extrude_move",
+                "armature.subdivide",
+                "armature.symmetrize",
+                "armature.calculate_roll(type='GLOBAL_POS_Z')",
+                "armature.parent_set(type='OFFSET')"
+               ],
+    "sculpt":  [
+                "paint.mask_flood_fill(mode='INVERT')",
+                "paint.mask_flood_fill(mode='VALUE', value=0.0)",
+                "sculpt.face_sets_create(mode='MASKED')",
+                "object.voxel_remesh",
+                "sculpt.dynamic_topology_toggle",
+                "paint.mask_flood_fill(mode='VALUE', value=1.0)",
+                "wm.call_menu_pie(name='VIEW3D_MT_sculpt_mask_edit_pie')",
+                "wm.call_menu_pie(name='VIEW3D_MT_sculpt_face_sets_edit_pie')"
+               ],
+    "pose":    [
+                "pose.select_all(action='TOGGLE')",
+                "pose.transforms_clear",
+                "pose.copy",
+                "pose.paste",
+                "pose.paste(flipped=True)",
+                "pose.select_mirror",
+                "anim.keyframe_insert",
+                "wm.call_menu(name='VIEW3D_MT_pose_apply')"
+               ],
+    "weight":  [
+                "paint.weight_sample",
+                "object.vertex_group_normalize_all",
+                "object.vertex_group_smooth",
+                "object.vertex_group_clean",
+                "object.vertex_group_invert",
+                "object.vertex_group_mirror",
+                "object.vertex_group_limit_total",
+                "object.vertex_group_levels"
+               ],
+    "gpencil": [
+                "grease_pencil.select_all(action='TOGGLE')",
+                "grease_pencil.delete",
+                "grease_pencil.duplicate_move",
+                "grease_pencil.dissolve",
+                "grease_pencil.stroke_smooth",
+                "grease_pencil.stroke_simplify",
+                "grease_pencil.stroke_subdivide",
+                "grease_pencil.cyclical_set(type='TOGGLE')"
+               ]
+}
+
+
+###############################################################################
+#
+#   Schema Functions
+#
+###############################################################################
+def get_ring(mode, variant = 1):
+    '''
+    DESCRIPTION
+        This function returns the ring a hotkey variant opens in a mode
+
+    ARGUMENTS
+        mode        (in)    The Blender mode, as in context.mode
+        variant     (in)    The hotkey variant
+
+    RETURN
+        The ring name, or None if the mode has no ring for the variant
+    '''
+    return RING_BY_MODE.get((mode, variant))
@@ -0,0 +1,365 @@
+################################################################################
+#
+#   search.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the operator search index of the Marking Menus
+#       Blender Add-on. The index matches queries against the idname, label
+#       and description of every operator using token prefixes and trigrams,
+#       and ranks the matches by match quality and by how often an operator
+#       is used in the pie slots. This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  heapq
+import  re
+
+###############################################################################
+#
+#   Search Index Definitions
+#
+###############################################################################
+
+#   Token prefixes up to this length are indexed directly
+MAX_PREFIX_LENGTH = 8
+
+#   The number of items tokenized per build step
+BUILD_CHUNK_SIZE = 500
+
+#   The share of query trigrams a fuzzy match must contain
+FUZZY_THRESHOLD = 0.6
+
+#   Splits idnames, labels and queries into lower case words
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_EMPTY = frozenset()
+
+
+def tokenize(text):
+    '''
+    DESCRIPTION
+        This function splits text into lower case words
+
+    ARGUMENTS
+        text        (in)    The text to split
+
+    RETURN
+        A list of words
+    '''
+    return _WORD_RE.findall(text.lower())
+
+
+def trigrams(word):
+    '''
+    DESCRIPTION
+        This function returns the trigrams of a word
+
+    ARGUMENTS
+        word        (in)    The word
+
+    RETURN
+        A set of three character strings
+    '''
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def _prefix_postings(words):
+    '''
+    DESCRIPTION
+        This function builds the prefix postings of a set of words
+
+    ARGUMENTS
+        words       (in)    A {word: set of item indexes} dictionary
+
+    RETURN
+        A {prefix: frozenset of item indexes} dictionary
+    '''
+    prefixes = {}
+    for word, indexes in words.items():
+        for length in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1):
+            prefixes.setdefault(word[:length], set()).update(indexes)
+    return {key: frozenset(value) for key, value in prefixes.items()}
+
+
+###############################################################################
+#
+#   Search Index Class
+#
+###############################################################################
+class SearchIndex:
+    '''
+    DESCRIPTION
+        This class is an inverted index over (identifier, label, description)
+        items. Matches are collected in tiers, from best to worst:
+
+            1   every query word starts a word of the idname or label
+            2   every query word is found inside the idname or label
+            3   every query word starts a word of the description
+            4   most of the query trigrams are in the idname or label
+
+        Within a tier, operators used more often in the pie slots come
+        first, followed by shorter labels.
+    '''
+
+    def __init__(self, items, build = True):
+        '''
+        DESCRIPTION
+            This method creates the index
+
+        ARGUMENTS
+            items       (in)    A sequence of (identifier, label,
+                                description) tuples
+            build       (in)    Build the index right away. When False
+                                the caller runs the build() generator,
+                                for example from a timer.
+
+        RETURN
+            None
+        '''
+        self.items    = tuple(items)
+        self.is_built = False
+
+        if build:
+            for _ in self.build():
+                pass
+
+    def build(self, chunk = BUILD_CHUNK_SIZE):
+        '''
+        DESCRIPTION
+            This method builds the index. It is a generator that yields
+            after every chunk of items, so the work can be spread over
+            several timer ticks.
+
+        ARGUMENTS
+            chunk       (in)    The number of items per step
+
+        RETURN
+            A generator that yields None after each step
+        '''
+        items = self.items
+
+        #   Collect the items of every distinct word first, so the prefix
+        #   and trigram postings are built once per word instead of once
+        #   per item
+        words      = {}
+        desc_words = {}
+        haystacks  = []
+
+        for start in range(0, len(items), chunk):
+            for index in range(start, min(start + chunk, len(items))):
+                identifier, label, description = items[index]
+                haystack = f"{identifier} {label}".lower()
+                haystacks.append(haystack)
+
+                for word in tokenize(haystack):
+                    words.setdefault(word, set()).add(index)
+                for word in tokenize(description):
+                    desc_words.setdefault(word, set()).add(index)
+            yield
+
+        prefixes = _prefix_postings(words)
+        yield
+        desc_prefixes = _prefix_postings(desc_words)
+        yield
+
+        grams = {}
+        for word, indexes in words.items():
+            for gram in trigrams(word):
+                grams.setdefault(gram, set()).update(indexes)
+        grams = {key: frozenset(value) for key, value in grams.items()}
+        yield
+
+        #   Shorter labels rank first when everything else is equal
+        order = sorted(range(len(items)), key = lambda i: (len(items[i][1]), items[i][1].lower()))
+        rank  = [0] * len(order)
+        for position, index in enumerate(order):
+            rank[index] = position
+
+        self._prefixes      = prefixes
+        self._desc_prefixes = desc_prefixes
+        self._grams         = grams
+        self._haystacks     = tuple(haystacks)
+        self._indexes       = {item[0]: index for index, item in enumerate(items)}
+        self._rank          = rank
+        self._order         = tuple(order)
+        self.is_built       = True
+
+    def __len__(self):
+        return len(self.items)
+
+    def search(self, query, limit = 20, usage = None):
+        '''
+        DESCRIPTION
+            This method returns the best matches for a query
+
+        ARGUMENTS
+            query       (in)    The text typed by the user
+            limit       (in)    The maximum number of results
+            usage       (in)    An optional {identifier: count} dictionary
+                                of how often operators are used
+
+        RETURN
+            A list of up to limit (identifier, label, description) items
+        '''
+        usage_rank = {}
+        if usage:
+            for identifier, count in usage.items():
+                index = self._indexes.get(identifier)
+                if index is not None:
+                    usage_rank[index] = count
+
+        rank = self._rank
+        key  = lambda i: (-usage_rank.get(i, 0), rank[i])
+
+        words = tokenize(query)
+        if not words:
+            best = heapq.nsmallest(limit, usage_rank, key = key)
+            seen = set(best)
+            best.extend(i for i in self._order[:limit + len(best)] if i not in seen)
+            return [self.items[i] for i in best[:limit]]
+
+        results = []
+        seen    = set()
+        for tier in (self._prefix_matches, self._substring_matches,
+                     self._description_matches, self._fuzzy_matches):
+            candidates = tier(words)
+            if seen:
+                candidates = candidates - seen
+            if not candidates:
+                continue
+
+            best = heapq.nsmallest(limit - len(results), candidates, key = key)
+            results.extend(best)
+            seen.update(best)
+            if len(results) >= limit:
+                break
+
+        return [self.items[i] for i in results]
+
+    def _intersect(self, postings, words):
+        '''
+        DESCRIPTION
+            This method intersects the posting sets of every query word,
+            smallest first
+
+        ARGUMENTS
+            postings    (in)    A {key: frozenset} dictionary
+            words       (in)    The keys to look up
+
+        RETURN
+            A set of item indexes
+        '''
+        sets = []
+        for word in words:
+            found = postings.get(word[:MAX_PREFIX_LENGTH])
+            if not found:
+                return _EMPTY
+            sets.append(found)
+        sets.sort(key = len)
+        return sets[0].intersection(*sets[1:])
+
+    def _prefix_matches(self, words):
+        '''
+        DESCRIPTION
+            This method finds tier 1 matches, where every word starts a word
+            of the idname or label
+
+        ARGUMENTS
+            words       (in)    The lower case query words
+
+        RETURN
+            A set of item indexes
+        '''
+        candidates = self._intersect(self._prefixes, words)
+
+        #   Long words are only indexed by their leading characters
+        long_words = [word for word in words if len(word) > MAX_PREFIX_LENGTH]
+        if long_words and candidates:
+            haystacks  = self._haystacks
+            candidates = {i for i in candidates if all(word in haystacks[i] for word in long_words)}
+        return candidates
+
+    def _substring_matches(self, words):
+        '''
+        DESCRIPTION
+            This method finds tier 2 matches, where every word is found
+            inside the idname or label
+
+        ARGUMENTS
+            words       (in)    The lower case query words
+
+        RETURN
+            A set of item indexes
+        '''
+        sets = []
+        for word in words:
+            if len(word) < 3:
+                found = self._prefixes.get(word, _EMPTY)
+            else:
+                found = self._intersect(self._grams, trigrams(word))
+            if not found:
+                return _EMPTY
+            sets.append(found)
+        sets.sort(key = len)
+        candidates = sets[0].intersection(*sets[1:])
+
+        #   Trigram hits only mean the letters are there, check the order
+        haystacks = self._haystacks
+        return {i for i in candidates if all(word in haystacks[i] for word in words)}
+
+    def _description_matches(self, words):
+        '''
+        DESCRIPTION
+            This method finds tier 3 matches, where every word starts a word
+            of the description
+
+        ARGUMENTS
+            words       (in)    The lower case query words
+
+        RETURN
+            A set of item indexes
+        '''
+        return self._intersect(self._desc_prefixes, words)
+
+    def _fuzzy_matches(self, words):
+        '''
+        DESCRIPTION
+            This method finds tier 4 matches, where most of the query
+            trigrams are found in the idname or label
+
+        ARGUMENTS
+            words       (in)    The lower case query words
+
+        RETURN
+            A set of item indexes
+        '''
+        query_grams = set()
+        for word in words:
+            query_grams.update(trigrams(word))
+        if not query_grams:
+            return _EMPTY
+
+        counts = {}
+        for gram in query_grams:
+            for index in self._grams.get(gram, _EMPTY):
+                counts[index] = counts.get(index, 0) + 1
+
+        needed = max(1, round(len(query_grams) * FUZZY_THRESHOLD))
+        return {index for index, count in counts.items() if count >= needed}
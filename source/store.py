@@ -0,0 +1,105 @@
+################################################################################
+#
+#   store.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains functions to read and write the files the Marking
+#       Menus Blender Add-on keeps in its extension user directory
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  bpy
+import  json
+import  os
+
+###############################################################################
+#
+#   User Directory Functions
+#
+###############################################################################
+def get_user_path(filename):
+    '''
+    DESCRIPTION
+        This function returns the path of a file in the extension user
+        directory, creating the directory if needed
+
+    ARGUMENTS
+        filename    (in)    The name of the file
+
+    RETURN
+        The absolute path of the file
+    '''
+    try:
+        directory = bpy.utils.extension_path_user(__package__, create = True)
+    except ValueError:
+        #   Installed as a legacy add-on instead of an extension
+        directory = bpy.utils.user_resource('CONFIG', path = __package__.rpartition(".")[2], create = True)
+
+    return os.path.join(directory, filename)
+
+
+def load_json(filename, default = None):
+    '''
+    DESCRIPTION
+        This function reads a json file from the extension user directory
+
+    ARGUMENTS
+        filename    (in)    The name of the file
+        default     (in)    The value to return if the file can not be read
+
+    RETURN
+        The decoded json data
+    '''
+    try:
+        with open(get_user_path(filename), "r", encoding = "utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(filename, data):
+    '''
+    DESCRIPTION
+        This function writes a compact json file to the extension user
+        directory. The file is replaced atomically so a reader never sees
+        a partial file.
+
+    ARGUMENTS
+        filename    (in)    The name of the file
+        data        (in)    The json serializable data to write
+
+    RETURN
+        True if the file was written
+    '''
+    path = get_user_path(filename)
+    try:
+        with open(f"{path}.tmp", "w", encoding = "utf-8") as file:
+            json.dump(data, file, separators = (",", ":"))
+        os.replace(f"{path}.tmp", path)
+    except (OSError, TypeError, ValueError) as err:
+        #   A value json can not encode must not stop the timer or the
+        #   unregister that saves, nor leave the partial file behind
+        print(f"WARNING: Could not write {path}: {err}")
+        try:
+            os.remove(f"{path}.tmp")
+        except OSError:
+            pass
+        return False
+    return True
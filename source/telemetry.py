@@ -0,0 +1,540 @@
+################################################################################
+#
+#   telemetry.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the local usage telemetry of the Marking Menus
+#       Blender Add-on. When it is turned on in the preferences, every slot
+#       choice and cancellation updates an in-memory counter of its (ring,
+#       slot). The changes since the last flush are kept apart and appended
+#       to a JSON lines file in the extension user directory by a timer, so
+#       nothing is written while the user picks a slot. Nothing leaves the
+#       machine.
+#
+#       The counters drive the suggestions in the preferences, which move
+#       the most used actions to the compass positions that are fastest to
+#       reach.
+#
+#       This module does not depend on bpy, the timer and the path of the
+#       file are handled by the add-on.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  json
+import  os
+import  time
+
+###############################################################################
+#
+#   Telemetry Definitions
+#
+###############################################################################
+
+#   The append-only file in the extension user directory
+TELEMETRY_FILE = "telemetry.jsonl"
+
+#   Seconds between two flushes of the pending counters
+FLUSH_INTERVAL = 30.0
+
+#   The fewest choices in a ring before a reordering is suggested
+MIN_SAMPLES = 20
+
+#   The file is compacted into a single line when it is loaded with more
+#   lines than this
+COMPACT_LINES = 1000
+
+
+class SlotStats:
+    '''
+    DESCRIPTION
+        This class holds the counters of a single slot. select_time is the
+        total of the timed choices, from the hotkey press to the choice.
+    '''
+    __slots__ = ("invocations", "timed", "select_time", "cancellations")
+
+    def __init__(self, invocations = 0, timed = 0, select_time = 0.0, cancellations = 0):
+        self.invocations   = invocations
+        self.timed         = timed
+        self.select_time   = select_time
+        self.cancellations = cancellations
+
+    def add(self, invocations, timed, select_time, cancellations):
+        '''
+        DESCRIPTION
+            This method adds counts to the counters of this slot
+
+        ARGUMENTS
+            invocations     (in)    The number of choices
+            timed           (in)    The number of timed choices
+            select_time     (in)    The seconds the timed choices took
+            cancellations   (in)    The number of cancellations
+
+        RETURN
+            None
+        '''
+        self.invocations   += invocations
+        self.timed         += timed
+        self.select_time   += select_time
+        self.cancellations += cancellations
+
+    def mean_select_time(self):
+        '''
+        DESCRIPTION
+            This method returns the mean time to choose this slot
+
+        ARGUMENTS
+            None
+
+        RETURN
+            The mean in seconds, or None when no choice was timed
+        '''
+        return self.select_time / self.timed if self.timed else None
+
+    def to_list(self):
+        '''
+        DESCRIPTION
+            This method returns the counters in the order add() takes them,
+            as they are written to the file
+
+        ARGUMENTS
+            None
+
+        RETURN
+            A [invocations, timed, select_time, cancellations] list
+        '''
+        return [self.invocations, self.timed, round(self.select_time, 6), self.cancellations]
+
+
+#   True while choices are recorded
+enabled = False
+
+#   The counters keyed by (ring, slot). slot is None for cancellations that
+#   did not reach a slot.
+_stats = {}
+
+#   The counters changed since the last flush, keyed like _stats
+_pending = {}
+
+#   The lines waiting to be appended to the file, in order
+_lines = []
+
+#   The perf_counter of the last hotkey press
+_started = None
+
+#   The path of the file loaded into the counters
+_loaded = None
+
+
+###############################################################################
+#
+#   Recording Functions
+#
+###############################################################################
+def set_enabled(value):
+    '''
+    DESCRIPTION
+        This function turns the recording on or off
+
+    ARGUMENTS
+        value       (in)    True to record choices
+
+    RETURN
+        True if recording is on
+    '''
+    global enabled, _started
+
+    enabled  = bool(value)
+    _started = None
+    return enabled
+
+
+def start():
+    '''
+    DESCRIPTION
+        This function remembers when a hotkey was pressed, so the time to
+        the choice can be recorded
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _started
+
+    if enabled:
+        _started = time.perf_counter()
+
+
+def select(ring, slot, timed = True):
+    '''
+    DESCRIPTION
+        This function records the choice of a slot
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        slot        (in)    The slot index (compass sector)
+        timed       (in)    False when the choice is recorded after the
+                            fact, so the time since the hotkey press does
+                            not tell how long choosing took
+
+    RETURN
+        None
+    '''
+    if not enabled:
+        return
+
+    if _started is None or not timed:
+        _add(ring, slot, 1, 0, 0.0, 0)
+    else:
+        _add(ring, slot, 1, 1, time.perf_counter() - _started, 0)
+
+
+def cancel(ring, slot = None):
+    '''
+    DESCRIPTION
+        This function records a cancelled choice
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        slot        (in)    The slot that could not run, or None when the
+                            user backed out without reaching one
+
+    RETURN
+        None
+    '''
+    global _started
+
+    if enabled:
+        _add(ring, slot, 0, 0, 0.0, 1)
+        _started = None
+
+
+def _add(ring, slot, invocations, timed, select_time, cancellations):
+    '''
+    DESCRIPTION
+        This function adds counts to a slot, both to its totals and to the
+        counts waiting to be written
+
+    ARGUMENTS
+        ring            (in)    The name of the ring
+        slot            (in)    The slot index, or None
+        invocations     (in)    The number of choices
+        timed           (in)    The number of timed choices
+        select_time     (in)    The seconds the timed choices took
+        cancellations   (in)    The number of cancellations
+
+    RETURN
+        None
+    '''
+    key = (ring, slot)
+    for counters in (_stats, _pending):
+        stats = counters.get(key)
+        if stats is None:
+            stats = counters[key] = SlotStats()
+        stats.add(invocations, timed, select_time, cancellations)
+
+
+def get_stats(ring):
+    '''
+    DESCRIPTION
+        This function returns the counters of a ring
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+
+    RETURN
+        A {slot: SlotStats} dictionary, slot None holds the cancellations
+        that did not reach a slot
+    '''
+    return {slot: stats for (name, slot), stats in _stats.items() if name == ring}
+
+
+def get_rings():
+    '''
+    DESCRIPTION
+        This function returns the rings that have counters
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A set of ring names
+    '''
+    return {ring for ring, _ in _stats}
+
+
+###############################################################################
+#
+#   Suggestion Functions
+#
+###############################################################################
+def suggest(ring, positions, min_samples = MIN_SAMPLES):
+    '''
+    DESCRIPTION
+        This function suggests a slot order that puts the chosen slots on
+        the fastest positions, the most chosen first. Slots chosen equally
+        often keep their relative order. Slots that were never chosen stay
+        where they are, unless they are on one of those fastest positions,
+        then they take a place a chosen slot left. So the suggestion only
+        moves what the counters justify.
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        positions   (in)    The slot indexes, fastest to reach first
+        min_samples (in)    The fewest choices in the ring to suggest on
+
+    RETURN
+        A list with the suggested slot of every slot, or None when there are
+        not enough choices or the order is already the best
+    '''
+    stats = get_stats(ring)
+    if sum(slot_stats.invocations for slot, slot_stats in stats.items() if slot is not None) < min_samples:
+        return None
+
+    rank    = {slot: index for index, slot in enumerate(positions)}
+    counts  = {slot: stats[slot].invocations if slot in stats else 0 for slot in positions}
+    used    = sorted((slot for slot in positions if counts[slot]), key = lambda slot: (-counts[slot], rank[slot]))
+    fastest = positions[:len(used)]
+
+    order = [slot for slot in range(len(positions))]
+    for slot, position in zip(used, fastest):
+        order[slot] = position
+
+    #   The unused slots on the fastest positions swap with the used slots
+    #   that come from the slower ones
+    displaced = [slot for slot in fastest if not counts[slot]]
+    vacated   = [slot for slot in positions[len(used):] if counts[slot]]
+    for slot, position in zip(displaced, vacated):
+        order[slot] = position
+
+    if all(order[slot] == slot for slot in positions):
+        return None
+    return order
+
+
+def move(ring, order):
+    '''
+    DESCRIPTION
+        This function moves the counters of a ring along with its slots,
+        after a suggestion was applied
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        order       (in)    The new slot of every slot
+
+    RETURN
+        None
+    '''
+    #   The pending counts belong to the old order
+    _queue_pending()
+    _move(ring, order)
+    _lines.append(json.dumps({"time": round(time.time()), "move": ring, "order": list(order)}))
+
+
+def _move(ring, order):
+    '''
+    DESCRIPTION
+        This function moves the counters of a ring to the new slots of
+        their operators. The cancellations outside a slot stay.
+
+    ARGUMENTS
+        ring        (in)    The name of the ring
+        order       (in)    The new slot of every slot
+
+    RETURN
+        None
+    '''
+    moved = {}
+    for (name, slot), stats in list(_stats.items()):
+        if name == ring and slot is not None:
+            del _stats[name, slot]
+            moved[name, order[slot]] = stats
+    _stats.update(moved)
+
+
+def reset():
+    '''
+    DESCRIPTION
+        This function throws away every counter. The file keeps its history,
+        a reset line tells load() to start over from there.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _started
+
+    _stats.clear()
+    _pending.clear()
+    _lines.clear()
+    _lines.append(json.dumps({"time": round(time.time()), "reset": True}))
+    _started = None
+
+
+###############################################################################
+#
+#   File Functions
+#
+###############################################################################
+def _queue_pending():
+    '''
+    DESCRIPTION
+        This function turns the counts recorded since the last flush into
+        a line waiting to be appended to the file
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    if not _pending:
+        return
+
+    counts = {}
+    for (ring, slot), stats in _pending.items():
+        counts.setdefault(ring, {})["" if slot is None else str(slot)] = stats.to_list()
+    _pending.clear()
+    _lines.append(json.dumps({"time": round(time.time()), "counts": counts}, separators = (",", ":")))
+
+
+def flush(path):
+    '''
+    DESCRIPTION
+        This function appends the changes since the last flush to the file.
+        It is called from a timer, never while a slot is chosen.
+
+    ARGUMENTS
+        path        (in)    The path of the file
+
+    RETURN
+        The number of lines written
+    '''
+    _queue_pending()
+    if not _lines:
+        return 0
+
+    #   The lines are kept until they are written, so a failed write is
+    #   tried again on the next flush
+    lines = list(_lines)
+    try:
+        with open(path, "a", encoding = "utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+    except OSError as err:
+        print(f"WARNING: Could not write {path}: {err}")
+        return 0
+
+    del _lines[:len(lines)]
+    return len(lines)
+
+
+def load(path):
+    '''
+    DESCRIPTION
+        This function adds the counters recorded in earlier sessions. A file
+        is only loaded once, and is compacted into a single line when it
+        has grown too long. Unreadable lines are skipped.
+
+    ARGUMENTS
+        path        (in)    The path of the file
+
+    RETURN
+        The number of lines read
+    '''
+    global _loaded
+
+    if _loaded == path:
+        return 0
+    _loaded = path
+
+    try:
+        with open(path, "r", encoding = "utf-8") as file:
+            lines = file.read().splitlines()
+    except OSError:
+        return 0
+
+    #   Rebuild the counters from the file, then from the lines and
+    #   counts recorded since the add-on started that are not written yet
+    _stats.clear()
+    for line in lines:
+        _apply(line)
+
+    if len(lines) > COMPACT_LINES:
+        _compact(path)
+
+    for line in _lines:
+        _apply(line)
+    for key, stats in _pending.items():
+        _stats.setdefault(key, SlotStats()).add(*stats.to_list())
+    return len(lines)
+
+
+def _apply(line):
+    '''
+    DESCRIPTION
+        This function applies a line of the file to the counters. Lines
+        that can not be read are skipped.
+
+    ARGUMENTS
+        line        (in)    The line of JSON text
+
+    RETURN
+        None
+    '''
+    try:
+        record = json.loads(line)
+        if record.get("reset"):
+            _stats.clear()
+        elif "move" in record:
+            _move(record["move"], record["order"])
+        else:
+            for ring, slots in record["counts"].items():
+                for slot, values in slots.items():
+                    stats = _stats.setdefault((ring, int(slot) if slot else None), SlotStats())
+                    stats.add(*values)
+    except (ValueError, KeyError, TypeError, IndexError, AttributeError):
+        pass
+
+
+def _compact(path):
+    '''
+    DESCRIPTION
+        This function replaces the file with a single line holding the
+        totals of every slot, once it has grown too long
+
+    ARGUMENTS
+        path        (in)    The path of the file
+
+    RETURN
+        None
+    '''
+    counts = {}
+    for (ring, slot), stats in _stats.items():
+        counts.setdefault(ring, {})["" if slot is None else str(slot)] = stats.to_list()
+
+    try:
+        with open(f"{path}.tmp", "w", encoding = "utf-8") as file:
+            file.write(json.dumps({"time": round(time.time()), "counts": counts}, separators = (",", ":")) + "\n")
+        os.replace(f"{path}.tmp", path)
+    except OSError as err:
+        print(f"WARNING: Could not compact {path}: {err}")
@@ -25,31 +25,640 @@
 #
 ################################################################################
 import bpy
+import hashlib
+
+from   . import opstring
+from   . import plans
+from   . import predicates
+from   . import profiler
+from   . import search
+from   . import store
 
 ###############################################################################
 #
 #   Utility functions for the Add-On
 #
 ###############################################################################
-def get_all_operators(self, context):
+
+#   The cached operator search items, kept until the catalog key changes
+_operator_items     = []
+_operator_items_key = None
+
+#   The operator catalog file in the extension user directory. Bump the
+#   version when the layout of the stored items changes.
+OPERATOR_CATALOG_FILE    = "operator_catalog.json"
+OPERATOR_CATALOG_VERSION = 1
+
+#   The operator catalog key, see check_operator_catalog
+_catalog_key = None
+
+#   The ranked search index over the cached search items
+_search_index     = None
+_search_index_key = None
+
+#   The number of results the custom operator search shows
+SEARCH_LIMIT = 30
+
+def refresh_operator_items(context):
+    '''
+    DESCRIPTION
+        This method brings the cached operator search items up to date.
+        It is a generator that yields after every bpy.ops module it walks,
+        so the work can be spread over several timer ticks.
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        A generator that yields None after each step
+    '''
+    global _operator_items, _operator_items_key
+
+    key = get_catalog_key(context)
+    if key == _operator_items_key:
+        return
+
+    file_key = get_operator_catalog_file_key(context)
+
+    #   The first search of a session loads the catalog from disk
+    items = None
+    if _operator_items_key is None:
+        items = load_operator_items(file_key)
+
+    #   Rebuild the catalog when the stored one does not match
+    if items is None:
+        items = []
+        for op_module_name in key[0]:
+            items.extend(get_module_operator_items(op_module_name))
+            yield
+
+        items = sort_operator_items(items)
+        yield
+
+        save_operator_items(file_key, items)
+
+    _operator_items     = items
+    _operator_items_key = key
+
+@profiler.timed("search_operators")
+def search_operators(self, context, edit_text):
+    '''
+    DESCRIPTION
+        This method is the StringProperty search callback of the custom
+        operator search. It is called on every keystroke and returns the
+        best ranked matches from the search index. Operators already used
+        in the pie slots rank higher.
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+        edit_text   (in)    The text typed so far
+
+    RETURN
+        A list of (identifier, label) tuples
+    '''
+    index   = get_search_index(context)
+    results = index.search(edit_text, SEARCH_LIMIT, plans.get_operator_usage())
+    return [(identifier, label) for identifier, label, _ in results]
+
+@profiler.timed("get_search_index")
+def get_search_index(context):
+    '''
+    DESCRIPTION
+        This method returns the search index, building it if needed
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        A search.SearchIndex
+    '''
+    for _ in refresh_search_index(context):
+        pass
+
+    return _search_index
+
+def refresh_search_index(context):
     '''
     DESCRIPTION
-        This method is used to get all operators for the search popup
+        This method brings the cached search items and the search index up
+        to date. It is a generator that yields between steps, so the work
+        can be spread over several timer ticks.
 
     ARGUMENTS
         context     (in)    The current context for Blender
 
     RETURN
-        A sortedlist of available operators
+        A generator that yields None after each step
+    '''
+    global _search_index, _search_index_key
+
+    yield from refresh_operator_items(context)
+
+    if _search_index_key != _operator_items_key:
+        key   = _operator_items_key
+        index = search.SearchIndex(_operator_items, build = False)
+        yield from index.build()
+
+        _search_index     = index
+        _search_index_key = key
+
+def check_operator_catalog(context):
+    '''
+    DESCRIPTION
+        This method takes the operator catalog key again, when the set of
+        operators may have changed: at register, in the warm-up and when a
+        pie, the operator search or the preferences open. When operator
+        modules or enabled add-ons changed, the validated operators are
+        forgotten and the draw plans are compiled again.
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        True if the key changed since it was last taken
+    '''
+    global _catalog_key
+
+    key = get_operator_catalog_key(context)
+    if key == _catalog_key:
+        return False
+
+    changed      = _catalog_key is not None
+    _catalog_key = key
+    if changed:
+        clear_validated_operators()
+        plans.invalidate()
+    return changed
+
+def get_catalog_key(context):
+    '''
+    DESCRIPTION
+        This method returns the operator catalog key taken by the last
+        check_operator_catalog, so the search does not walk bpy.ops on
+        every keystroke
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        A tuple of (sorted operator module names, enabled add-on names)
+    '''
+    if _catalog_key is None:
+        check_operator_catalog(context)
+    return _catalog_key
+
+def get_operator_catalog_key(context):
+    '''
+    DESCRIPTION
+        This method returns the key the operator catalog is cached under.
+        Enabling or disabling an add-on changes the key.
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        A tuple of (sorted operator module names, enabled add-on names)
+    '''
+    op_module_names = tuple(sorted(name for name in dir(bpy.ops) if not name.startswith("__")))
+    addon_names     = frozenset(context.preferences.addons.keys())
+    return op_module_names, addon_names
+
+def get_operator_catalog_file_key(context):
+    '''
+    DESCRIPTION
+        This method returns the key the operator catalog is stored under
+        on disk: the Blender version and a hash of the enabled add-ons
+
+    ARGUMENTS
+        context     (in)    The current context for Blender
+
+    RETURN
+        A json serializable list
+    '''
+    addon_names = "\n".join(sorted(context.preferences.addons.keys()))
+    addon_hash  = hashlib.sha1(addon_names.encode("utf-8")).hexdigest()
+    return [OPERATOR_CATALOG_VERSION, list(bpy.app.version), addon_hash]
+
+def load_operator_items(file_key):
+    '''
+    DESCRIPTION
+        This method loads the operator catalog from the extension user
+        directory
+
+    ARGUMENTS
+        file_key    (in)    The key the stored catalog must match
+
+    RETURN
+        The list of search items, or None if there is no matching catalog
+    '''
+    data = store.load_json(OPERATOR_CATALOG_FILE)
+    if not isinstance(data, dict) or data.get("key") != file_key:
+        return None
+
+    try:
+        return [(identifier, label, description) for identifier, label, description in data["items"]]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def save_operator_items(file_key, items):
+    '''
+    DESCRIPTION
+        This method stores the operator catalog in the extension user
+        directory
+
+    ARGUMENTS
+        file_key    (in)    The key to store the catalog under
+        items       (in)    The list of search items
+
+    RETURN
+        None
+    '''
+    store.save_json(OPERATOR_CATALOG_FILE, {"key": file_key, "items": items})
+
+def get_module_operator_items(op_module_name):
+    '''
+    DESCRIPTION
+        This method returns the search items for the operators of a single
+        bpy.ops module
+
+    ARGUMENTS
+        op_module_name  (in)    The name of the bpy.ops module
+
+    RETURN
+        A list of (identifier, label, description) tuples
     '''
     items = []
-    for op_module_name in dir(bpy.ops):
-        op_module = getattr(bpy.ops, op_module_name)
-        for op_name in dir(op_module):
-            if not op_name.startswith("__"):
-                full_name = f"{op_module_name}.{op_name}"
-                label = op_name.replace("_", " ").title()
-                items.append((full_name, f"{label} ({op_module_name})", ""))
-
-     # Sort by label, case-insensitive
+    op_module = getattr(bpy.ops, op_module_name)
+    for op_name in dir(op_module):
+        if not op_name.startswith("__"):
+            full_name   = f"{op_module_name}.{op_name}"
+            label       = op_name.replace("_", " ").title()
+            description = ""
+
+            #   Use the operator's own label and description when it has one
+            try:
+                rna = getattr(op_module, op_name).get_rna_type()
+                label       = rna.name or label
+                description = rna.description
+            except (AttributeError, KeyError):
+                pass
+
+            items.append((full_name, f"{label} ({op_module_name})", description))
+    return items
+
+def sort_operator_items(items):
+    '''
+    DESCRIPTION
+        This method sorts the search items by label
+
+    ARGUMENTS
+        items       (in)    A list of (identifier, label, description)
+
+    RETURN
+        The sorted list
+    '''
+    # Sort by label, case-insensitive
     return sorted(items, key=lambda x: x[1].lower())
+
+def clear_operator_items():
+    '''
+    DESCRIPTION
+        This method forgets the cached operator search items and the
+        search index
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _operator_items, _operator_items_key, _search_index, _search_index_key
+
+    _operator_items     = []
+    _operator_items_key = None
+    _search_index       = None
+    _search_index_key   = None
+
+###############################################################################
+#
+#   Operator validation functions
+#
+###############################################################################
+
+#   Validated operator strings, keyed by the raw operator string. Each value
+#   is a ((op_name, op_args), error) pair where exactly one side is None.
+_validated_operators = {}
+
+def get_operator_rna(op_name):
+    '''
+    DESCRIPTION
+        This method is used to look up the RNA definition of an operator
+
+    ARGUMENTS
+        op_name     (in)    The operator name, e.g. "object.select_all"
+
+    RETURN
+        The bpy.types.Struct of the operator, or None if it does not exist
+    '''
+    op_module, _, op_func = op_name.partition(".")
+    if not op_module or not op_func:
+        return None
+
+    try:
+        return getattr(getattr(bpy.ops, op_module), op_func).get_rna_type()
+    except (AttributeError, KeyError):
+        return None
+
+def validate_operator_string(op_string, refresh = False):
+    '''
+    DESCRIPTION
+        This method parses an operator string, checks it against the
+        operator's bl_rna properties and coerces the argument values to the
+        declared types. Results are kept until refresh is requested, so
+        validation only happens when a slot is edited.
+
+    ARGUMENTS
+        op_string   (in)    The operator string to validate
+        refresh     (in)    Validate again even if a result is stored
+
+    RETURN
+        op_name (str)       The name of the operator
+        op_args (tuple)     A tuple of (name, value) pairs with typed values
+
+    RAISES
+        opstring.OperatorStringError when the string is not valid
+    '''
+    result = None if refresh else _validated_operators.get(op_string)
+    if result is None:
+        try:
+            result = (_validate_operator_string(op_string), None)
+        except opstring.OperatorStringError as err:
+            result = (None, str(err))
+        _validated_operators[op_string] = result
+
+    operator, error = result
+    if error is not None:
+        raise opstring.OperatorStringError(error)
+    return operator
+
+def get_operator_string_error(op_string):
+    '''
+    DESCRIPTION
+        This method returns the validation error of an operator string, for
+        display in the preferences
+
+    ARGUMENTS
+        op_string   (in)    The operator string to check
+
+    RETURN
+        The error message, or None if the string is empty or valid
+    '''
+    if not op_string:
+        return None
+
+    try:
+        validate_operator_string(op_string)
+    except opstring.OperatorStringError as err:
+        return str(err)
+    return None
+
+#   Validated macros, keyed by the raw macro string. Each value is a
+#   (steps, error) pair where exactly one side is None.
+_validated_macros = {}
+
+def validate_macro_string(macro_string, refresh = False):
+    '''
+    DESCRIPTION
+        This method splits a macro into its steps and validates each step
+        like validate_operator_string. Results are kept until refresh is
+        requested.
+
+    ARGUMENTS
+        macro_string    (in)    The macro to validate
+        refresh         (in)    Validate again even if a result is stored
+
+    RETURN
+        A tuple of (op_name, op_args) steps
+
+    RAISES
+        opstring.OperatorStringError when a step is not valid, the message
+        names the step
+    '''
+    result = None if refresh else _validated_macros.get(macro_string)
+    if result is None:
+        try:
+            steps = []
+            for index, step in enumerate(opstring.split_macro_string(macro_string), 1):
+                try:
+                    steps.append(validate_operator_string(step, refresh))
+                except opstring.OperatorStringError as err:
+                    raise opstring.OperatorStringError(f"Step {index}: {err}") from None
+            result = (tuple(steps), None)
+        except opstring.OperatorStringError as err:
+            result = (None, str(err))
+        _validated_macros[macro_string] = result
+
+    steps, error = result
+    if error is not None:
+        raise opstring.OperatorStringError(error)
+    return steps
+
+def get_macro_string_error(macro_string):
+    '''
+    DESCRIPTION
+        This method returns the validation error of a macro, for display
+        in the preferences
+
+    ARGUMENTS
+        macro_string    (in)    The macro to check
+
+    RETURN
+        The error message, or None if the macro is empty or valid
+    '''
+    if not macro_string:
+        return None
+
+    try:
+        validate_macro_string(macro_string)
+    except opstring.OperatorStringError as err:
+        return str(err)
+    return None
+
+def clear_validated_operators():
+    '''
+    DESCRIPTION
+        This method forgets every validated operator string and macro,
+        and the operators looked up for polling
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    _validated_operators.clear()
+    _validated_macros.clear()
+    _operator_functions.clear()
+
+def _validate_operator_string(op_string):
+    '''
+    DESCRIPTION
+        This method does the work for validate_operator_string
+
+    ARGUMENTS
+        op_string   (in)    The operator string to validate
+
+    RETURN
+        op_name, op_args
+    '''
+    return validate_operator_args(*opstring.parse_operator_string(op_string))
+
+def validate_operator_args(op_name, op_args):
+    '''
+    DESCRIPTION
+        This method checks operator arguments against the operator's bl_rna
+        properties and coerces the values to the declared types, e.g. for
+        operators read back from a file
+
+    ARGUMENTS
+        op_name     (in)    The operator name, e.g. "object.select_all"
+        op_args     (in)    A sequence of (name, value) pairs
+
+    RETURN
+        op_name (str)       The name of the operator
+        op_args (tuple)     A tuple of (name, value) pairs with typed values
+
+    RAISES
+        opstring.OperatorStringError when the operator or an argument is
+        not valid
+    '''
+    rna = get_operator_rna(op_name)
+    if rna is None:
+        raise opstring.OperatorStringError(f"Operator '{op_name}' not found")
+
+    properties = rna.properties
+    coerced = []
+    for arg, value in op_args:
+        prop = properties.get(arg)
+        if prop is None or arg == "rna_type":
+            raise opstring.OperatorStringError(f"Operator '{op_name}' has no argument '{arg}'")
+
+        enum_items   = ()
+        is_enum_flag = False
+        if prop.type == 'ENUM':
+            enum_items   = frozenset(item.identifier for item in prop.enum_items)
+            is_enum_flag = prop.is_enum_flag
+
+        coerced.append((arg, opstring.coerce_value(op_name, arg, value, prop.type,
+                                                   getattr(prop, "array_length", 0),
+                                                   enum_items, is_enum_flag)))
+
+    return op_name, tuple(coerced)
+
+###############################################################################
+#
+#   Operator dispatch functions
+#
+###############################################################################
+
+#   The bpy.ops callables by operator name, used to poll the pie slots
+_operator_functions = {}
+
+def get_operator_function(op_name):
+    '''
+    DESCRIPTION
+        This method returns the bpy.ops callable of an operator, looking
+        it up only once
+
+    ARGUMENTS
+        op_name     (in)    The operator name, e.g. "object.delete"
+
+    RETURN
+        The bpy.ops operator
+    '''
+    operator = _operator_functions.get(op_name)
+    if operator is None:
+        op_module, _, op_func = op_name.partition(".")
+        operator = _operator_functions[op_name] = getattr(getattr(bpy.ops, op_module), op_func)
+    return operator
+
+def poll_operator(op_name):
+    '''
+    DESCRIPTION
+        This method tells if an operator can run in the current context
+
+    ARGUMENTS
+        op_name     (in)    The operator name, e.g. "object.delete"
+
+    RETURN
+        The result of the operator's poll, False if it can not be polled
+    '''
+    try:
+        return get_operator_function(op_name).poll('INVOKE_DEFAULT')
+    except (AttributeError, RuntimeError, TypeError):
+        return False
+
+#   Bumped by the depsgraph_update_post handler, so the selection is only
+#   counted again after the scene changed. The count is kept with the key
+#   it was taken for.
+_selection_generation = 0
+_selection_count      = (None, 0)
+
+def bump_selection_generation():
+    '''
+    DESCRIPTION
+        This method tells that the selection may have changed
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _selection_generation
+
+    _selection_generation += 1
+
+def get_selection_state(context):
+    '''
+    DESCRIPTION
+        This method takes a snapshot of the selection for the slot
+        conditions, with a cheap fingerprint to key the cached slot states.
+        The fingerprint is the mode, the active object and the selection
+        generation, so the selected objects are only counted when one of
+        them changed.
+
+    ARGUMENTS
+        context     (in)    A context object we can use to get info
+
+    RETURN
+        A (predicates.SelectionState, key) pair
+    '''
+    global _selection_count
+
+    active = context.active_object
+    key    = (context.mode, active.as_pointer() if active else 0, _selection_generation)
+    if _selection_count[0] != key:
+        _selection_count = (key, len(context.selected_objects))
+
+    state = predicates.SelectionState(context.mode, active.type if active else None, _selection_count[1])
+    return state, key
+
+def call_operator(op_name, op_args, execution_context = 'INVOKE_DEFAULT'):
+    '''
+    DESCRIPTION
+        This method runs an operator from its name and validated arguments,
+        the same way a pie menu button would
+
+    ARGUMENTS
+        op_name             (in)    The operator name, e.g. "object.delete"
+        op_args             (in)    A tuple of (name, value) pairs
+        execution_context   (in)    The Blender execution context
+
+    RETURN
+        The result set of the operator
+
+    RAISES
+        RuntimeError when the operator fails or its poll fails
+    '''
+    return get_operator_function(op_name)(execution_context, **dict(op_args))
@@ -0,0 +1,195 @@
+################################################################################
+#
+#   warmup.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the background warm-up of the Marking Menus
+#       Blender Add-on. After register() the preference slots, the draw
+#       plans, the validated custom operators, the operator catalog and its
+#       search index are built in small time slices from a bpy.app.timers
+#       callback, so the first pie and the first search popup hit a hot
+#       cache without freezing the UI.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  bpy
+import  time
+
+from    . import diagnostics
+from    . import plans
+from    . import prefs
+from    . import recent
+from    . import store
+from    . import telemetry
+from    . import utils
+
+###############################################################################
+#
+#   Warm-up Definitions
+#
+###############################################################################
+
+#   Seconds to wait after register() before the first slice runs
+FIRST_INTERVAL = 0.5
+
+#   Seconds between slices, and the most time a single slice may take
+TICK_INTERVAL  = 0.01
+TICK_BUDGET    = 0.004
+
+#   The running warm-up generator
+_task = None
+
+
+###############################################################################
+#
+#   Warm-up Functions
+#
+###############################################################################
+def start(menu_classes):
+    '''
+    DESCRIPTION
+        This function schedules the warm-up. A warm-up that is already
+        running is cancelled first.
+
+    ARGUMENTS
+        menu_classes    (in)    The pie menu classes to compile plans for
+
+    RETURN
+        None
+    '''
+    global _task
+
+    cancel()
+    _task = _warmup(tuple(menu_classes))
+    bpy.app.timers.register(_tick, first_interval = FIRST_INTERVAL, persistent = True)
+
+
+def cancel():
+    '''
+    DESCRIPTION
+        This function stops a running warm-up
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global _task
+
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+
+    if _task is not None:
+        _task.close()
+        _task = None
+
+
+def is_running():
+    '''
+    DESCRIPTION
+        This function tells if the warm-up has not finished yet
+
+    ARGUMENTS
+        None
+
+    RETURN
+        True while the warm-up is running
+    '''
+    return _task is not None
+
+
+def _tick():
+    '''
+    DESCRIPTION
+        This is the bpy.app.timers callback. It advances the warm-up until
+        the slice budget is used up.
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The seconds until the next slice, or None when the warm-up is done
+    '''
+    global _task
+
+    if _task is None:
+        return None
+
+    deadline = time.perf_counter() + TICK_BUDGET
+    try:
+        while time.perf_counter() < deadline:
+            next(_task)
+    except StopIteration:
+        _task = None
+        return None
+    except (OSError, ReferenceError, RuntimeError) as err:
+        #   e.g. the preferences were freed while a file was loading
+        diagnostics.report("warm-up", None, f"stopped: {err}")
+        _task = None
+        return None
+
+    return TICK_INTERVAL
+
+
+def _warmup(menu_classes):
+    '''
+    DESCRIPTION
+        This generator does the warm-up work, yielding between steps
+
+    ARGUMENTS
+        menu_classes    (in)    The pie menu classes to compile plans for
+
+    RETURN
+        A generator that yields None after each step
+    '''
+    context = bpy.context
+
+    #   Take the operator catalog key the slots are validated against
+    utils.check_operator_catalog(context)
+    yield
+
+    #   Build the draw plans first, they are needed by the first pie.
+    #   Compiling a plan also validates its custom operator strings.
+    addon = context.preferences.addons.get(__package__)
+    if addon is not None:
+        prefs.ensure_slots(addon.preferences)
+        prefs.ensure_bindings(addon.preferences)
+        yield
+
+        #   Add the usage of earlier sessions to the counters
+        if telemetry.enabled:
+            telemetry.load(store.get_user_path(telemetry.TELEMETRY_FILE))
+            yield
+
+        #   Read the operators of the Recent slots before the plans are
+        #   resolved against them
+        if recent.enabled:
+            prefs.load_recent()
+            yield
+
+        for cls in menu_classes:
+            if plans.get_plan(cls.mode) is None:
+                cls.compile_draw_plan(addon.preferences)
+            yield
+
+    #   Walk bpy.ops one module per step to build the search catalog,
+    #   then build the search index in chunks
+    yield from utils.refresh_search_index(context)
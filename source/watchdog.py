@@ -0,0 +1,265 @@
+################################################################################
+#
+#   watchdog.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file contains the draw budget watchdog of the Marking Menus
+#       Blender Add-on. Every pie menu draw reports how long it took. When
+#       the draws keep running over the budget set in the preferences, the
+#       pie menus switch to a minimal draw that emits the cached labels of
+#       the draw plan and nothing else: no slot availability checks, no
+#       operator arguments and no Recent slot refresh.
+#
+#       The minimal draw is always fast, so its timings can not tell when
+#       the full draw would fit again. After enough quick minimal draws the
+#       full draw is tried again, and if it goes over the budget right
+#       away, the next try waits twice as long.
+#
+#       Every switch is counted and the last ones are kept, so they can be
+#       inspected in the preferences and in the profiler dump.
+#
+#       This module does not depend on bpy.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  time
+
+from    collections import deque, namedtuple
+
+###############################################################################
+#
+#   Watchdog Definitions
+#
+###############################################################################
+
+#   Draws in a row over the budget before the minimal draw is used
+OVER_BUDGET_DRAWS = 3
+
+#   A minimal draw has headroom when it takes less than this part of the
+#   budget
+HEADROOM = 0.5
+
+#   Minimal draws in a row with headroom before the full draw is tried
+#   again, doubled each time the full draw fails right away
+RECOVER_DRAWS     = 10
+MAX_RECOVER_DRAWS = 640
+
+#   Full draws in a row within the budget after which a failed try no
+#   longer doubles the wait
+STABLE_DRAWS = 50
+
+#   The most switches kept for inspection
+MAX_EVENTS = 20
+
+#   A switch between the full and the minimal draw. seconds is the draw
+#   that caused it.
+Switch = namedtuple("Switch", ("time", "degraded", "seconds"))
+
+#   The budget of a draw in seconds, 0 when the watchdog is off
+budget = 0.0
+
+#   True while the pie menus use the minimal draw
+degraded = False
+
+#   The number of switches since the last reset
+switches = 0
+
+#   The time of the last draw in seconds
+last_seconds = 0.0
+
+#   The draws in a row over the budget, with headroom, or within the budget
+_over   = 0
+_under  = 0
+_stable = 0
+
+#   The minimal draws with headroom needed before the next try
+_recover_draws = RECOVER_DRAWS
+
+#   The last switches, oldest first
+_events = deque(maxlen = MAX_EVENTS)
+
+
+###############################################################################
+#
+#   Watchdog Functions
+#
+###############################################################################
+def set_budget(seconds):
+    '''
+    DESCRIPTION
+        This function sets the budget of a draw. Turning the watchdog off
+        switches back to the full draw.
+
+    ARGUMENTS
+        seconds     (in)    The budget in seconds, 0 to turn it off
+
+    RETURN
+        None
+    '''
+    global budget, _over, _under, _recover_draws
+
+    budget = max(0.0, seconds)
+    _over  = 0
+    _under = 0
+    _recover_draws = RECOVER_DRAWS
+    if not budget and degraded:
+        _switch(False, 0.0)
+
+
+def record(seconds):
+    '''
+    DESCRIPTION
+        This function reports the time of a draw, switching between the
+        full and the minimal draw when needed
+
+    ARGUMENTS
+        seconds     (in)    The time of the draw, measured with a monotonic
+                            clock
+
+    RETURN
+        True if the next draw uses another path
+    '''
+    global last_seconds, _over, _under, _stable, _recover_draws
+
+    last_seconds = seconds
+    if not budget:
+        return False
+
+    if degraded:
+        _under = _under + 1 if seconds < budget * HEADROOM else 0
+        if _under >= _recover_draws:
+            _switch(False, seconds)
+            return True
+        return False
+
+    if seconds <= budget:
+        _over    = 0
+        _stable += 1
+        if _stable >= STABLE_DRAWS:
+            _recover_draws = RECOVER_DRAWS
+        return False
+
+    _over += 1
+    if _over < OVER_BUDGET_DRAWS:
+        return False
+
+    #   The full draw failed soon after it was tried again, wait longer
+    #   before the next try
+    if _stable < STABLE_DRAWS and switches:
+        _recover_draws = min(_recover_draws * 2, MAX_RECOVER_DRAWS)
+    _switch(True, seconds)
+    return True
+
+
+def _switch(value, seconds):
+    '''
+    DESCRIPTION
+        This function switches between the full and the minimal draw,
+        starts the draw counts over and remembers the switch
+
+    ARGUMENTS
+        value       (in)    True to switch to the minimal draw
+        seconds     (in)    The duration of the draw that caused the switch
+
+    RETURN
+        None
+    '''
+    global degraded, switches, _over, _under, _stable
+
+    degraded = value
+    switches += 1
+    _over   = 0
+    _under  = 0
+    _stable = 0
+    _events.append(Switch(time.time(), value, seconds))
+
+
+def get_events():
+    '''
+    DESCRIPTION
+        This function returns the last switches
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A list of Switch, oldest first
+    '''
+    return list(_events)
+
+
+def get_report():
+    '''
+    DESCRIPTION
+        This function summarizes the watchdog for the profiler dump
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A json serializable dictionary
+    '''
+    return { "budget_ms":    budget * 1000,
+             "degraded":     degraded,
+             "switches":     switches,
+             "last_draw_ms": last_seconds * 1000,
+             "events":       [{ "time":     event.time,
+                                "degraded": event.degraded,
+                                "draw_ms":  event.seconds * 1000 } for event in _events] }
+
+
+def format_status():
+    '''
+    DESCRIPTION
+        This function describes the state of the watchdog in one line
+
+    ARGUMENTS
+        None
+
+    RETURN
+        A string
+    '''
+    if not budget:
+        return f"Draw budget off, last draw {last_seconds * 1000:.2f} ms"
+    return (f"{'Minimal' if degraded else 'Full'} draw, {switches} switches, "
+            f"last draw {last_seconds * 1000:.2f} of {budget * 1000:.2f} ms")
+
+
+def reset():
+    '''
+    DESCRIPTION
+        This function clears the switch counter and goes back to the full
+        draw
+
+    ARGUMENTS
+        None
+
+    RETURN
+        None
+    '''
+    global degraded, switches, _over, _under, _stable, _recover_draws
+
+    degraded = False
+    switches = 0
+    _over    = 0
+    _under   = 0
+    _stable  = 0
+    _recover_draws = RECOVER_DRAWS
+    _events.clear()
@@ -0,0 +1,91 @@
+################################################################################
+#
+#   conftest.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file sets up the unit tests of the Marking Menus Blender Add-on.
+#       The bpy stub is installed before any test module is collected, so
+#       the add-on modules import it instead of Blender's and the suite runs
+#       under plain Python:
+#
+#           python -m pytest tests
+#
+#       The modules are loaded with benchutils.load_source_module, which
+#       does not run the add-on's __init__.py.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  os
+import  sys
+
+import  pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench"))
+
+import  bpy_stub
+
+#   The add-on modules keep the bpy module they imported, so the stub is
+#   installed once for the whole session
+bpy_stub.install()
+
+from    benchutils import load_source_module
+
+schema = load_source_module("schema")
+
+
+###############################################################################
+#
+#   Fixtures
+#
+###############################################################################
+@pytest.fixture(scope = "session")
+def catalog_operators():
+    '''
+    DESCRIPTION
+        This fixture defines the stub operators of every catalog in the
+        schema, with argument types guessed from the catalog strings
+
+    ARGUMENTS
+        None
+
+    RETURN
+        The stub bpy module
+    '''
+    bpy_stub.define_operators(identifier for catalog in schema.CATALOGS.values()
+                              for identifier in catalog if "." in identifier)
+    return bpy_stub.bpy
+
+
+@pytest.fixture
+def bpy(catalog_operators):
+    '''
+    DESCRIPTION
+        This fixture returns the stub bpy module and forgets the operator
+        calls a test made
+
+    ARGUMENTS
+        catalog_operators   (in)    The catalog operators fixture
+
+    RETURN
+        The stub bpy module
+    '''
+    bpy_stub.calls.clear()
+    yield bpy_stub.bpy
+    bpy_stub.calls.clear()
@@ -0,0 +1,73 @@
+################################################################################
+#
+#   test_catalog.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the operator catalogs of the Marking Menus Blender
+#       Add-on.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import load_source_module
+
+catalog = load_source_module("catalog")
+
+
+@pytest.fixture
+def operators():
+    return catalog.OperatorCatalog("Test", [
+        ("object.delete", "Delete", "Delete selected objects"),
+        ("object.join", "Join", "Join selected objects", 'OBJECT_DATA'),
+        ("object.delete(use_global=True)", "Delete", "Delete globally"),
+    ])
+
+
+def test_lookups(operators):
+    assert len(operators) == 3
+    assert "object.join" in operators and "object.nope" not in operators
+    assert list(operators) == ["object.delete", "object.join", "object.delete(use_global=True)"]
+    assert operators.label("object.join") == "Join"
+    assert operators.description("object.delete") == "Delete selected objects"
+    assert operators.icon("object.join") == 'OBJECT_DATA'
+    assert operators.icon("object.delete") == 'NONE'
+
+
+def test_missing_defaults(operators):
+    assert operators.label("object.nope") is None
+    assert operators.label("object.nope", "Nope") == "Nope"
+    assert operators.icon("object.nope") == 'NONE'
+    assert operators.identifier("Nope", "x") == "x"
+
+
+def test_identifier_returns_first_label(operators):
+    assert operators.identifier("Delete") == "object.delete"
+    assert operators.identifier("Join") == "object.join"
+
+
+def test_enum_items(operators):
+    assert operators.enum_items[1] == ("object.join", "Join", "Join selected objects", 'OBJECT_DATA', 1)
+    assert [item[4] for item in operators.enum_items] == [0, 1, 2]
+
+
+def test_duplicate_identifier():
+    with pytest.raises(ValueError):
+        catalog.OperatorCatalog("Test", [("object.delete", "A", ""), ("object.delete", "B", "")])
@@ -0,0 +1,78 @@
+################################################################################
+#
+#   test_diagnostics.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the diagnostics log of the Marking Menus Blender Add-
+#       on: deduplicating and bounding the problems and printing each one
+#       once.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+
+import  pytest
+
+from    benchutils import load_source_module
+
+diagnostics = load_source_module("diagnostics")
+
+
+@pytest.fixture(autouse = True)
+def log():
+    diagnostics.clear()
+    yield
+    diagnostics.clear()
+
+
+def test_repeats_are_counted(capsys):
+    first = diagnostics.report("object", 2, "Operator 'x.y' not found")
+    again = diagnostics.report("object", 2, "Operator 'x.y' not found")
+    assert again is first and first.count == 2 and first.last >= first.first
+    assert capsys.readouterr().out.count("WARNING") == 1
+
+
+def test_most_recent_first():
+    diagnostics.report("object", 0, "a")
+    diagnostics.report("edit", None, "b")
+    diagnostics.report("object", 0, "a")
+    assert [entry.error for entry in diagnostics.get_entries()] == ["a", "b"]
+    assert diagnostics.describe(diagnostics.get_entries()[0]) == "object slot 1: a"
+    assert diagnostics.describe(diagnostics.get_entries()[1]) == "edit: b"
+
+
+def test_log_is_bounded(capsys):
+    for index in range(diagnostics.MAX_ENTRIES + 5):
+        diagnostics.report("object", 0, f"error {index}")
+    entries = diagnostics.get_entries()
+    assert len(entries) == diagnostics.MAX_ENTRIES
+    assert entries[-1].error == "error 5"
+
+    #   A dropped problem is printed again when it comes back
+    capsys.readouterr()
+    diagnostics.report("object", 0, "error 0")
+    assert "error 0" in capsys.readouterr().out
+
+
+def test_clear_prints_again(capsys):
+    diagnostics.report("object", 0, "a")
+    diagnostics.clear()
+    assert diagnostics.get_entries() == []
+    diagnostics.report("object", 0, "a")
+    assert capsys.readouterr().out.count("WARNING") == 2
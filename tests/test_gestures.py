@@ -0,0 +1,122 @@
+################################################################################
+#
+#   test_gestures.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the marking gestures of the Marking Menus Blender
+#       Add-on: the sector of a stroke, multi-segment strokes and the slot
+#       trie they are matched against.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import load_source_module
+
+gestures = load_source_module("gestures")
+plans    = load_source_module("plans")
+
+NORTH, EAST, SOUTH, WEST = 0, 2, 4, 6
+
+
+def line(start, end, steps = 10):
+    (x0, y0), (x1, y1) = start, end
+    return [(x0 + (x1 - x0) * i / steps, y0 + (y1 - y0) * i / steps) for i in range(1, steps + 1)]
+
+
+@pytest.mark.parametrize("dx, dy, sector", [
+    (0, 100, 0), (70, 70, 1), (100, 0, 2), (70, -70, 3),
+    (0, -100, 4), (-70, -70, 5), (-100, 0, 6), (-70, 70, 7),
+    (100, 30, 2), (100, 50, 1),
+])
+def test_classify(dx, dy, sector):
+    assert gestures.classify(dx, dy) == sector
+
+
+def test_classify_dead_zone():
+    assert gestures.classify(10, 10) is None
+    assert gestures.classify(10, 10, dead_zone = 5) == 1
+
+
+def test_segment_single_stroke():
+    assert gestures.segment_stroke([(0, 0)] + line((0, 0), (120, 0))) == [EAST]
+
+
+def test_segment_two_strokes():
+    points = [(0, 0)] + line((0, 0), (120, 0)) + line((120, 0), (120, 120))
+    assert gestures.segment_stroke(points) == [EAST, NORTH]
+
+
+def test_segment_ignores_short_wobble():
+    #   A short detour inside the dead zone is noise
+    points = [(0, 0)] + line((0, 0), (100, 0)) + line((100, 0), (100, 12), 1) + line((100, 12), (200, 12))
+    assert gestures.segment_stroke(points) == [EAST]
+
+
+def test_segment_dead_zone():
+    assert gestures.segment_stroke([(0, 0), (5, 5), (8, 3)]) == []
+    assert gestures.segment_stroke([(0, 0)]) == []
+
+
+def test_segment_wobbly_stroke_falls_back_to_chord():
+    #   Alternating steps never make a run as long as the dead zone
+    points = [(0, 0), (12, 0), (12, 12), (24, 12), (24, 24)]
+    assert gestures.segment_stroke(points) == [1]
+
+
+@pytest.fixture
+def trie():
+    rings = {
+        "object":       [None] * 8,
+        "object_extra": [None] * 8,
+        "edit_extra":   [None] * 8,
+    }
+    rings["object"][EAST]        = plans.PlanEntry("pie.call_ring", "Extra", (("ring", "object_extra"),), "object_extra")
+    rings["object"][WEST]        = plans.PlanEntry("object.delete", "Delete", ())
+    rings["object_extra"][NORTH] = plans.PlanEntry("object.join", "Join", ())
+    rings["object_extra"][SOUTH] = plans.PlanEntry("pie.call_ring", "Edit", (("ring", "edit_extra"),), "edit_extra")
+    rings["edit_extra"][EAST]    = plans.PlanEntry("mesh.delete", "Delete", ())
+    return gestures.build_trie("object", rings.__getitem__, max_depth = 2)
+
+
+def test_build_trie(trie):
+    assert set(trie) == {EAST, WEST}
+    assert set(trie[EAST].children) == {NORTH, SOUTH}
+
+    #   The depth limit stops at the second sub-menu
+    assert trie[EAST].children[SOUTH].children == {}
+
+
+def test_walk_trie(trie):
+    assert gestures.walk_trie(trie, [WEST]).entry.op_name == "object.delete"
+    assert gestures.walk_trie(trie, [EAST]).entry.submenu == "object_extra"
+    assert gestures.walk_trie(trie, [EAST, NORTH]).entry.op_name == "object.join"
+    assert gestures.walk_trie(trie, [NORTH]) is None
+    assert gestures.walk_trie(trie, [EAST, WEST]) is None
+
+    #   Segments after an operator slot are ignored
+    assert gestures.walk_trie(trie, [WEST, NORTH]).entry.op_name == "object.delete"
+
+
+def test_locate_slot(trie):
+    assert gestures.locate_slot("object", trie, [WEST]) == ("object", WEST)
+    assert gestures.locate_slot("object", trie, [EAST, NORTH]) == ("object_extra", NORTH)
+    assert gestures.locate_slot("object", trie, [WEST, NORTH]) == ("object", WEST)
+    assert gestures.locate_slot("object", trie, [SOUTH]) is None
@@ -0,0 +1,109 @@
+################################################################################
+#
+#   test_hotreload.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the schema reload of the Marking Menus Blender Add-
+#       on: loading a changed schema file on its own and comparing it with
+#       the schema in use.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import SOURCE_PACKAGE, load_source_module
+
+hotreload = load_source_module("hotreload")
+schema    = load_source_module("schema")
+
+with open(schema.__file__, "r", encoding = "utf-8") as file:
+    SOURCE = file.read()
+
+
+def load(tmp_path, *replacements):
+    #   Load a copy of schema.py with some of its text replaced
+    text = SOURCE
+    for old, new in replacements:
+        assert old in text, old
+        text = text.replace(old, new)
+
+    path = tmp_path / "schema.py"
+    path.write_text(text, encoding = "utf-8")
+    return hotreload.load_schema(str(path), SOURCE_PACKAGE)
+
+
+def diff(new_schema):
+    return hotreload.diff(hotreload.take_snapshot(schema), hotreload.take_snapshot(new_schema))
+
+
+def test_schema_in_use_is_consistent():
+    assert hotreload.check_schema(schema) == []
+
+
+def test_unchanged_schema(tmp_path):
+    new_schema = load(tmp_path)
+    assert new_schema is not schema
+    assert hotreload.is_empty(diff(new_schema))
+
+
+def test_changed_label(tmp_path):
+    schema_diff = diff(load(tmp_path, ('"Sculpt Mode",', '"Sculpting",')))
+    assert schema_diff.rings == {"sculpt"}
+    assert not schema_diff.catalogs and not schema_diff.bindings
+    assert not schema_diff.added_rings and not schema_diff.removed_rings
+
+
+def test_changed_catalog_changes_its_rings(tmp_path):
+    schema_diff = diff(load(tmp_path, ('"Delete selected objects"', '"Delete the selected objects"')))
+    assert schema_diff.catalogs == {"object"}
+    assert schema_diff.rings == {"object", "object2", "object_extra"}
+
+
+def test_added_ring(tmp_path):
+    schema_diff = diff(load(tmp_path, ('    Ring("edit_extra",',
+                                       '    Ring("sculpt_extra", "Sculpt Extra", "PIE_MT_sculpt_extra", "sculpt"),\n'
+                                       '    Ring("edit_extra",')))
+    assert schema_diff.rings == {"sculpt_extra"} and schema_diff.added_rings == {"sculpt_extra"}
+
+
+def test_removed_ring(tmp_path):
+    schema_diff = diff(load(tmp_path, ('    Ring("object_extra", "Object Extra",   "PIE_MT_customizable_selections_object_extra", "object"),\n', '')))
+    assert schema_diff.removed_rings == {"object_extra"}
+
+
+def test_changed_hotkey(tmp_path):
+    schema_diff = diff(load(tmp_path, ("'RIGHTMOUSE', (\"shift\", \"ctrl\")", "'RIGHTMOUSE', (\"alt\",)")))
+    assert schema_diff.bindings == {('OBJECT', 2)}
+    assert not schema_diff.rings
+
+
+def test_broken_file(tmp_path):
+    with pytest.raises(hotreload.ReloadError) as err:
+        load(tmp_path, ("SLOT_COUNT = 8", "SLOT_COUNT = ("))
+    assert err.value.problems[0].startswith("SyntaxError")
+
+
+def test_inconsistent_schema(tmp_path):
+    with pytest.raises(hotreload.ReloadError) as err:
+        load(tmp_path, ('"PIE_MT_customizable_selections_sculpt",   "sculpt")',
+                        '"PIE_MT_customizable_selections_sculpt",   "nope")'),
+                       ('"pose",     "Pose"),', '"nope",     "Pose"),'))
+    assert err.value.problems == ["Ring 'sculpt' uses the unknown catalog 'nope'",
+                                  "Binding POSE opens the unknown ring 'nope'"]
@@ -0,0 +1,226 @@
+################################################################################
+#
+#   test_keymaps.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the keymap bindings of the Marking Menus Blender Add-
+#       on and the index of keymap items the hotkey conflicts are looked up
+#       in.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import load_source_module
+
+keymaps = load_source_module("keymaps")
+schema  = load_source_module("schema")
+
+
+###############################################################################
+#
+#   Keyconfig Stand-ins
+#
+###############################################################################
+class KeyMapItem:
+    def __init__(self, idname, type, value = 'PRESS', any = False, shift = False, ctrl = False,
+                 alt = False, oskey = False, active = True):
+        self.idname = idname
+        self.type   = type
+        self.value  = value
+        self.any    = any
+        self.shift  = int(shift)
+        self.ctrl   = int(ctrl)
+        self.alt    = int(alt)
+        self.oskey  = int(oskey)
+        self.active = active
+
+
+class KeyMapItems(list):
+    def new(self, idname, type, value, **modifiers):
+        item = KeyMapItem(idname, type, value, **modifiers)
+        self.append(item)
+        return item
+
+    def remove(self, item):
+        if item not in self:
+            raise RuntimeError("KeyMapItem not found")
+        super().remove(item)
+
+
+class KeyMap:
+    def __init__(self, name, is_modal = False):
+        self.name          = name
+        self.is_modal      = is_modal
+        self.keymap_items  = KeyMapItems()
+
+
+class KeyMaps(dict):
+    def new(self, name):
+        return self.setdefault(name, KeyMap(name))
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+class KeyConfig:
+    def __init__(self, name):
+        self.name    = name
+        self.keymaps = KeyMaps()
+
+
+def binding(mode = 'OBJECT', variant = 1, keymap = "Object Mode", event = 'LEFTMOUSE', modifiers = ("shift", "ctrl")):
+    return keymaps.KeyBinding(mode, variant, keymap, schema.HOTKEYS[variant].idname, event, modifiers)
+
+
+@pytest.fixture(autouse = True)
+def clear_registry():
+    keymaps.unregister()
+    yield
+    keymaps.unregister()
+
+
+###############################################################################
+#
+#   Binding Tests
+#
+###############################################################################
+def test_default_bindings():
+    bindings = keymaps.get_default_bindings()
+    assert [(b.mode, b.variant) for b in bindings] == [(b.mode, b.variant) for b in schema.BINDINGS]
+    assert bindings[0] == binding()
+
+
+def test_register_and_unregister():
+    kc = KeyConfig("Addon")
+    keymaps.register(kc, [binding(), None, binding('EDIT_MESH', keymap = "Mesh")])
+
+    registered = keymaps.get_registered()
+    assert set(registered) == {('OBJECT', 1), ('EDIT_MESH', 1)}
+    km, kmi = registered['OBJECT', 1]
+    assert km.name == "Object Mode" and (kmi.type, kmi.shift, kmi.ctrl, kmi.alt) == ('LEFTMOUSE', 1, 1, 0)
+
+    keymaps.unregister()
+    assert keymaps.get_registered() == {}
+    assert all(not km.keymap_items for km in kc.keymaps)
+
+
+def test_add_replaces_the_binding_item():
+    kc = KeyConfig("Addon")
+    keymaps.add(kc, binding())
+    keymaps.add(kc, binding(event = 'Q', modifiers = ("alt",)))
+
+    items = kc.keymaps["Object Mode"].keymap_items
+    assert [(item.type, item.alt) for item in items] == [('Q', 1)]
+
+
+def test_remove_only_touches_its_own_item():
+    kc    = KeyConfig("Addon")
+    other = kc.keymaps.new("Object Mode").keymap_items.new("object.delete", 'X', 'PRESS')
+    keymaps.add(kc, binding())
+
+    assert keymaps.remove('OBJECT', 1)
+    assert list(kc.keymaps["Object Mode"].keymap_items) == [other]
+    assert not keymaps.remove('OBJECT', 1)
+
+
+def test_remove_after_blender_removed_the_item():
+    kc = KeyConfig("Addon")
+    keymaps.add(kc, binding())
+    kc.keymaps["Object Mode"].keymap_items.clear()
+    assert not keymaps.remove('OBJECT', 1)
+
+
+###############################################################################
+#
+#   Conflict Index Tests
+#
+###############################################################################
+@pytest.fixture
+def user_kc():
+    kc = KeyConfig("User")
+    object_mode = kc.keymaps.new("Object Mode")
+    object_mode.keymap_items.new("object.select_box", 'LEFTMOUSE', 'CLICK_DRAG', shift = True, ctrl = True)
+    object_mode.keymap_items.new("object.select", 'LEFTMOUSE', 'PRESS')
+    object_mode.keymap_items.new("object.hidden", 'LEFTMOUSE', 'PRESS', shift = True, ctrl = True, active = False)
+    kc.keymaps.new("Window").keymap_items.new("wm.anything", 'LEFTMOUSE', 'PRESS', any = True)
+    kc.keymaps.new("Mesh").keymap_items.new("mesh.loop_select", 'LEFTMOUSE', 'PRESS', shift = True, ctrl = True)
+    kc.keymaps["Modal"] = KeyMap("Modal", is_modal = True)
+    kc.keymaps["Modal"].keymap_items.new("modal.op", 'LEFTMOUSE', 'PRESS', shift = True, ctrl = True)
+    return kc
+
+
+def test_item_key():
+    assert keymaps.get_item_key(KeyMapItem("a", 'A', shift = True, alt = True)) == ('A', ("shift", "alt"))
+    assert keymaps.get_item_key(KeyMapItem("a", 'A', any = True)) == ('A', None)
+    assert keymaps.get_item_key(KeyMapItem("a", 'A', ctrl = -1)) == ('A', None)
+
+
+def test_find_conflicts(user_kc):
+    addon_kc = KeyConfig("Addon")
+    keymaps.add(addon_kc, binding())
+    assert keymaps.refresh_index([user_kc, addon_kc, None], force = True) == 4
+
+    #   Inactive items, other modes, modal keymaps and the add-on's own
+    #   items are no conflict, items that accept any modifier are
+    assert keymaps.find_conflicts(binding()) == [("Object Mode", "object.select_box"), ("Window", "wm.anything")]
+    assert keymaps.find_conflicts(binding(modifiers = ())) == [("Object Mode", "object.select"),
+                                                               ("Window", "wm.anything")]
+    assert keymaps.find_conflicts(binding(event = 'Q')) == []
+
+
+def test_refresh_is_throttled_and_incremental(user_kc):
+    assert keymaps.refresh_index([user_kc]) == 3
+    user_kc.keymaps["Mesh"].keymap_items.new("mesh.other", 'Q', 'PRESS')
+
+    #   Within the interval nothing is checked
+    assert keymaps.refresh_index([user_kc]) == 0
+    assert keymaps.find_conflicts(binding('EDIT_MESH', keymap = "Mesh", event = 'Q', modifiers = ())) == []
+
+    keymaps.invalidate_index()
+    assert keymaps.refresh_index([user_kc]) == 1
+    assert keymaps.find_conflicts(binding('EDIT_MESH', keymap = "Mesh", event = 'Q', modifiers = ())) == \
+        [("Mesh", "mesh.other")]
+
+
+def test_watched_keymaps_notice_changed_items(user_kc):
+    keymaps.refresh_index([user_kc], force = True)
+    user_kc.keymaps["Object Mode"].keymap_items[0].type = 'RIGHTMOUSE'
+    assert keymaps.refresh_index([user_kc], force = True) == 1
+    assert ("Object Mode", "object.select_box") not in keymaps.find_conflicts(binding())
+
+
+def test_removed_keyconfigs_are_forgotten(user_kc):
+    keymaps.refresh_index([user_kc], force = True)
+    assert keymaps.refresh_index([], force = True) == 3
+    assert keymaps.find_conflicts(binding()) == []
+    assert keymaps._index == {}
+
+
+def test_reloaded_hotkeys_are_indexed_again(user_kc, monkeypatch):
+    old = schema.HOTKEYS[1]
+    user_kc.keymaps["Object Mode"].keymap_items.new(old.idname, 'LEFTMOUSE', 'PRESS', shift = True, ctrl = True)
+    keymaps.refresh_index([user_kc], force = True)
+    assert ("Object Mode", old.idname) not in keymaps.find_conflicts(binding())
+
+    #   After a reload the old hotkey operator belongs to someone else
+    monkeypatch.setitem(schema.HOTKEYS, 1, old._replace(idname = "pie.renamed"))
+    keymaps.refresh_index([user_kc], force = True)
+    assert ("Object Mode", old.idname) in keymaps.find_conflicts(binding())
@@ -0,0 +1,147 @@
+################################################################################
+#
+#   test_opstring.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the operator string parser of the Marking Menus
+#       Blender Add-on: the typed values, the errors, the memo cache and the
+#       coercion to the operator property types.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import load_source_module
+
+opstring = load_source_module("opstring")
+
+EXPECTED = {
+    "object.delete":                                ("object.delete", ()),
+    "object.select_all(action='TOGGLE')":           ("object.select_all", (("action", "TOGGLE"),)),
+    "object.select_all(action=INVERT)":             ("object.select_all", (("action", "INVERT"),)),
+    "object.subdivision_set(level=2, relative=False)":
+                                                    ("object.subdivision_set", (("level", 2), ("relative", False))),
+    "object.rename(name='A,B')":                    ("object.rename", (("name", "A,B"),)),
+    "transform.translate(value=(0, 0, -1.5))":      ("transform.translate", (("value", (0, 0, -1.5)),)),
+    "transform.resize(value=[+1, 1.0, 0])":         ("transform.resize", (("value", (1, 1.0, 0)),)),
+    "mesh.select_mode(type={'VERT', 'EDGE'})":      ("mesh.select_mode", (("type", frozenset({"VERT", "EDGE"})),)),
+    "bpy.ops.wm.call_menu(name='VIEW3D_MT_object_apply')":
+                                                    ("wm.call_menu", (("name", "VIEW3D_MT_object_apply"),)),
+    "  object.shade_smooth()  ":                    ("object.shade_smooth", ()),
+}
+
+INVALID = [
+    "",
+    "Custom",
+    "object",
+    "object.delete(",
+    "object.delete(True)",
+    "object.delete(**args)",
+    "object.delete(use_global=print())",
+    "object.delete(use_global=True, use_global=False)",
+    "object.delete(use_global=-True)",
+    "object.select.all",
+]
+
+
+@pytest.mark.parametrize("op_string, expected", EXPECTED.items())
+def test_parse(op_string, expected):
+    assert opstring.parse_operator_string(op_string) == expected
+
+
+@pytest.mark.parametrize("op_string", INVALID)
+def test_parse_invalid(op_string):
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.parse_operator_string(op_string)
+
+
+def test_parse_types():
+    _, op_args = opstring.parse_operator_string("object.x(a=1, b=1.0, c=True, d='1')")
+    assert [type(value) for _, value in op_args] == [int, float, bool, str]
+
+
+def test_memo_cache():
+    opstring.parse_operator_string.cache_clear()
+    first = opstring.parse_operator_string("object.select_all(action='TOGGLE')")
+    assert opstring.parse_operator_string("object.select_all(action='TOGGLE')") is first
+    info = opstring.parse_operator_string.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 1, opstring.PARSE_CACHE_SIZE)
+
+
+def test_split_macro():
+    assert opstring.split_macro_string("object.delete; object.join(\n)\nobject.shade_smooth") == \
+        ("object.delete", "object.join(\n)", "object.shade_smooth")
+    assert opstring.split_macro_string("object.rename(name='a;b')") == ("object.rename(name='a;b')",)
+
+
+@pytest.mark.parametrize("macro_string", ["", "  ", "x = 1", "object.delete(", "import os"])
+def test_split_macro_invalid(macro_string):
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.split_macro_string(macro_string)
+
+
+@pytest.mark.parametrize("value, prop_type, expected", [
+    (True,   'BOOLEAN', True),
+    (1,      'BOOLEAN', True),
+    (2.0,    'INT',     2),
+    (2,      'FLOAT',   2.0),
+    ("a",    'STRING',  "a"),
+    ("MESH", 'ENUM',    "MESH"),
+])
+def test_coerce(value, prop_type, expected):
+    result = opstring.coerce_value("object.x", "arg", value, prop_type, enum_items = ("MESH",))
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("value, prop_type", [
+    (2,      'BOOLEAN'),
+    (True,   'INT'),
+    (2.5,    'INT'),
+    (True,   'FLOAT'),
+    (1,      'STRING'),
+    ("NOPE", 'ENUM'),
+    ("a",    'POINTER'),
+])
+def test_coerce_invalid(value, prop_type):
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.coerce_value("object.x", "arg", value, prop_type, enum_items = ("MESH",))
+
+
+def test_coerce_arrays():
+    assert opstring.coerce_value("object.x", "value", (0, 1, 2), 'FLOAT', array_length = 3) == (0.0, 1.0, 2.0)
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.coerce_value("object.x", "value", (0, 1), 'FLOAT', array_length = 3)
+
+
+def test_coerce_enum_flags():
+    items = ("VERT", "EDGE", "FACE")
+    assert opstring.coerce_value("mesh.x", "type", "VERT", 'ENUM', enum_items = items, is_enum_flag = True) == frozenset({"VERT"})
+    assert opstring.coerce_value("mesh.x", "type", frozenset({"EDGE"}), 'ENUM', enum_items = items, is_enum_flag = True) == frozenset({"EDGE"})
+
+    #   A tuple is turned into the set Blender expects
+    value = opstring.coerce_value("mesh.x", "type", ("VERT", "EDGE"), 'ENUM', enum_items = items, is_enum_flag = True)
+    assert value == frozenset({"VERT", "EDGE"}) and isinstance(value, frozenset)
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.coerce_value("mesh.x", "type", ("VERT", "EDGE"), 'ENUM', enum_items = items)
+
+    #   Dynamic enum items accept any identifier
+    assert opstring.coerce_value("mesh.x", "type", "ANY", 'ENUM') == "ANY"
+    with pytest.raises(opstring.OperatorStringError):
+        opstring.coerce_value("mesh.x", "type", frozenset({"NOPE"}), 'ENUM', enum_items = items, is_enum_flag = True)
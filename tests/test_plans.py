@@ -0,0 +1,164 @@
+################################################################################
+#
+#   test_plans.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the slot compilation and draw plan cache of the
+#       Marking Menus Blender Add-on, against the bpy stub operators.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  bpy_stub
+import  pytest
+
+from    benchutils import load_source_module
+
+opstring = load_source_module("opstring")
+plans    = load_source_module("plans")
+schema   = load_source_module("schema")
+utils    = load_source_module("utils")
+
+
+def compile_slot(item, custom_op, ring = "object"):
+    operators = schema.CATALOGS[schema.RINGS[ring].catalog]
+    return plans.compile_slot(item, custom_op, operators, utils.validate_operator_string, utils.validate_macro_string)
+
+
+@pytest.fixture(autouse = True)
+def clear_plans(bpy):
+    plans.invalidate()
+    yield
+    plans.invalidate()
+
+
+def test_default_slots():
+    for ring, defaults in schema.DEFAULTS.items():
+        operators = schema.CATALOGS[schema.RINGS[ring].catalog]
+        for item in defaults:
+            entry = compile_slot(item, "", ring)
+            assert entry is None or entry.label == operators.label(item), (ring, item, entry)
+
+
+def test_submenu():
+    assert compile_slot("Submenu", " edit_extra ") == plans.PlanEntry("pie.call_ring", "Edit Extra",
+                                                                     (("ring", "edit_extra"),), "edit_extra")
+
+
+def test_macro():
+    entry = compile_slot("Macro", "object.select_all(action='TOGGLE'); object.delete")
+    assert entry.op_name == "pie.run_macro" and entry.label == "Select All (+1)"
+
+
+def test_custom_operator():
+    entry = compile_slot("Custom", "object.subdivision_set(level=2)")
+    assert entry == plans.PlanEntry("object.subdivision_set", "Subdivision Set", (("level", 2),))
+
+
+def test_recent():
+    assert compile_slot("Recent", "") is plans.RECENT_ENTRY
+    entry = compile_slot("Recent", "edit")
+    assert entry.op_name is None and entry.op_args == (("ring", "edit"),)
+
+
+def test_empty_slots():
+    assert compile_slot("Custom", "  ") is None
+    assert compile_slot("Empty", "") is None
+
+
+@pytest.mark.parametrize("item, custom_op", [
+    ("Custom",  "object.select_all(action='NOPE')"),
+    ("Custom",  "object.select_all(nope=1)"),
+    ("Custom",  "object.not_an_operator"),
+    ("Submenu", "nope"),
+    ("Recent",  "nope"),
+    ("Macro",   "object.delete; object.not_an_operator"),
+])
+def test_invalid_slots(item, custom_op):
+    with pytest.raises(opstring.OperatorStringError):
+        compile_slot(item, custom_op)
+
+
+def test_plan_cache():
+    plan = plans.store_plan("object", [compile_slot("object.delete", ""), None])
+    assert plans.get_plan("object") is plan and isinstance(plan, tuple)
+    plans.store_trie("object", {})
+    plans.invalidate("edit")
+    assert plans.get_plan("object") is plan and plans.get_trie("object") is None
+
+    plans.invalidate("object")
+    assert plans.get_plan("object") is None
+
+
+def test_operator_usage():
+    delete = compile_slot("object.delete", "")
+    plans.store_plan("object", [delete, None, delete, plans.RECENT_ENTRY])
+    plans.store_plan("object2", [delete])
+    assert plans.get_operator_usage() == {"object.delete": 3}
+
+
+def test_find_entry():
+    delete = compile_slot("object.delete", "")
+    ring   = plans.compile_submenu("edit")
+    plan   = (None, delete, ring, plans.PlanEntry("object.delete", "Delete", (("confirm", False),)))
+    assert plans.find_entry(plan, "pie.call_ring", {"ring": "edit"}.get) == 2
+    assert plans.find_entry(plan, "object.delete", {"confirm": False}.get) == 3
+    assert plans.find_entry(plan, "object.select_all", {}.get) is None
+
+
+def test_enabling_an_add_on_validates_again(bpy):
+    utils.check_operator_catalog(bpy.context)
+    assert not utils.check_operator_catalog(bpy.context)
+    with pytest.raises(opstring.OperatorStringError):
+        compile_slot("Custom", "markingtest.run()")
+
+    #   The failure is remembered until the set of operators is checked
+    bpy_stub.define_operator("markingtest.run")
+    with pytest.raises(opstring.OperatorStringError):
+        compile_slot("Custom", "markingtest.run()")
+
+    assert utils.check_operator_catalog(bpy.context)
+    assert compile_slot("Custom", "markingtest.run()").op_name == "markingtest.run"
+
+
+def test_enum_flag_tuple_is_a_set(bpy):
+    bpy_stub.define_operator("markingtest.select_mode",
+                             type = bpy_stub.OperatorProperty("type", 'ENUM', ("VERT", "EDGE", "FACE"), is_enum_flag = True))
+    entry = compile_slot("Custom", "markingtest.select_mode(type=('VERT', 'EDGE'))")
+    assert entry.op_args == (("type", frozenset({"VERT", "EDGE"})),)
+
+
+def test_search_reads_the_cached_catalog_key(bpy, monkeypatch, tmp_path):
+    monkeypatch.setattr(bpy_stub, "_user_directory", str(tmp_path))
+    utils.clear_operator_items()
+    utils.check_operator_catalog(bpy.context)
+
+    calls = []
+    take_key = utils.get_operator_catalog_key
+    monkeypatch.setattr(utils, "get_operator_catalog_key", lambda context: calls.append(1) or take_key(context))
+
+    for text in ("d", "de", "del"):
+        assert utils.search_operators(None, bpy.context, text)
+    assert calls == []
+
+    #   A new operator module is seen once the catalog is checked again
+    bpy_stub.define_operator("markingsearch.delete_all")
+    assert utils.check_operator_catalog(bpy.context) and len(calls) == 1
+    assert "markingsearch.delete_all" in [identifier for identifier, _ in utils.search_operators(None, bpy.context, "delete all")]
+    utils.clear_operator_items()
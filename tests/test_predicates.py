@@ -0,0 +1,124 @@
+################################################################################
+#
+#   test_predicates.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the slot conditions of the Marking Menus Blender Add-
+#       on: the conditions, the cached slot states and the selection snapshot
+#       they are keyed on.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+
+from    types import SimpleNamespace
+
+import  pytest
+
+from    benchutils import load_source_module
+
+plans      = load_source_module("plans")
+predicates = load_source_module("predicates")
+utils      = load_source_module("utils")
+
+PlanEntry = plans.PlanEntry
+
+
+class Objects(list):
+    '''
+    DESCRIPTION
+        This class stands in for context.selected_objects and counts how
+        often the selection is counted
+    '''
+    counted = 0
+
+    def __len__(self):
+        Objects.counted += 1
+        return super().__len__()
+
+
+def make_context(active_type = 'MESH', selected = 1):
+    active = SimpleNamespace(type = active_type, as_pointer = lambda: 1) if active_type else None
+    return SimpleNamespace(mode = 'OBJECT', active_object = active, selected_objects = Objects([active] * selected))
+
+
+@pytest.fixture(autouse = True)
+def states():
+    predicates.invalidate()
+    utils.bump_selection_generation()
+    Objects.counted = 0
+    yield
+    predicates.invalidate()
+
+
+@pytest.mark.parametrize("condition, active_type, selected, expected", [
+    ("ALWAYS",   None,     0, True),
+    ("SELECTED", None,     0, False),
+    ("SELECTED", 'MESH',   1, True),
+    ("MULTIPLE", 'MESH',   1, False),
+    ("MULTIPLE", 'MESH',   2, True),
+    ("ACTIVE",   None,     0, False),
+    ("MESH",     'CURVE',  1, False),
+    ("MESH",     'MESH',   1, True),
+])
+def test_conditions(condition, active_type, selected, expected):
+    state = predicates.SelectionState('OBJECT', active_type, selected)
+    assert predicates.test(condition, state) is expected
+
+
+def test_slot_states_are_cached():
+    polls = []
+    def poll(op_name):
+        polls.append(op_name)
+        return op_name == "object.delete"
+
+    plan  = (PlanEntry("object.delete", "Delete", ()), PlanEntry("object.join", "Join", (), condition = "MULTIPLE"),
+             PlanEntry("object.shade_smooth", "Smooth", ()), None)
+    state = predicates.SelectionState('OBJECT', 'MESH', 1)
+    expected = (predicates.SLOT_ENABLED, predicates.SLOT_HIDDEN, predicates.SLOT_DISABLED, predicates.SLOT_HIDDEN)
+
+    assert predicates.get_slot_states("object", plan, 1, state, poll) == expected
+    assert predicates.get_slot_states("object", plan, 1, state, poll) == expected
+    assert len(polls) == 2
+
+    predicates.get_slot_states("object", plan, 2, state, poll)
+    predicates.invalidate()
+    predicates.get_slot_states("object", plan, 2, state, poll)
+    assert len(polls) == 6
+
+
+def test_selection_is_counted_once_per_generation():
+    context = make_context(selected = 2)
+    state, key = utils.get_selection_state(context)
+    assert state == predicates.SelectionState('OBJECT', 'MESH', 2)
+    assert utils.get_selection_state(context) == (state, key)
+    assert Objects.counted == 1
+
+    #   A new selection is only seen after the depsgraph handler ran
+    context.selected_objects = Objects([context.active_object])
+    assert utils.get_selection_state(context)[0].selected_count == 2
+    utils.bump_selection_generation()
+    state, new_key = utils.get_selection_state(context)
+    assert state.selected_count == 1 and new_key != key
+
+
+def test_selection_key_follows_the_active_object():
+    _, key = utils.get_selection_state(make_context('MESH'))
+    state, other = utils.get_selection_state(make_context(None, 0))
+    assert state == predicates.SelectionState('OBJECT', None, 0) and other != key
@@ -0,0 +1,89 @@
+################################################################################
+#
+#   test_profiler.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the profiler of the Marking Menus Blender Add-on: the
+#       histograms, the timed decorator and the keypress timings.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+
+import  pytest
+
+from    benchutils import load_source_module
+
+profiler = load_source_module("profiler")
+
+
+@pytest.fixture(autouse = True)
+def histograms():
+    profiler.set_enabled(True)
+    profiler.reset()
+    yield
+    profiler.set_enabled(False)
+    profiler.reset()
+
+
+def test_disabled_records_nothing():
+    profiler.set_enabled(False)
+
+    @profiler.timed("work")
+    def work(value):
+        return value * 2
+
+    assert work(2) == 4
+    profiler.mark_keypress()
+    profiler.draw_done()
+    profiler.operator_done()
+    assert profiler.get_report() == {}
+
+
+def test_timed_records_every_call():
+    @profiler.timed("work")
+    def work():
+        pass
+
+    for _ in range(5):
+        work()
+    summary = profiler.get_report()["work"]
+    assert summary["count"] == 5 and summary["p50"] <= summary["p95"]
+
+
+def test_keypress_spans():
+    profiler.mark_keypress()
+    profiler.draw_done()
+    profiler.draw_done()
+    assert profiler.get_report()["keypress_to_draw"]["count"] == 1
+    assert "keypress_to_operator" not in profiler.get_report()
+
+    #   The operator span stays open across the draws of sub-menus
+    profiler.operator_done()
+    profiler.operator_done()
+    assert profiler.get_report()["keypress_to_operator"]["count"] == 1
+    assert "keypress_to_operator" in profiler.format_report()
+
+
+def test_parse_cache_misses_are_timed():
+    opstring = load_source_module("opstring")
+    opstring.parse_operator_string.cache_clear()
+    for _ in range(3):
+        opstring.parse_operator_string("object.select_all(action='TOGGLE')")
+    assert profiler.get_report()["parse_operator_string_miss"]["count"] == 1
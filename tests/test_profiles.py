@@ -0,0 +1,181 @@
+################################################################################
+#
+#   test_profiles.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the slot profiles of the Marking Menus Blender Add-
+#       on: the file format, the validation of a whole profile and the
+#       profile files.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  json
+import  os
+
+import  pytest
+
+from    benchutils import load_source_module
+
+opstring = load_source_module("opstring")
+profiles = load_source_module("profiles")
+schema   = load_source_module("schema")
+
+SlotValue = profiles.SlotValue
+
+
+def validate_slot(ring, value):
+    #   Stands in for prefs.validate_profile_slot
+    if value.item == "Custom" and not value.custom_op.startswith("object."):
+        raise opstring.OperatorStringError(f"Operator '{value.custom_op}' not found")
+
+
+def slots(*values):
+    return tuple(values) + (profiles.EMPTY_SLOT,) * (schema.SLOT_COUNT - len(values))
+
+
+@pytest.fixture(autouse = True)
+def clear_cache():
+    profiles._cache.clear()
+    yield
+    profiles._cache.clear()
+
+
+def test_to_json_leaves_out_defaults():
+    data = profiles.to_json("Studio", {"object": [SlotValue("object.delete"),
+                                                  SlotValue("Custom", "object.join"),
+                                                  SlotValue("Custom", "object.join", "MULTIPLE")]})
+    assert data == {"version": profiles.PROFILE_VERSION, "name": "Studio",
+                    "rings": {"object": [["object.delete"], ["Custom", "object.join"],
+                                         ["Custom", "object.join", "MULTIPLE"]]}}
+
+
+def test_round_trip():
+    rings = {"object": slots(SlotValue("object.delete"), SlotValue("Custom", "object.join", "SELECTED")),
+             "edit":   slots(SlotValue("mesh.delete"))}
+    data = json.loads(json.dumps(profiles.to_json("Studio", rings)))
+    assert profiles.parse_profile(data, validate_slot) == rings
+
+
+def test_short_rings_are_filled_with_empty_slots():
+    rings = profiles.parse_profile({"rings": {"object": ["object.delete"]}}, validate_slot)
+    assert rings == {"object": slots(SlotValue("object.delete"))}
+
+
+def test_flat_properties():
+    enum_items = schema.CATALOGS["object"].enum_items
+    data = {"properties": {"object_pie_item_0": enum_items[5][0],
+                           "object_pie_item_1": "Custom",
+                           "object_custom_op_1": "object.join",
+                           "object_pie_item_2": 6}}
+    rings = profiles.parse_profile(data, validate_slot)
+    assert rings["object"][:3] == (SlotValue(enum_items[5][0]), SlotValue("Custom", "object.join"),
+                                   SlotValue(enum_items[6][0]))
+
+
+def test_every_problem_is_reported():
+    data = {"rings": {"object": [["nope"], ["Custom", "mesh.delete"], ["object.delete", "", "NOPE"], [1]],
+                      "zzz":    []},
+            "properties": {"bogus": 1, "yyy_pie_item_0": "x", "object_pie_item_9": "object.delete"}}
+    with pytest.raises(profiles.ProfileError) as err:
+        profiles.parse_profile(data, validate_slot)
+
+    problems = err.value.problems
+    assert "Unknown marking menu 'zzz'" in problems
+    assert "Unknown marking menu 'yyy'" in problems
+    assert "Unknown property 'bogus'" in problems
+    assert any(problem.startswith("object slot 1:") for problem in problems)
+    assert "object slot 2: Operator 'mesh.delete' not found" in problems
+    assert "object slot 3: Unknown condition 'NOPE'" in problems
+    assert any(problem.startswith("object slot 4:") for problem in problems)
+    assert any(problem.startswith("object slot 10:") for problem in problems)
+    assert len(problems) == len(set(problems))
+
+
+@pytest.mark.parametrize("data", [[], {"version": profiles.PROFILE_VERSION + 1}, {"rings": {}}, {"rings": []}])
+def test_invalid_profiles(data):
+    with pytest.raises(profiles.ProfileError):
+        profiles.parse_profile(data, validate_slot)
+
+
+def test_profile_files(tmp_path):
+    directory = str(tmp_path)
+    rings     = {"object": slots(SlotValue("object.delete"))}
+    path      = profiles.get_profile_path(directory, "Studio")
+
+    profiles.save_profile(path, "Studio", rings)
+    assert profiles.list_profiles(directory) == ["Studio"]
+    assert profiles.load_profile(path, validate_slot) == ("Studio", rings)
+    assert not os.path.exists(f"{path}.tmp")
+
+    assert profiles.delete_profile(path)
+    assert not profiles.delete_profile(path)
+    assert profiles.list_profiles(directory) == []
+    assert profiles.list_profiles(str(tmp_path / "missing")) == []
+
+
+def test_load_errors(tmp_path):
+    with pytest.raises(profiles.ProfileError):
+        profiles.load_profile(str(tmp_path / "missing.json"), validate_slot)
+
+    path = tmp_path / "broken.json"
+    path.write_text("{")
+    with pytest.raises(profiles.ProfileError):
+        profiles.load_profile(str(path), validate_slot)
+
+
+def test_load_validates_again_when_the_operators_change(tmp_path):
+    path = profiles.get_profile_path(str(tmp_path), "Studio")
+    profiles.save_profile(path, "Studio", {"object": slots(SlotValue("Custom", "object.join"))})
+    profiles.load_profile(path, validate_slot, ("object",))
+
+    def reject(ring, value):
+        raise opstring.OperatorStringError(f"Operator '{value.custom_op}' not found")
+
+    assert profiles.load_profile(path, reject, ("object",))[0] == "Studio"
+    with pytest.raises(profiles.ProfileError):
+        profiles.load_profile(path, reject, ())
+
+
+def test_load_uses_the_file_name_without_a_name(tmp_path):
+    path = tmp_path / "Layout.json"
+    path.write_text(json.dumps({"rings": {"object": ["object.delete"]}}))
+    name, _ = profiles.load_profile(str(path), validate_slot)
+    assert name == "Layout"
+
+
+def test_saved_slots_are_validated_on_load(tmp_path):
+    #   The preferences can hold a custom operator that does not compile
+    path  = profiles.get_profile_path(str(tmp_path), "Broken")
+    rings = {"object": slots(SlotValue("Custom", "mesh.delete"))}
+    profiles.save_profile(path, "Broken", rings)
+
+    with pytest.raises(profiles.ProfileError):
+        profiles.load_profile(path, validate_slot)
+
+
+def test_listed_names_match_the_sanitized_name(tmp_path):
+    directory = str(tmp_path)
+    for name in ("A/B: Layout", "  ", "Studio"):
+        profiles.save_profile(profiles.get_profile_path(directory, name), name,
+                              {"object": slots(SlotValue("object.delete"))})
+
+    assert profiles.list_profiles(directory) == ["A_B_ Layout", "Profile", "Studio"]
+    assert [profiles.get_profile_stem(name) for name in ("A/B: Layout", "  ", "Studio")] == \
+        profiles.list_profiles(directory)
@@ -0,0 +1,246 @@
+################################################################################
+#
+#   test_recent.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the Recent slots of the Marking Menus Blender Add-on:
+#       the recency and frequency ranking, filling the Recent slots of a draw
+#       plan and the Recent file.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  json
+import  random
+
+import  pytest
+
+from    types import SimpleNamespace
+
+from    benchutils import load_source_module
+
+plans  = load_source_module("plans")
+recent = load_source_module("recent")
+
+PlanEntry = plans.PlanEntry
+
+
+def entry(name, **op_args):
+    return PlanEntry(f"object.{name}", name.title(), tuple(op_args.items()))
+
+
+@pytest.fixture(autouse = True)
+def rankings():
+    recent.set_enabled(True)
+    recent.set_order("RECENT")
+    recent.clear()
+    yield
+    recent.clear()
+    recent.set_enabled(False)
+    recent.mark_saved()
+
+
+###############################################################################
+#
+#   Ranking Tests
+#
+###############################################################################
+def test_ranking_orders():
+    ranking = recent.UsageRanking()
+    for name in "abacab":
+        ranking.add(name, name)
+
+    assert list(ranking.most_recent()) == ["b", "a", "c"]
+    assert list(ranking.most_frequent()) == ["a", "b", "c"]
+    assert [ranking.get_count(name) for name in "abcd"] == [3, 2, 1, 0]
+
+
+def test_ranking_ties_are_in_recent_order():
+    ranking = recent.UsageRanking()
+    for name in "abc":
+        ranking.add(name, name)
+    assert list(ranking.most_frequent()) == ["c", "b", "a"]
+
+
+def test_ranking_forgets_the_least_recent():
+    ranking = recent.UsageRanking(capacity = 2)
+    for name in "aab":
+        ranking.add(name, name)
+    ranking.add("c", "c")
+
+    assert len(ranking) == 2 and ranking.get_count("a") == 0
+    assert list(ranking.most_frequent()) == ["c", "b"]
+
+
+def test_ranking_items_round_trip():
+    ranking = recent.UsageRanking()
+    for name in "abacab":
+        ranking.add(name, name)
+
+    copy = recent.UsageRanking()
+    for key, value, count in ranking.items():
+        copy.add(key, value, count)
+    assert list(copy.most_recent()) == list(ranking.most_recent())
+    assert list(copy.most_frequent()) == list(ranking.most_frequent())
+
+
+def test_ranking_matches_brute_force():
+    rng     = random.Random(7)
+    ranking = recent.UsageRanking(capacity = 6)
+    history = []
+    counts  = {}
+
+    for _ in range(2000):
+        key = rng.randrange(10)
+        if key not in counts and len(counts) >= 6:
+            oldest = next(k for k in history if k in counts)
+            del counts[oldest]
+        counts[key] = counts.get(key, 0) + 1
+        history = [k for k in history if k != key] + [key]
+        ranking.add(key, key)
+
+        order = [k for k in reversed(history) if k in counts]
+        assert list(ranking.most_recent()) == order
+        assert list(ranking.most_frequent()) == sorted(order, key = lambda k: -counts[k])
+
+
+###############################################################################
+#
+#   Recording and Draw Plan Tests
+#
+###############################################################################
+def test_record_skips_what_is_not_an_operator():
+    recent.record("object", None)
+    recent.record("object", plans.RECENT_ENTRY)
+    recent.record("object", PlanEntry("pie.call_ring", "Extra", (("ring", "edit"),), "edit"))
+    recent.set_enabled(False)
+    recent.record("object", entry("delete"))
+    assert recent.get_rankings() == {}
+
+
+def test_record_drops_the_condition():
+    recent.record("object", entry("join")._replace(condition = "MULTIPLE"))
+    assert [e.condition for e in recent.get_entries("object")] == ["ALWAYS"]
+    assert recent.is_dirty()
+
+
+def test_resolve_fills_recent_slots():
+    delete, join, smooth = entry("delete"), entry("join"), entry("shade_smooth")
+    for item in (delete, join, smooth, join):
+        recent.record("object", item)
+
+    plan = (plans.RECENT_ENTRY, delete, plans.RECENT_ENTRY._replace(condition = "SELECTED"), None)
+    resolved = recent.resolve("object", plan)
+
+    #   Fixed slots are not repeated, the condition of the Recent slot stays
+    assert resolved == (join, delete, smooth._replace(condition = "SELECTED"), None)
+    assert recent.resolve("object", plan) is resolved
+
+    recent.set_order("FREQUENT")
+    assert recent.resolve("object", plan)[0] == join
+
+
+def test_resolve_other_ring():
+    recent.record("edit", entry("subdivide"))
+    plan = (plans.compile_recent("edit"), plans.RECENT_ENTRY)
+    assert recent.resolve("object", plan) == (entry("subdivide"), None)
+
+
+def test_resolve_without_recent_slots():
+    plan = (entry("delete"), None)
+    assert recent.resolve("object", plan) is plan
+
+
+def test_resolve_keeps_the_cached_plan_without_refresh():
+    plan  = (plans.RECENT_ENTRY,)
+    first = recent.resolve("object", plan)
+    recent.record("object", entry("delete"))
+    assert recent.resolve("object", plan, refresh = False) is first
+    assert recent.resolve("object", plan) == (entry("delete"),)
+
+
+def test_changes_invalidate_slot_tries():
+    recent.resolve("object", (plans.RECENT_ENTRY,))
+    plans.store_trie("object", {})
+    recent.record("object", entry("delete"))
+    assert plans.get_trie("object") is None
+
+
+###############################################################################
+#
+#   File Tests
+#
+###############################################################################
+def test_json_round_trip():
+    select_mode = PlanEntry("mesh.select_mode", "Select Mode", (("type", frozenset({"VERT", "EDGE"})),
+                                                                 ("value", (1, (2.0, -3))),
+                                                                 ("use_extend", True)))
+    for item in (entry("delete"), select_mode, entry("delete")):
+        recent.record("edit", item)
+
+    data = json.loads(json.dumps(recent.to_json()))
+    recent.clear()
+    assert recent.from_json(data) == 2
+    assert list(recent.get_entries("edit")) == [entry("delete"), select_mode]
+    assert recent.get_rankings()["edit"].get_count(recent.get_key(entry("delete"))) == 2
+    assert not recent.is_dirty()
+
+
+def test_version_1_lists_are_tuples():
+    data = {"version": 1, "rings": {"object": [["transform.translate", "Move", [["value", [0, 0, 1]]], 3]]}}
+    assert recent.from_json(data) == 1
+    assert next(recent.get_entries("object")).op_args == (("value", (0, 0, 1)),)
+
+
+def test_unreadable_entries_are_skipped():
+    data = {"rings": {"object": [["object.delete", "Delete", [], 1],
+                                 ["object.join"],
+                                 ["object.join", "Join", [["type", {"nope": 1}]], 1],
+                                 ["object.join", "Join", [], "x"]],
+                      "edit":   "nope"}}
+    assert recent.from_json(data) == 1
+    assert recent.from_json("nope") == 0
+
+
+def test_operators_that_do_not_validate_are_skipped(catalog_operators):
+    utils = load_source_module("utils")
+    data  = {"rings": {"object": [["object.delete", "Delete", [], 1],
+                                  ["object.nope", "Nope", [], 1],
+                                  ["object.delete", "Delete", [["bogus", 1]], 1]]}}
+    assert recent.from_json(data, utils.validate_operator_args) == 1
+    assert list(recent.get_entries("object")) == [PlanEntry("object.delete", "Delete", ())]
+
+
+###############################################################################
+#
+#   Recording Switch Tests
+#
+###############################################################################
+def test_recent_sources_follow_the_slots(catalog_operators):
+    prefs = load_source_module("prefs")
+    slots = {ring: [SimpleNamespace(item = "Empty", custom_op = "") for _ in range(8)] for ring in prefs.RING_PROPERTIES}
+    preferences = SimpleNamespace(**{name: SimpleNamespace(slots = slots[ring]) for ring, name in prefs.RING_PROPERTIES.items()})
+    assert prefs.get_recent_sources(preferences) == frozenset()
+
+    #   The slots are only read again once the draw plans are thrown away
+    slots["object"][0].item = "Recent"
+    slots["object"][1].item, slots["object"][1].custom_op = "Recent", " edit "
+    assert prefs.get_recent_sources(preferences) == frozenset()
+    plans.invalidate("object")
+    assert prefs.get_recent_sources(preferences) == {"object", "edit"}
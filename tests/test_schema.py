@@ -0,0 +1,63 @@
+################################################################################
+#
+#   test_schema.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests that the rings, bindings, catalogs and default slots
+#       of the schema are consistent.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+from    benchutils import load_source_module
+
+schema = load_source_module("schema")
+
+
+def test_pie_positions():
+    assert sorted(schema.PIE_POSITIONS) == list(range(schema.SLOT_COUNT))
+
+
+def test_rings_use_known_catalogs():
+    for ring in schema.RINGS.values():
+        assert ring.catalog in schema.CATALOGS, ring
+
+
+def test_bindings():
+    for binding in schema.BINDINGS:
+        assert binding.ring in schema.RINGS, binding
+        assert binding.variant in schema.HOTKEYS, binding
+        assert schema.get_ring(binding.mode, binding.variant) == binding.ring
+    assert schema.get_ring('OBJECT', 2) == "object2"
+    assert schema.get_ring('SCULPT', 2) is None
+
+
+def test_catalogs_end_with_slot_items():
+    identifiers = [item[0] for item in schema.SLOT_ITEMS]
+    for operators in schema.CATALOGS.values():
+        assert list(operators)[-len(identifiers):] == identifiers, operators.name
+
+
+def test_defaults_are_in_their_catalog():
+    for ring, defaults in schema.DEFAULTS.items():
+        assert ring in schema.RINGS
+        assert len(defaults) <= schema.SLOT_COUNT
+        operators = schema.CATALOGS[schema.RINGS[ring].catalog]
+        for item in defaults:
+            assert item in operators, (ring, item)
@@ -0,0 +1,94 @@
+################################################################################
+#
+#   test_search.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the ranked operator search index of the Marking Menus
+#       Blender Add-on.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  pytest
+
+from    benchutils import load_source_module
+
+search = load_source_module("search")
+
+ITEMS = [
+    ("object.delete",           "Delete",           "Delete selected objects"),
+    ("object.duplicate_move",   "Duplicate Objects", "Duplicate selected objects and move them"),
+    ("mesh.delete_loose",       "Delete Loose",     "Delete loose vertices, edges or faces"),
+    ("object.shade_smooth",     "Shade Smooth",     "Render and display faces smooth"),
+    ("mesh.subdivide",          "Subdivide",        "Subdivide selected edges"),
+]
+
+
+@pytest.fixture(scope = "module")
+def index():
+    return search.SearchIndex(ITEMS)
+
+
+def identifiers(results):
+    return [item[0] for item in results]
+
+
+def test_tokenize():
+    assert search.tokenize("object.Shade_Smooth(angle=0.5)") == ["object", "shade", "smooth", "angle", "0", "5"]
+    assert search.trigrams("abcd") == {"abc", "bcd"}
+    assert search.trigrams("ab") == set()
+
+
+def test_prefix_matches_first(index):
+    assert identifiers(index.search("del")) == ["object.delete", "mesh.delete_loose"]
+    assert identifiers(index.search("del loo"))[0] == "mesh.delete_loose"
+
+
+def test_substring_after_prefix(index):
+    assert identifiers(index.search("mooth")) == ["object.shade_smooth"]
+
+
+def test_description_matches(index):
+    assert identifiers(index.search("vertices")) == ["mesh.delete_loose"]
+
+
+def test_fuzzy_matches(index):
+    assert "mesh.subdivide" in identifiers(index.search("subdivde"))
+
+
+def test_usage_ranks_first(index):
+    usage = {"mesh.delete_loose": 5}
+    assert identifiers(index.search("del", usage = usage)) == ["mesh.delete_loose", "object.delete"]
+
+
+def test_empty_query(index):
+    assert identifiers(index.search("", limit = 2)) == ["object.delete", "mesh.subdivide"]
+    assert identifiers(index.search("", limit = 2, usage = {"object.shade_smooth": 1}))[0] == "object.shade_smooth"
+
+
+def test_limit(index):
+    assert len(index.search("e", limit = 2)) == 2
+
+
+def test_build_in_steps():
+    index = search.SearchIndex(ITEMS, build = False)
+    assert not index.is_built
+    steps = sum(1 for _ in index.build(chunk = 2))
+    assert index.is_built and steps > 3
+    assert identifiers(index.search("subd")) == ["mesh.subdivide"]
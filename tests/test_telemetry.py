@@ -0,0 +1,153 @@
+################################################################################
+#
+#   test_telemetry.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the slot usage counters of the Marking Menus Blender
+#       Add-on and their file.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+import  json
+
+import  pytest
+
+from    benchutils import load_source_module
+
+telemetry = load_source_module("telemetry")
+
+
+@pytest.fixture(autouse = True)
+def counters():
+    telemetry.set_enabled(True)
+    yield
+    telemetry.set_enabled(False)
+    telemetry._stats.clear()
+    telemetry._pending.clear()
+    telemetry._lines.clear()
+    telemetry._loaded = None
+
+
+def test_disabled_records_nothing():
+    telemetry.set_enabled(False)
+    telemetry.select("object", 2)
+    assert telemetry.get_rings() == set()
+
+
+def test_select_and_cancel():
+    telemetry.select("object", 2)
+    telemetry.start()
+    telemetry.select("object", 2)
+    telemetry.cancel("object")
+    telemetry.cancel("edit", 4)
+
+    stats = telemetry.get_stats("object")
+    assert stats[2].invocations == 2 and stats[2].timed == 1
+    assert stats[2].mean_select_time() is not None
+    assert stats[None].cancellations == 1
+    assert telemetry.get_stats("edit")[4].cancellations == 1
+    assert telemetry.get_rings() == {"object", "edit"}
+
+
+def test_select_after_the_fact_is_not_timed():
+    telemetry.start()
+    telemetry.select("object", 2, timed = False)
+    assert telemetry.get_stats("object")[2].timed == 0
+
+
+def test_suggest_moves_only_used_slots():
+    positions = (6, 2, 4, 0, 7, 1, 5, 3)
+    for slot in (3, 3, 3, 2, 2):
+        telemetry.select("object", slot)
+    assert telemetry.suggest("object", positions, min_samples = 6) is None
+
+    #   The used slots take the two fastest positions, the unused slot 6
+    #   takes the place of slot 3 and every other slot stays
+    assert telemetry.suggest("object", positions, min_samples = 5) == [0, 1, 2, 6, 4, 5, 3, 7]
+
+
+def test_suggest_ties_keep_their_order():
+    positions = (6, 2, 4, 0, 7, 1, 5, 3)
+    for slot in (0, 4, 0, 4):
+        telemetry.select("object", slot)
+    assert telemetry.suggest("object", positions, min_samples = 1) == [2, 1, 0, 3, 6, 5, 4, 7]
+
+
+def test_suggest_nothing_to_move():
+    positions = (6, 2, 4, 0, 7, 1, 5, 3)
+    for slot in (6, 6, 2):
+        telemetry.select("object", slot)
+    assert telemetry.suggest("object", positions, min_samples = 1) is None
+
+
+def test_move():
+    telemetry.select("object", 2)
+    telemetry.move("object", [1, 0, 5, 3, 4, 2, 6, 7])
+    assert set(telemetry.get_stats("object")) == {5}
+
+
+def test_flush_and_load(tmp_path):
+    path = str(tmp_path / telemetry.TELEMETRY_FILE)
+    for slot in (1, 1, 3):
+        telemetry.select("object", slot)
+    telemetry.cancel("object")
+    assert telemetry.flush(path) == 1
+    assert telemetry.flush(path) == 0
+
+    telemetry.move("object", [0, 3, 2, 1, 4, 5, 6, 7])
+    telemetry.select("object", 0)
+    assert telemetry.flush(path) == 2
+
+    telemetry._stats.clear()
+    assert telemetry.load(path) == 3
+    stats = telemetry.get_stats("object")
+    assert {slot: s.invocations for slot, s in stats.items()} == {3: 2, 1: 1, 0: 1, None: 0}
+
+    #   A file is only loaded once
+    assert telemetry.load(path) == 0
+
+
+def test_failed_flush_keeps_the_lines(tmp_path):
+    path = str(tmp_path / "missing" / telemetry.TELEMETRY_FILE)
+    telemetry.select("object", 1)
+    assert telemetry.flush(path) == 0
+
+    path = str(tmp_path / telemetry.TELEMETRY_FILE)
+    assert telemetry.flush(path) == 1
+    assert telemetry.flush(path) == 0
+
+
+def test_reset_is_written(tmp_path):
+    path = str(tmp_path / telemetry.TELEMETRY_FILE)
+    telemetry.select("object", 1)
+    telemetry.flush(path)
+    telemetry.reset()
+    telemetry.flush(path)
+
+    telemetry._stats.clear()
+    telemetry.load(path)
+    assert telemetry.get_rings() == set()
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    path = tmp_path / telemetry.TELEMETRY_FILE
+    path.write_text("not json\n" + json.dumps({"counts": {"object": {"2": [4, 0, 0.0, 0]}}}) + "\n")
+    assert telemetry.load(str(path)) == 2
+    assert telemetry.get_stats("object")[2].invocations == 4
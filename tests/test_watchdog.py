@@ -0,0 +1,152 @@
+################################################################################
+#
+#   test_watchdog.py
+#
+################################################################################
+#
+#   DESCRIPTION
+#       This file tests the draw budget watchdog of the Marking Menus Blender
+#       Add-on: switching to the minimal draw and back, the recovery backoff
+#       and the reports.
+#
+#   AUTHOR
+#       Jayme Wilkinson
+#
+#   CREATED
+#       Oct 17, 2026
+#
+################################################################################
+#
+#   Copyright (C) 2026 Linkage Design
+#
+#   The software and information contained herein are proprietary to, and
+#   comprise valuable trade secrets of Linkage Design, which intends to
+#   preserve as trade secrets such software and information. This software
+#   and information or any other copies thereof may not be provided or
+#   otherwise made available to any other person or organization.
+#
+################################################################################
+
+import  json
+
+import  pytest
+
+from    benchutils import load_source_module
+
+watchdog = load_source_module("watchdog")
+
+BUDGET = 0.004
+SLOW   = 0.010
+FAST   = 0.001
+
+
+@pytest.fixture(autouse = True)
+def budget():
+    watchdog.reset()
+    watchdog.set_budget(BUDGET)
+    yield
+    watchdog.set_budget(0)
+    watchdog.reset()
+
+
+def draw(seconds, count):
+    return [watchdog.record(seconds) for _ in range(count)]
+
+
+def degrade():
+    draw(SLOW, watchdog.OVER_BUDGET_DRAWS)
+    assert watchdog.degraded
+
+
+def recover():
+    count = 0
+    while watchdog.degraded:
+        watchdog.record(FAST)
+        count += 1
+    return count
+
+
+###############################################################################
+#
+#   Switching Tests
+#
+###############################################################################
+def test_off_never_switches():
+    watchdog.set_budget(0)
+    assert draw(SLOW, 10) == [False] * 10
+    assert not watchdog.degraded and watchdog.last_seconds == SLOW
+
+
+def test_switches_after_draws_in_a_row_over_budget():
+    draw(SLOW, watchdog.OVER_BUDGET_DRAWS - 1)
+    draw(BUDGET, 1)
+    draw(SLOW, watchdog.OVER_BUDGET_DRAWS - 1)
+    assert not watchdog.degraded
+
+    assert draw(SLOW, 1) == [True]
+    assert watchdog.degraded and watchdog.switches == 1
+    assert watchdog.get_events()[-1].degraded and watchdog.get_events()[-1].seconds == SLOW
+
+
+def test_recovers_after_draws_in_a_row_with_headroom():
+    degrade()
+    draw(FAST, watchdog.RECOVER_DRAWS - 1)
+    draw(BUDGET * watchdog.HEADROOM, 1)
+    draw(FAST, watchdog.RECOVER_DRAWS - 1)
+    assert watchdog.degraded
+
+    assert draw(FAST, 1) == [True]
+    assert not watchdog.degraded and watchdog.switches == 2
+
+
+def test_failed_try_doubles_the_wait():
+    waits = []
+    for _ in range(9):
+        degrade()
+        waits.append(recover())
+    assert waits == [10, 20, 40, 80, 160, 320, 640, 640, 640]
+
+
+def test_stable_draws_reset_the_wait():
+    degrade()
+    recover()
+    degrade()
+    assert recover() == 2 * watchdog.RECOVER_DRAWS
+
+    draw(BUDGET, watchdog.STABLE_DRAWS)
+    degrade()
+    assert recover() == watchdog.RECOVER_DRAWS
+
+
+def test_turning_off_switches_back():
+    degrade()
+    watchdog.set_budget(0)
+    assert not watchdog.degraded and watchdog.switches == 2
+
+
+def test_events_are_capped():
+    for _ in range(watchdog.MAX_EVENTS):
+        degrade()
+        watchdog.set_budget(BUDGET)
+        recover()
+    assert len(watchdog.get_events()) == watchdog.MAX_EVENTS
+    assert watchdog.switches == 2 * watchdog.MAX_EVENTS
+
+
+###############################################################################
+#
+#   Report Tests
+#
+###############################################################################
+def test_report_and_status():
+    degrade()
+    report = json.loads(json.dumps(watchdog.get_report()))
+    assert report["degraded"] and report["switches"] == 1
+    assert report["budget_ms"] == pytest.approx(BUDGET * 1000)
+    assert report["events"][0]["draw_ms"] == pytest.approx(SLOW * 1000)
+    assert watchdog.format_status() == "Minimal draw, 1 switches, last draw 10.00 of 4.00 ms"
+
+    watchdog.reset()
+    assert watchdog.switches == 0 and watchdog.get_events() == []
+    watchdog.set_budget(0)
+    assert watchdog.format_status() == "Draw budget off, last draw 10.00 ms"